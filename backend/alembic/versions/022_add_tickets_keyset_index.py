@@ -0,0 +1,27 @@
+"""Add composite (created_at, id) index for keyset pagination of tickets
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches ORDER BY created_at DESC, id DESC used by list_tickets, so both
+    # offset pages and cursor seeks read the index in order without sorting.
+    op.create_index(
+        'ix_tickets_created_at_id',
+        'tickets',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_created_at_id', table_name='tickets')
@@ -0,0 +1,59 @@
+"""Add pg_trgm and pattern indexes for ticket search
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Trigram GIN indexes serve ILIKE '%term%' for terms of 3+ characters
+    op.create_index(
+        'ix_tickets_ticket_number_trgm', 'tickets', ['ticket_number'],
+        postgresql_using='gin', postgresql_ops={'ticket_number': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_tickets_title_trgm', 'tickets', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_stations_station_number_trgm', 'stations', ['station_number'],
+        postgresql_using='gin', postgresql_ops={'station_number': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_stations_station_id_trgm', 'stations', ['station_id'],
+        postgresql_using='gin', postgresql_ops={'station_id': 'gin_trgm_ops'},
+    )
+
+    # B-tree pattern indexes serve the prefix fallback for 1-2 character terms
+    op.create_index(
+        'ix_tickets_ticket_number_pattern', 'tickets', ['ticket_number'],
+        postgresql_ops={'ticket_number': 'varchar_pattern_ops'},
+    )
+    op.create_index(
+        'ix_stations_station_number_pattern', 'stations', ['station_number'],
+        postgresql_ops={'station_number': 'varchar_pattern_ops'},
+    )
+    op.execute(
+        "CREATE INDEX ix_stations_station_id_lower_pattern "
+        "ON stations (lower(station_id) varchar_pattern_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stations_station_id_lower_pattern', table_name='stations')
+    op.drop_index('ix_stations_station_number_pattern', table_name='stations')
+    op.drop_index('ix_tickets_ticket_number_pattern', table_name='tickets')
+    op.drop_index('ix_stations_station_id_trgm', table_name='stations')
+    op.drop_index('ix_stations_station_number_trgm', table_name='stations')
+    op.drop_index('ix_tickets_title_trgm', table_name='tickets')
+    op.drop_index('ix_tickets_ticket_number_trgm', table_name='tickets')
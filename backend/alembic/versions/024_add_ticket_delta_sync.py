@@ -0,0 +1,36 @@
+"""Add ticket tombstones and (updated_at, id) index for delta sync
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # GET /tickets/changes seeks on (updated_at, id) > watermark
+    op.create_index('ix_tickets_updated_at_id', 'tickets', ['updated_at', 'id'])
+
+    op.create_table(
+        'ticket_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ticket_id', sa.Integer(), nullable=False),
+        sa.Column('ticket_number', sa.String(20), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ticket_tombstones_id', 'ticket_tombstones', ['id'])
+    op.create_index('ix_ticket_tombstones_deleted_at_id', 'ticket_tombstones', ['deleted_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ticket_tombstones_deleted_at_id', table_name='ticket_tombstones')
+    op.drop_index('ix_ticket_tombstones_id', table_name='ticket_tombstones')
+    op.drop_table('ticket_tombstones')
+    op.drop_index('ix_tickets_updated_at_id', table_name='tickets')
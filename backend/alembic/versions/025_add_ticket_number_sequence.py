@@ -0,0 +1,33 @@
+"""Add ticket_number_seq for allocating ticket numbers
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE IF NOT EXISTS ticket_number_seq")
+    # Continue after the highest short number from migration 021; legacy
+    # non-numeric numbers are ignored.
+    op.execute("""
+        SELECT setval(
+            'ticket_number_seq',
+            COALESCE(
+                (SELECT MAX(ticket_number::bigint) FROM tickets WHERE ticket_number ~ '^[0-9]+$'),
+                0
+            ) + 1,
+            false
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE IF EXISTS ticket_number_seq")
@@ -0,0 +1,36 @@
+"""Add denormalized comments_count and attachments_count to tickets
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tickets', sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tickets', sa.Column('attachments_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        UPDATE tickets t
+        SET comments_count = c.cnt
+        FROM (SELECT ticket_id, COUNT(*) AS cnt FROM ticket_comments GROUP BY ticket_id) c
+        WHERE c.ticket_id = t.id
+    """)
+    op.execute("""
+        UPDATE tickets t
+        SET attachments_count = a.cnt
+        FROM (SELECT ticket_id, COUNT(*) AS cnt FROM ticket_attachments GROUP BY ticket_id) a
+        WHERE a.ticket_id = t.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('tickets', 'attachments_count')
+    op.drop_column('tickets', 'comments_count')
@@ -0,0 +1,36 @@
+"""Add (ticket_id, time, id) indexes for the ticket timeline
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+
+# table, old ticket_id index, new composite index, time column
+TIMELINE_INDEXES = [
+    ('ticket_comments', 'ix_ticket_comments_ticket_id', 'ix_ticket_comments_ticket_id_created_at', 'created_at'),
+    ('ticket_history', 'ix_ticket_history_ticket_id', 'ix_ticket_history_ticket_id_created_at', 'created_at'),
+    ('ticket_attachments', 'ix_ticket_attachments_ticket_id', 'ix_ticket_attachments_ticket_id_uploaded_at', 'uploaded_at'),
+    ('ticket_logs', 'ix_ticket_logs_ticket_id', 'ix_ticket_logs_ticket_id_collected_at', 'collected_at'),
+]
+
+
+def upgrade() -> None:
+    # The timeline and paged sub-resources seek on (ticket_id, time, id);
+    # the composite index also serves plain ticket_id lookups, so the
+    # single-column one is dropped
+    for table, old_index, new_index, time_column in TIMELINE_INDEXES:
+        op.create_index(new_index, table, ['ticket_id', time_column, 'id'])
+        op.drop_index(old_index, table_name=table)
+
+
+def downgrade() -> None:
+    for table, old_index, new_index, time_column in TIMELINE_INDEXES:
+        op.create_index(old_index, table, ['ticket_id'])
+        op.drop_index(new_index, table_name=table)
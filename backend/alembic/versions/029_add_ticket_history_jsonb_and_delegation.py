@@ -0,0 +1,73 @@
+"""Store ticket history payloads as JSONB and track the latest delegation
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for column in ('old_value', 'new_value'):
+        op.alter_column(
+            'ticket_history', column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"NULLIF({column}, '')::jsonb",
+        )
+    op.create_index('ix_ticket_history_action_ticket_id', 'ticket_history', ['action', 'ticket_id'])
+
+    op.add_column('tickets', sa.Column('last_delegated_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('tickets', sa.Column('delegated_to_user_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_tickets_delegated_to_user_id', 'tickets', 'users',
+        ['delegated_to_user_id'], ['id'], ondelete='SET NULL'
+    )
+
+    # Backfill from each ticket's latest delegation
+    op.execute("""
+        UPDATE tickets t
+        SET last_delegated_at = d.created_at,
+            delegated_to_user_id = (d.new_value ->> 'assigned_user_id')::integer
+        FROM (
+            SELECT DISTINCT ON (ticket_id) ticket_id, created_at, new_value
+            FROM ticket_history
+            WHERE action = 'delegated'
+            ORDER BY ticket_id, created_at DESC, id DESC
+        ) d
+        WHERE d.ticket_id = t.id
+    """)
+    # Users deleted since the delegation would violate the new foreign key
+    op.execute("""
+        UPDATE tickets SET delegated_to_user_id = NULL
+        WHERE delegated_to_user_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM users WHERE users.id = tickets.delegated_to_user_id)
+    """)
+
+    # The "delegated to me" queue and its badge count: tickets ever delegated
+    # that are now assigned to the user, whoever they were delegated to
+    op.create_index(
+        'ix_tickets_delegated_assigned_user_id', 'tickets', ['assigned_user_id'],
+        postgresql_where=sa.text('last_delegated_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_delegated_assigned_user_id', table_name='tickets')
+    op.drop_constraint('fk_tickets_delegated_to_user_id', 'tickets', type_='foreignkey')
+    op.drop_column('tickets', 'delegated_to_user_id')
+    op.drop_column('tickets', 'last_delegated_at')
+
+    op.drop_index('ix_ticket_history_action_ticket_id', table_name='ticket_history')
+    for column in ('old_value', 'new_value'):
+        op.alter_column(
+            'ticket_history', column,
+            type_=sa.Text(),
+            postgresql_using=f"{column}::text",
+        )
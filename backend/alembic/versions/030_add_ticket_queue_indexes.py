@@ -0,0 +1,60 @@
+"""Add composite and partial indexes for the ticket queue views
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+# Statuses the incoming / in-progress queues list; reviewing and closed are done
+OPEN_STATUSES = "('new', 'in_progress', 'pending')"
+
+
+def upgrade() -> None:
+    # Every queue lists newest first (ORDER BY created_at DESC, id DESC), so
+    # each index ends with that order and pages are read without a sort.
+    newest_first = [sa.text('created_at DESC'), sa.text('id DESC')]
+
+    # Department queues by status: incoming, in progress, completed
+    op.create_index(
+        'ix_tickets_department_status_created_at', 'tickets',
+        ['assigned_department_id', 'status', *newest_first],
+    )
+    # Open tickets of a department across several statuses in one ordered scan
+    op.create_index(
+        'ix_tickets_open_department_created_at', 'tickets',
+        ['assigned_department_id', *newest_first],
+        postgresql_where=sa.text(f'status IN {OPEN_STATUSES}'),
+    )
+    # "My tickets" by status; also serves plain assigned_user_id lookups
+    op.create_index(
+        'ix_tickets_assigned_user_status_created_at', 'tickets',
+        ['assigned_user_id', 'status', *newest_first],
+    )
+    op.drop_index('ix_tickets_assigned_user_id', table_name='tickets')
+    # Status-only filters; also serves plain status lookups
+    op.create_index(
+        'ix_tickets_status_created_at', 'tickets',
+        ['status', *newest_first],
+    )
+    op.drop_index('ix_tickets_status', table_name='tickets')
+    op.create_index(
+        'ix_tickets_created_by_created_at', 'tickets',
+        ['created_by_id', *newest_first],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_created_by_created_at', table_name='tickets')
+    op.create_index('ix_tickets_status', 'tickets', ['status'], unique=False)
+    op.drop_index('ix_tickets_status_created_at', table_name='tickets')
+    op.create_index('ix_tickets_assigned_user_id', 'tickets', ['assigned_user_id'], unique=False)
+    op.drop_index('ix_tickets_assigned_user_status_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_open_department_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_department_status_created_at', table_name='tickets')
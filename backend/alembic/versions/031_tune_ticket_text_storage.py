@@ -0,0 +1,29 @@
+"""Keep bulky ticket text out of the main tickets heap
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows are compressed / moved to TOAST once they pass 512 bytes instead of
+    # ~2 KB, so mid-size descriptions stop widening the heap that list, queue
+    # and count scans read. The ORM defers both columns (models/ticket.py).
+    op.execute("ALTER TABLE tickets SET (toast_tuple_target = 512)")
+    # lz4 is much faster than pglz to (de)compress large pasted logs; applies
+    # to values written from now on
+    op.execute("ALTER TABLE tickets ALTER COLUMN station_logs SET COMPRESSION lz4")
+    op.execute("ALTER TABLE tickets ALTER COLUMN description SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE tickets ALTER COLUMN description SET COMPRESSION default")
+    op.execute("ALTER TABLE tickets ALTER COLUMN station_logs SET COMPRESSION default")
+    op.execute("ALTER TABLE tickets RESET (toast_tuple_target)")
@@ -0,0 +1,327 @@
+"""Add trigger-maintained ticket_list_view read model
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+OPEN_STATUSES = "('new', 'in_progress', 'pending')"
+
+# ticket_list_view column -> source expression. changed_at is when the row
+# last changed in any way, renames of related rows included; /changes
+# (delta sync) walks it, since tickets.updated_at misses those renames.
+VIEW_COLUMNS = [
+    ('id', 't.id'),
+    ('ticket_number', 't.ticket_number'),
+    ('title', 't.title'),
+    ('category', 't.category'),
+    ('priority', 't.priority'),
+    ('status', 't.status'),
+    ('incident_type', 't.incident_type'),
+    ('created_at', 't.created_at'),
+    ('updated_at', 't.updated_at'),
+    ('changed_at', 'now()'),
+    ('sla_due_date', 't.sla_due_date'),
+    ('sla_breached', 't.sla_breached'),
+    ('comments_count', 't.comments_count'),
+    ('attachments_count', 't.attachments_count'),
+    ('station_id', 't.station_id'),
+    ('station_code', 's.station_id'),
+    ('station_number', 's.station_number'),
+    ('station_name', 's.name'),
+    ('station_address', 's.address'),
+    ('operator_id', 's.operator_id'),
+    ('operator_name', 'o.name'),
+    ('assigned_user_id', 't.assigned_user_id'),
+    ('assigned_user_first_name', 'au.first_name'),
+    ('assigned_user_last_name', 'au.last_name'),
+    ('assigned_user_email', 'au.email'),
+    ('assigned_department_id', 't.assigned_department_id'),
+    ('assigned_department_name', 'd.name'),
+    ('delegated_to_user_id', 't.delegated_to_user_id'),
+    ('last_delegated_at', 't.last_delegated_at'),
+    ('created_by_id', 't.created_by_id'),
+    ('created_by_first_name', 'cb.first_name'),
+    ('created_by_last_name', 'cb.last_name'),
+    ('created_by_email', 'cb.email'),
+]
+
+INSERT_SQL = f"""
+    INSERT INTO ticket_list_view ({', '.join(column for column, _ in VIEW_COLUMNS)})
+    SELECT {', '.join(source for _, source in VIEW_COLUMNS)}
+    FROM tickets t
+    LEFT JOIN stations s ON s.id = t.station_id
+    LEFT JOIN operators o ON o.id = s.operator_id
+    LEFT JOIN users au ON au.id = t.assigned_user_id
+    LEFT JOIN departments d ON d.id = t.assigned_department_id
+    LEFT JOIN users cb ON cb.id = t.created_by_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ticket_list_view',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ticket_number', sa.String(20), nullable=False),
+        sa.Column('title', sa.String(300), nullable=False),
+        sa.Column('category', sa.String(20), nullable=False),
+        sa.Column('priority', sa.String(10), nullable=True),
+        sa.Column('status', sa.String(20), nullable=True),
+        sa.Column('incident_type', sa.String(100), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('sla_due_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('sla_breached', sa.Boolean(), nullable=True),
+        sa.Column('comments_count', sa.Integer(), nullable=False),
+        sa.Column('attachments_count', sa.Integer(), nullable=False),
+        sa.Column('station_id', sa.Integer(), nullable=True),
+        sa.Column('station_code', sa.String(100), nullable=True),
+        sa.Column('station_number', sa.String(50), nullable=True),
+        sa.Column('station_name', sa.String(200), nullable=True),
+        sa.Column('station_address', sa.String(500), nullable=True),
+        sa.Column('operator_id', sa.Integer(), nullable=True),
+        sa.Column('operator_name', sa.String(200), nullable=True),
+        sa.Column('assigned_user_id', sa.Integer(), nullable=True),
+        sa.Column('assigned_user_first_name', sa.String(100), nullable=True),
+        sa.Column('assigned_user_last_name', sa.String(100), nullable=True),
+        sa.Column('assigned_user_email', sa.String(255), nullable=True),
+        sa.Column('assigned_department_id', sa.Integer(), nullable=True),
+        sa.Column('assigned_department_name', sa.String(100), nullable=True),
+        sa.Column('delegated_to_user_id', sa.Integer(), nullable=True),
+        sa.Column('last_delegated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_by_id', sa.Integer(), nullable=True),
+        sa.Column('created_by_first_name', sa.String(100), nullable=True),
+        sa.Column('created_by_last_name', sa.String(100), nullable=True),
+        sa.Column('created_by_email', sa.String(255), nullable=True),
+        sa.ForeignKeyConstraint(['id'], ['tickets.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Upserts the rows of the given tickets from the normalized tables
+    op.execute(f"""
+        CREATE FUNCTION ticket_list_view_refresh(ticket_ids integer[]) RETURNS void
+        LANGUAGE sql AS $$
+            {INSERT_SQL}
+            WHERE t.id = ANY(ticket_ids)
+            ON CONFLICT (id) DO UPDATE SET
+            {', '.join(f'{column} = EXCLUDED.{column}' for column, _ in VIEW_COLUMNS[1:])}
+        $$
+    """)
+
+    # Tickets: one refresh per statement, so bulk updates stay a single upsert.
+    # Deletes are covered by the ON DELETE CASCADE foreign key.
+    op.execute("""
+        CREATE FUNCTION ticket_list_view_sync_tickets() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM ticket_list_view_refresh(ARRAY(SELECT id FROM changed_tickets));
+            RETURN NULL;
+        END
+        $$
+    """)
+    for event in ('INSERT', 'UPDATE'):
+        op.execute(f"""
+            CREATE TRIGGER ticket_list_view_tickets_{event.lower()}
+            AFTER {event} ON tickets
+            REFERENCING NEW TABLE AS changed_tickets
+            FOR EACH STATEMENT EXECUTE FUNCTION ticket_list_view_sync_tickets()
+        """)
+
+    # Stations: a new operator also changes operator_name, so re-derive the rows
+    op.execute("""
+        CREATE FUNCTION ticket_list_view_sync_station() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM ticket_list_view_refresh(
+                ARRAY(SELECT id FROM ticket_list_view WHERE station_id = NEW.id)
+            );
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_list_view_stations_update
+        AFTER UPDATE ON stations FOR EACH ROW
+        WHEN (OLD.station_id IS DISTINCT FROM NEW.station_id
+              OR OLD.station_number IS DISTINCT FROM NEW.station_number
+              OR OLD.name IS DISTINCT FROM NEW.name
+              OR OLD.address IS DISTINCT FROM NEW.address
+              OR OLD.operator_id IS DISTINCT FROM NEW.operator_id)
+        EXECUTE FUNCTION ticket_list_view_sync_station()
+    """)
+
+    # Operators, departments and users only change names: patch in place, and
+    # stamp changed_at so delta-sync clients pick the new names up
+    op.execute("""
+        CREATE FUNCTION ticket_list_view_sync_operator() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE ticket_list_view SET operator_name = NEW.name, changed_at = now()
+            WHERE operator_id = NEW.id;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_list_view_operators_update
+        AFTER UPDATE ON operators FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION ticket_list_view_sync_operator()
+    """)
+    op.execute("""
+        CREATE FUNCTION ticket_list_view_sync_department() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE ticket_list_view SET assigned_department_name = NEW.name, changed_at = now()
+            WHERE assigned_department_id = NEW.id;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_list_view_departments_update
+        AFTER UPDATE ON departments FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION ticket_list_view_sync_department()
+    """)
+    op.execute("""
+        CREATE FUNCTION ticket_list_view_sync_user() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE ticket_list_view
+            SET assigned_user_first_name = NEW.first_name,
+                assigned_user_last_name = NEW.last_name,
+                assigned_user_email = NEW.email,
+                changed_at = now()
+            WHERE assigned_user_id = NEW.id;
+            UPDATE ticket_list_view
+            SET created_by_first_name = NEW.first_name,
+                created_by_last_name = NEW.last_name,
+                created_by_email = NEW.email,
+                changed_at = now()
+            WHERE created_by_id = NEW.id;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_list_view_users_update
+        AFTER UPDATE ON users FOR EACH ROW
+        WHEN (OLD.first_name IS DISTINCT FROM NEW.first_name
+              OR OLD.last_name IS DISTINCT FROM NEW.last_name
+              OR OLD.email IS DISTINCT FROM NEW.email)
+        EXECUTE FUNCTION ticket_list_view_sync_user()
+    """)
+
+    op.execute(INSERT_SQL)
+
+    # Queue and list filters, all ending in the list order (see migration 030)
+    newest_first = [sa.text('created_at DESC'), sa.text('id DESC')]
+    op.create_index('ix_ticket_list_view_created_at_id', 'ticket_list_view', newest_first)
+    op.create_index('ix_ticket_list_view_changed_at_id', 'ticket_list_view', ['changed_at', 'id'])
+    op.create_index(
+        'ix_ticket_list_view_status_created_at', 'ticket_list_view',
+        ['status', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_department_status_created_at', 'ticket_list_view',
+        ['assigned_department_id', 'status', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_open_department_created_at', 'ticket_list_view',
+        ['assigned_department_id', *newest_first],
+        postgresql_where=sa.text(f'status IN {OPEN_STATUSES}'),
+    )
+    op.create_index(
+        'ix_ticket_list_view_assigned_user_status_created_at', 'ticket_list_view',
+        ['assigned_user_id', 'status', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_created_by_created_at', 'ticket_list_view',
+        ['created_by_id', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_operator_created_at', 'ticket_list_view',
+        ['operator_id', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_station_created_at', 'ticket_list_view',
+        ['station_id', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_incident_type_created_at', 'ticket_list_view',
+        ['incident_type', *newest_first],
+    )
+    op.create_index(
+        'ix_ticket_list_view_delegated_assigned_user_id', 'ticket_list_view',
+        ['assigned_user_id'],
+        postgresql_where=sa.text('last_delegated_at IS NOT NULL'),
+    )
+
+    # Search (see ticket_search_service): trigram for 3+ characters, pattern
+    # indexes for the prefix fallback; all on one table, combined by BitmapOr
+    for column in ('ticket_number', 'title', 'station_number', 'station_code'):
+        op.create_index(
+            f'ix_ticket_list_view_{column}_trgm', 'ticket_list_view', [column],
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+    op.create_index(
+        'ix_ticket_list_view_ticket_number_pattern', 'ticket_list_view', ['ticket_number'],
+        postgresql_ops={'ticket_number': 'varchar_pattern_ops'},
+    )
+    # Text prefixes match case-insensitively, like the ILIKE of longer terms
+    for column in ('title', 'station_number', 'station_code'):
+        op.execute(
+            f"CREATE INDEX ix_ticket_list_view_{column}_lower_pattern "
+            f"ON ticket_list_view (lower({column}) text_pattern_ops)"
+        )
+
+    # Search and "delegated to me" now read the view; these only slowed down
+    # ticket writes
+    op.drop_index('ix_tickets_delegated_assigned_user_id', table_name='tickets')
+    op.drop_index('ix_tickets_ticket_number_pattern', table_name='tickets')
+    op.drop_index('ix_tickets_title_trgm', table_name='tickets')
+    op.drop_index('ix_tickets_ticket_number_trgm', table_name='tickets')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_tickets_ticket_number_trgm', 'tickets', ['ticket_number'],
+        postgresql_using='gin', postgresql_ops={'ticket_number': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_tickets_title_trgm', 'tickets', ['title'],
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_tickets_ticket_number_pattern', 'tickets', ['ticket_number'],
+        postgresql_ops={'ticket_number': 'varchar_pattern_ops'},
+    )
+    op.create_index(
+        'ix_tickets_delegated_assigned_user_id', 'tickets', ['assigned_user_id'],
+        postgresql_where=sa.text('last_delegated_at IS NOT NULL'),
+    )
+
+    op.execute("DROP TRIGGER ticket_list_view_users_update ON users")
+    op.execute("DROP TRIGGER ticket_list_view_departments_update ON departments")
+    op.execute("DROP TRIGGER ticket_list_view_operators_update ON operators")
+    op.execute("DROP TRIGGER ticket_list_view_stations_update ON stations")
+    op.execute("DROP TRIGGER ticket_list_view_tickets_update ON tickets")
+    op.execute("DROP TRIGGER ticket_list_view_tickets_insert ON tickets")
+    op.execute("DROP FUNCTION ticket_list_view_sync_user()")
+    op.execute("DROP FUNCTION ticket_list_view_sync_department()")
+    op.execute("DROP FUNCTION ticket_list_view_sync_operator()")
+    op.execute("DROP FUNCTION ticket_list_view_sync_station()")
+    op.execute("DROP FUNCTION ticket_list_view_sync_tickets()")
+    op.execute("DROP FUNCTION ticket_list_view_refresh(integer[])")
+
+    # Dropping the table drops its indexes
+    op.drop_table('ticket_list_view')
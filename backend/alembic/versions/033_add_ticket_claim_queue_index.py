@@ -0,0 +1,30 @@
+"""Add partial index for claiming unassigned department tickets
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '033'
+down_revision = '032'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # POST /tickets/queue/claim reads only the open, unassigned tickets of one
+    # department; those are few, so the index stays tiny and the priority
+    # sort runs over a handful of rows.
+    op.create_index(
+        'ix_tickets_unassigned_department_created_at', 'tickets',
+        ['assigned_department_id', 'created_at', 'id'],
+        postgresql_where=sa.text(
+            "assigned_user_id IS NULL AND status IN ('new', 'in_progress', 'pending')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_unassigned_department_created_at', table_name='tickets')
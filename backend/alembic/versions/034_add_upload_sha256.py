@@ -0,0 +1,24 @@
+"""Add sha256 content hash to ticket attachments and logs
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '034'
+down_revision = '033'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled by the streaming upload path; NULL for files stored before it
+    op.add_column('ticket_attachments', sa.Column('sha256', sa.String(length=64), nullable=True))
+    op.add_column('ticket_logs', sa.Column('sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('ticket_logs', 'sha256')
+    op.drop_column('ticket_attachments', 'sha256')
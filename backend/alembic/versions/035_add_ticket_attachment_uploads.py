@@ -0,0 +1,41 @@
+"""Add ticket_attachment_uploads table for resumable uploads
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '035'
+down_revision = '034'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ticket_attachment_uploads',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ticket_id', sa.Integer(), nullable=False),
+        sa.Column('uploaded_by_id', sa.Integer(), nullable=False),
+        sa.Column('filename', sa.String(255), nullable=False),
+        sa.Column('mime_type', sa.String(100), nullable=True),
+        sa.Column('total_size', sa.Integer(), nullable=False),
+        sa.Column('file_path', sa.String(500), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['ticket_id'], ['tickets.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['uploaded_by_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ticket_attachment_uploads_id', 'ticket_attachment_uploads', ['id'])
+    op.create_index('ix_ticket_attachment_uploads_ticket_id', 'ticket_attachment_uploads', ['ticket_id'])
+    op.create_index('ix_ticket_attachment_uploads_expires_at', 'ticket_attachment_uploads', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ticket_attachment_uploads_expires_at', table_name='ticket_attachment_uploads')
+    op.drop_index('ix_ticket_attachment_uploads_ticket_id', table_name='ticket_attachment_uploads')
+    op.drop_index('ix_ticket_attachment_uploads_id', table_name='ticket_attachment_uploads')
+    op.drop_table('ticket_attachment_uploads')
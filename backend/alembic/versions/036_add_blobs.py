@@ -0,0 +1,37 @@
+"""Add blobs table for content-addressed log and attachment storage
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '036'
+down_revision = '035'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blobs',
+        sa.Column('sha256', sa.String(64), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('sha256')
+    )
+    # Lets the collector find unreferenced blobs without scanning the table
+    op.create_index(
+        'ix_blobs_unreferenced',
+        'blobs',
+        ['sha256'],
+        postgresql_where=sa.text('ref_count <= 0'),
+    )
+    # Existing files are moved into the store by app.scripts.dedupe_blob_storage
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blobs_unreferenced', table_name='blobs')
+    op.drop_table('blobs')
@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,14 +12,11 @@ from app.database import get_db
 from app.models.user import User
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Get current authenticated user from JWT token."""
-    token = credentials.credentials
+async def get_user_from_token(token: str, db: AsyncSession, token_type: str = "access") -> User:
+    """Resolve and validate the user behind an access (or other typed) token."""
     payload = decode_token(token)
 
     if payload is None:
@@ -29,7 +26,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if payload.get("type") != "access":
+    if payload.get("type") != token_type:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token type",
@@ -67,6 +64,71 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """Get current authenticated user from JWT token."""
+    return await get_user_from_token(credentials.credentials, db)
+
+
+async def get_stream_user(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[
+        Optional[HTTPAuthorizationCredentials], Depends(optional_security)
+    ] = None,
+    token: Optional[str] = Query(None),
+) -> User:
+    """Get current user for long-lived streams.
+
+    Browsers' EventSource cannot send headers, so the ``token`` query
+    parameter may carry a stream token (see ``create_stream_token``); access
+    tokens are only accepted in the Authorization header.
+    """
+    if credentials:
+        return await get_user_from_token(credentials.credentials, db)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await get_user_from_token(token, db, token_type="stream")
+
+
+async def get_download_user(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[
+        Optional[HTTPAuthorizationCredentials], Depends(optional_security)
+    ] = None,
+    token: Optional[str] = Query(None),
+) -> User:
+    """Get current user for file downloads.
+
+    ``<video>``/``<audio>`` elements cannot send headers, so the ``token``
+    query parameter may carry a download token issued for this exact path
+    (see ``create_download_token``); access tokens are not accepted there.
+    """
+    if credentials:
+        return await get_user_from_token(credentials.credentials, db)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    payload = decode_token(token)
+    if payload is not None and payload.get("path") != request.url.path:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Download token is for another file",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await get_user_from_token(token, db, token_type="download")
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
@@ -114,4 +176,6 @@ class PermissionRequired:
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentActiveUser = Annotated[User, Depends(get_current_active_user)]
 CurrentAdminUser = Annotated[User, Depends(get_current_admin_user)]
+StreamUser = Annotated[User, Depends(get_stream_user)]
+DownloadUser = Annotated[User, Depends(get_download_user)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
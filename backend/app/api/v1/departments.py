@@ -16,6 +16,8 @@ from app.schemas.department import (
     DepartmentUpdate,
 )
 from app.schemas.user import UserListResponse
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
+from app.utils.pagination import page_count
 
 router = APIRouter()
 
@@ -29,6 +31,7 @@ async def list_departments(
     search: Optional[str] = None,
     is_active: Optional[bool] = None,
     lang: Optional[str] = Query(None, description="Language code (en, uk)"),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
 ):
     """List all departments with pagination."""
     query = select(Department).options(selectinload(Department.head_user))
@@ -39,8 +42,7 @@ async def list_departments(
         query = query.where(Department.is_active == is_active)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    total, total_mode = await count_total(db, query, count)
 
     # Apply pagination
     offset = (page - 1) * per_page
@@ -89,9 +91,10 @@ async def list_departments(
     return PaginatedResponse(
         items=items,
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page,
+        pages=page_count(total, per_page),
     )
 
 
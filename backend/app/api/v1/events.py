@@ -0,0 +1,73 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import CurrentUser, StreamUser
+from app.config import settings
+from app.core.security import create_stream_token
+from app.schemas.auth import StreamToken
+from app.services.realtime_service import event_broker
+
+router = APIRouter()
+
+HEARTBEAT_INTERVAL = 15  # seconds; keeps proxies from closing idle streams
+
+
+@router.post("/stream-token", response_model=StreamToken)
+async def create_event_stream_token(current_user: CurrentUser):
+    """Issue a short-lived token for opening ``/events/stream`` with ``?token=``."""
+    return StreamToken(
+        token=create_stream_token(current_user.id),
+        expires_at=datetime.utcnow() + timedelta(minutes=settings.STREAM_TOKEN_EXPIRE_MINUTES),
+    )
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    current_user: StreamUser,
+):
+    """Server-Sent Events stream of ticket and notification events.
+
+    Emits ``ticket.created``, ``ticket.updated``, ``ticket.status_changed``,
+    ``ticket.assigned``, ``ticket.delegated``, ``ticket.commented``,
+    ``ticket.deleted``, ``tickets.bulk_updated`` (broadcast) and ``notification.created`` (addressed to
+    the recipient only). Clients refetch what they show when an event arrives
+    instead of polling.
+
+    The stream ends once an access token issued when it opened would have
+    expired, so clients have to authenticate again to keep receiving events.
+    """
+    user_id = current_user.id
+    queue = event_broker.subscribe(user_id)
+    closes_at = time.monotonic() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    async def event_generator():
+        try:
+            yield "retry: 5000\n\n"
+            yield f"event: ready\ndata: {json.dumps({'user_id': user_id})}\n\n"
+            while time.monotonic() < closes_at:
+                if await request.is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                payload = json.dumps(event, default=str)
+                yield f"event: {event['type']}\ndata: {payload}\n\n"
+        finally:
+            event_broker.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
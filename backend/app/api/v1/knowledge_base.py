@@ -19,6 +19,16 @@ from app.schemas.knowledge_base import (
     KnowledgeSearchResponse,
     KnowledgeSearchResult,
 )
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
+from app.utils.fieldsets import (
+    FieldSpec,
+    column_field,
+    fieldset_columns,
+    fieldset_response,
+    parse_fieldset,
+    serialize_fieldset,
+)
+from app.utils.pagination import page_count
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -45,6 +55,32 @@ def serialize_article(article: KnowledgeArticle) -> dict:
     }
 
 
+# KnowledgeArticleListResponse fields; list rows never read content
+ARTICLE_LIST_FIELDS: FieldSpec = {
+    "id": column_field(KnowledgeArticle.id),
+    "title": column_field(KnowledgeArticle.title),
+    "category": column_field(KnowledgeArticle.category),
+    "language": column_field(KnowledgeArticle.language),
+    "tags": column_field(KnowledgeArticle.tags),
+    "author": (
+        (
+            User.id.label("author_pk"),
+            User.first_name.label("author_first_name"),
+            User.last_name.label("author_last_name"),
+        ),
+        lambda row: {
+            "id": row.author_pk,
+            "first_name": row.author_first_name,
+            "last_name": row.author_last_name,
+        } if row.author_pk is not None else None,
+    ),
+    "is_published": column_field(KnowledgeArticle.is_published),
+    "view_count": column_field(KnowledgeArticle.view_count),
+    "created_at": column_field(KnowledgeArticle.created_at),
+    "updated_at": column_field(KnowledgeArticle.updated_at),
+}
+
+
 @router.get("", response_model=PaginatedResponse[KnowledgeArticleListResponse])
 async def list_articles(
     db: DbSession,
@@ -56,43 +92,63 @@ async def list_articles(
     tag: Optional[str] = None,
     language: Optional[str] = Query(None, pattern="^(ua|en)$"),
     is_published: Optional[bool] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return"),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
 ):
-    """List knowledge base articles with pagination and filters."""
-    query = select(KnowledgeArticle).options(selectinload(KnowledgeArticle.author))
+    """List knowledge base articles with pagination and filters.
 
+    ``fields`` limits the items, and the columns read, to those fields;
+    the author is joined only when asked for. ``count`` picks how the
+    total is computed (exact, estimate or none).
+    """
+    fieldset = parse_fieldset(fields, ARTICLE_LIST_FIELDS)
+
+    conditions = []
     if search:
         search_filter = f"%{search}%"
-        query = query.where(
+        conditions.append(
             (KnowledgeArticle.title.ilike(search_filter))
             | (KnowledgeArticle.content.ilike(search_filter))
         )
     if category:
-        query = query.where(KnowledgeArticle.category == category)
+        conditions.append(KnowledgeArticle.category == category)
     if tag:
-        query = query.where(KnowledgeArticle.tags.contains([tag]))
+        conditions.append(KnowledgeArticle.tags.contains([tag]))
     if language:
-        query = query.where(KnowledgeArticle.language == language)
+        conditions.append(KnowledgeArticle.language == language)
     if is_published is not None:
-        query = query.where(KnowledgeArticle.is_published == is_published)
+        conditions.append(KnowledgeArticle.is_published == is_published)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    total, total_mode = await count_total(
+        db, select(KnowledgeArticle.id).where(*conditions), count
+    )
+
+    query = (
+        select(*fieldset_columns(ARTICLE_LIST_FIELDS, fieldset))
+        .select_from(KnowledgeArticle)
+        .where(*conditions)
+    )
+    if "author" in fieldset:
+        query = query.outerjoin(User, User.id == KnowledgeArticle.author_id)
 
     # Apply pagination
     offset = (page - 1) * per_page
     query = query.offset(offset).limit(per_page).order_by(KnowledgeArticle.updated_at.desc())
 
     result = await db.execute(query)
-    articles = result.scalars().all()
 
-    return PaginatedResponse(
-        items=[KnowledgeArticleListResponse.model_validate(a) for a in articles],
+    page_data = dict(
+        items=[serialize_fieldset(row, ARTICLE_LIST_FIELDS, fieldset) for row in result.all()],
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page,
+        pages=page_count(total, per_page),
     )
+    if fields:
+        return fieldset_response(page_data)
+    return PaginatedResponse(**page_data)
 
 
 @router.post("", response_model=KnowledgeArticleResponse, status_code=status.HTTP_201_CREATED)
@@ -11,6 +11,8 @@ from app.api.deps import CurrentUser, DbSession
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.common import PaginatedResponse
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
+from app.utils.pagination import page_count
 
 router = APIRouter()
 
@@ -41,6 +43,7 @@ async def list_notifications(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     unread_only: bool = Query(False),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
 ):
     """Get notifications for current user."""
     query = select(Notification).where(Notification.user_id == current_user.id)
@@ -49,9 +52,7 @@ async def list_notifications(
         query = query.where(Notification.is_read == False)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    total, total_mode = await count_total(db, query, count)
 
     # Get paginated results
     query = query.order_by(Notification.created_at.desc())
@@ -63,9 +64,10 @@ async def list_notifications(
     return PaginatedResponse(
         items=notifications,
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page,
+        pages=page_count(total, per_page),
     )
 
 
@@ -15,6 +15,8 @@ from app.schemas.operator import (
     OperatorResponse,
     OperatorUpdate,
 )
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
+from app.utils.pagination import page_count
 
 router = APIRouter()
 
@@ -27,6 +29,7 @@ async def list_operators(
     per_page: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
     is_active: Optional[bool] = None,
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
 ):
     """List all operators with pagination."""
     query = select(Operator)
@@ -39,8 +42,7 @@ async def list_operators(
         query = query.where(Operator.is_active == is_active)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    total, total_mode = await count_total(db, query, count)
 
     # Apply pagination
     offset = (page - 1) * per_page
@@ -71,9 +73,10 @@ async def list_operators(
     return PaginatedResponse(
         items=items,
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page if total > 0 else 0,
+        pages=page_count(total, per_page),
     )
 
 
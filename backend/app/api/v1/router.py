@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1 import auth, users, departments, roles, operators, stations, tickets, knowledge_base, dashboard, notifications, log_analysis, incident_types
+from app.api.v1 import auth, users, departments, roles, operators, stations, tickets, knowledge_base, dashboard, notifications, log_analysis, incident_types, events
 
 api_router = APIRouter()
 
@@ -16,3 +16,4 @@ api_router.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboar
 api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
 api_router.include_router(log_analysis.router, prefix="/log-analysis", tags=["Log Analysis"])
 api_router.include_router(incident_types.router, prefix="/incident-types", tags=["Incident Types"])
+api_router.include_router(events.router, prefix="/events", tags=["Events"])
@@ -1,7 +1,7 @@
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import CurrentUser, DbSession, PermissionRequired
@@ -18,10 +18,41 @@ from app.schemas.station import (
     StationResponse,
     StationUpdate,
 )
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
+from app.utils.fieldsets import (
+    FieldSpec,
+    column_field,
+    fieldset_columns,
+    fieldset_response,
+    parse_fieldset,
+    serialize_fieldset,
+    translated_field,
+)
+from app.utils.pagination import page_count
 
 router = APIRouter()
 
 
+def station_list_fields(language: str) -> FieldSpec:
+    """StationListResponse fields, with names in ``language`` where translated."""
+    use_en = language == "en"
+    return {
+        "id": column_field(Station.id),
+        "station_id": column_field(Station.station_id),
+        "station_number": column_field(Station.station_number),
+        "external_id": column_field(Station.external_id),
+        "name": translated_field(Station.name, Station.name_en, use_en),
+        "operator": (
+            (Operator.id.label("operator_pk"), Operator.name.label("operator_name")),
+            lambda row: {"id": row.operator_pk, "name": row.operator_name},
+        ),
+        "address": translated_field(Station.address, Station.address_en, use_en),
+        "city": translated_field(Station.city, Station.city_en, use_en),
+        "model": column_field(Station.model),
+        "status": column_field(Station.status),
+    }
+
+
 @router.get("", response_model=PaginatedResponse[StationListResponse])
 async def list_stations(
     db: DbSession,
@@ -33,13 +64,22 @@ async def list_stations(
     city: Optional[str] = None,
     station_status: Optional[str] = None,
     language: str = Query("uk"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return"),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
 ):
-    """List all stations with pagination and filters."""
-    query = select(Station).options(selectinload(Station.operator))
+    """List all stations with pagination and filters.
+
+    ``fields`` limits the items, and the columns read, to those fields;
+    the operator is joined only when asked for. ``count`` picks how the
+    total is computed (exact, estimate or none).
+    """
+    spec = station_list_fields(language)
+    fieldset = parse_fieldset(fields, spec)
 
+    conditions = []
     if search:
         search_filter = f"%{search}%"
-        query = query.where(
+        conditions.append(
             (Station.station_number.ilike(search_filter))
             | (Station.station_id.ilike(search_filter))
             | (Station.external_id.ilike(search_filter))
@@ -47,51 +87,40 @@ async def list_stations(
             | (Station.address.ilike(search_filter))
         )
     if operator_id is not None:
-        query = query.where(Station.operator_id == operator_id)
+        conditions.append(Station.operator_id == operator_id)
     if city:
-        query = query.where(Station.city.ilike(f"%{city}%"))
+        conditions.append(Station.city.ilike(f"%{city}%"))
     if station_status:
         statuses = [s.strip() for s in station_status.split(",")]
         if len(statuses) == 1:
-            query = query.where(Station.status == statuses[0])
+            conditions.append(Station.status == statuses[0])
         else:
-            query = query.where(Station.status.in_(statuses))
+            conditions.append(Station.status.in_(statuses))
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    total, total_mode = await count_total(db, select(Station.id).where(*conditions), count)
+
+    query = select(*fieldset_columns(spec, fieldset)).select_from(Station).where(*conditions)
+    if "operator" in fieldset:
+        query = query.join(Operator, Operator.id == Station.operator_id)
 
     # Apply pagination
     offset = (page - 1) * per_page
     query = query.offset(offset).limit(per_page).order_by(Station.station_id)
 
     result = await db.execute(query)
-    stations = result.scalars().all()
-    
-    # Apply translations
-    items = []
-    for station in stations:
-        station_dict = {
-            "id": station.id,
-            "station_id": station.station_id,
-            "station_number": station.station_number,
-            "external_id": station.external_id,
-            "name": station.name_en if language == "en" and station.name_en else station.name,
-            "operator": station.operator,
-            "address": station.address_en if language == "en" and station.address_en else station.address,
-            "city": station.city_en if language == "en" and station.city_en else station.city,
-            "model": station.model,
-            "status": station.status,
-        }
-        items.append(StationListResponse(**station_dict))
 
-    return PaginatedResponse(
-        items=items,
+    page_data = dict(
+        items=[serialize_fieldset(row, spec, fieldset) for row in result.all()],
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page if total > 0 else 0,
+        pages=page_count(total, per_page),
     )
+    if fields:
+        return fieldset_response(page_data)
+    return PaginatedResponse(**page_data)
 
 
 @router.get("/search")
@@ -1,31 +1,54 @@
-import json
+import heapq
+import logging
 import os
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Annotated, Optional
 
-import aiofiles
 from pydantic import BaseModel as PydanticBaseModel
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse
-from sqlalchemy import Integer, func, select, or_
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import and_, case, func, select, or_, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload, undefer
 
-from app.api.deps import CurrentUser, DbSession, PermissionRequired
+from app.api.deps import CurrentUser, DbSession, DownloadUser, PermissionRequired
 from app.config import settings
+from app.core.security import create_download_token
 from app.models.department import Department
+from app.models.export_job import ExportJob
 from app.models.operator import Operator
 from app.models.station import Station
-from app.models.ticket import Ticket, TicketAttachment, TicketComment, TicketHistory, TicketLog
+from app.models.ticket import (
+    Ticket,
+    TicketAttachment,
+    TicketAttachmentUpload,
+    TicketComment,
+    TicketHistory,
+    TicketListView,
+    TicketLog,
+    TicketTombstone,
+    ticket_number_seq,
+)
 from app.models.user import User
 from app.schemas.common import PaginatedResponse
+from app.schemas.export_job import ExportJobCreate, ExportJobResponse
 from app.schemas.ticket import (
+    DepartmentShort,
     ParseMessageRequest,
     ParseMessageResponse,
     TicketAssignUpdate,
+    TicketAttachmentDownloadToken,
     TicketAttachmentResponse,
+    TicketAttachmentUploadComplete,
+    TicketAttachmentUploadCreate,
+    TicketAttachmentUploadResponse,
+    TicketBatchResponse,
+    TicketBulkItemResult,
+    TicketBulkOperation,
+    TicketBulkResponse,
+    TicketChangesResponse,
     TicketCommentCreate,
     TicketCommentResponse,
     TicketCommentUpdate,
@@ -37,42 +60,81 @@ from app.schemas.ticket import (
     TicketLogResponse,
     TicketResponse,
     TicketStatusUpdate,
+    TicketTimelineItem,
+    TicketTimelineResponse,
     TicketUpdate,
+    UserShort,
 )
 from app.services.ticket_service import TicketService
+from app.services.ticket_bulk_service import BULK_ACTIONS, TicketBulkService
 from app.services.assignment_service import AssignmentService
+from app.services.blob_store import BlobStore, blob_incoming_dir, partial_uploads_dir
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
 from app.services.notification_service import NotificationService
+from app.services.realtime_service import publish_event, ticket_event_data
+from app.services.ticket_export_service import stream_ticket_export
+from app.services.upload_service import (
+    StoredUpload,
+    append_upload_chunk,
+    finish_partial_upload,
+    store_upload,
+)
+from app.services.ticket_query_service import (
+    TICKET_LIST_FIELDS,
+    serialize_ticket_list_row,
+    ticket_filter_conditions,
+    ticket_list_query,
+)
+from app.utils.downloads import file_download_response
+from app.utils.fieldsets import fieldset_response, parse_fieldset
+from app.utils.pagination import (
+    decode_cursor,
+    decode_timeline_cursor,
+    decode_watermark,
+    encode_cursor,
+    encode_timeline_cursor,
+    encode_watermark,
+    page_count,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Attachment types served inline: rendered by browsers without running
+# scripts. Anything else (HTML, SVG, XML...) could script the app's origin
+INLINE_ATTACHMENT_TYPES = (
+    "image/jpeg", "image/png", "image/gif", "image/webp", "image/bmp",
+    "video/", "audio/", "application/pdf",
+)
+
+# Rows stamped less than this long ago may still be joined by transactions
+# that started earlier but have not committed yet, so the delta-sync
+# watermark never moves past them.
+CHANGES_SETTLE_SECONDS = 5
+
+TICKET_BATCH_MAX_IDS = 300
+
+# Queue claims take open, unassigned tickets, most urgent first
+CLAIM_STATUSES = ("new", "in_progress", "pending")
+CLAIM_PRIORITY_ORDER = ("critical", "high", "medium", "low")
+
+# Many-to-one ticket relations a sparse fieldset may ask for
+TICKET_RELATION_SCHEMAS = {
+    "assigned_user": UserShort,
+    "assigned_department": DepartmentShort,
+    "created_by": UserShort,
+}
+
 
 async def generate_ticket_number(db: AsyncSession) -> str:
-    """Generate unique ticket number: simple sequential integer as string"""
-    max_retries = 5
-    
-    for attempt in range(max_retries):
-        # Get the maximum numeric ticket number
-        result = await db.execute(
-            select(func.max(func.cast(Ticket.ticket_number, Integer)))
-        )
-        max_number = result.scalar()
-        
-        counter = (max_number or 0) + 1
-        ticket_number = str(counter)
-        
-        # Check if this number already exists
-        check_result = await db.execute(
-            select(Ticket.id).where(Ticket.ticket_number == ticket_number)
-        )
-        if not check_result.scalar():
-            return ticket_number
-        
-        # If exists, try next number
-        counter += 1
-    
-    # Fallback
-    import time
-    return str(int(time.time() * 1000) % 1000000)
+    """Allocate the next ticket number from ticket_number_seq.
+
+    nextval() is atomic and never returns the same value twice, so concurrent
+    creates cannot collide and no table scan is needed. Numbers burned by
+    rolled-back transactions leave gaps, which is acceptable for ticket numbers.
+    """
+    return str(await db.scalar(select(ticket_number_seq.next_value())))
 
 
 @router.get("", response_model=PaginatedResponse[TicketListResponse])
@@ -94,103 +156,214 @@ async def list_tickets(
     incident_type: Optional[str] = None,
     my_tickets: bool = False,
     delegated_to_me: bool = False,
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return"),
 ):
-    """List tickets with pagination and filters."""
-    query = select(Ticket).options(
-        selectinload(Ticket.station).selectinload(Station.operator),
-        selectinload(Ticket.assigned_user),
-        selectinload(Ticket.assigned_department),
-        selectinload(Ticket.created_by),
-    )
-
-    # Apply filters
-    if search:
-        search_filter = f"%{search}%"
-        query = query.outerjoin(Station, Ticket.station_id == Station.id).where(
-            or_(
-                Ticket.ticket_number.ilike(search_filter),
-                Ticket.title.ilike(search_filter),
-                Station.station_number.ilike(search_filter),
-                Station.station_id.ilike(search_filter),
-            )
-        )
-    if status:
-        # Support multiple statuses separated by comma
-        if ',' in status:
-            statuses = [s.strip() for s in status.split(',')]
-            query = query.where(Ticket.status.in_(statuses))
-        else:
-            query = query.where(Ticket.status == status)
-    if priority:
-        query = query.where(Ticket.priority == priority)
-    if category:
-        query = query.where(Ticket.category == category)
-    if assigned_user_id is not None:
-        query = query.where(Ticket.assigned_user_id == assigned_user_id)
-    if assigned_department_id is not None:
-        query = query.where(Ticket.assigned_department_id == assigned_department_id)
-    if department_id is not None:
-        # Filter by department (either assigned or related)
-        query = query.where(Ticket.assigned_department_id == department_id)
-    if station_id is not None:
-        query = query.where(Ticket.station_id == station_id)
-    if operator_id is not None:
-        query = query.where(Ticket.station.has(Station.operator_id == operator_id))
-    if created_by_id is not None:
-        query = query.where(Ticket.created_by_id == created_by_id)
-    if incident_type is not None:
-        query = query.where(Ticket.incident_type == incident_type)
-    if my_tickets:
-        query = query.where(
-            or_(
-                Ticket.assigned_user_id == current_user.id,
-                Ticket.created_by_id == current_user.id,
-            )
-        )
-    if delegated_to_me:
-        # Only tickets delegated specifically to the current user
-        delegated_subq = (
-            select(TicketHistory.ticket_id)
-            .where(TicketHistory.action == "delegated")
-            .distinct()
-        )
-        query = query.where(
-            Ticket.id.in_(delegated_subq),
-            Ticket.assigned_user_id == current_user.id,
-        )
+    """List tickets with pagination and filters.
+
+    Offset mode (default) pages with ``page``/``per_page``. Cursor mode
+    (``pagination=cursor`` or any ``cursor`` token) seeks on
+    ``(created_at, id)`` and returns ``next_cursor``/``prev_cursor``, so deep
+    pages cost the same as the first one. ``count=estimate`` reports the
+    planner's row estimate and ``count=none`` skips the total.
+    ``fields`` limits the items, and the columns read, to those fields.
+    """
+    fieldset = parse_fieldset(fields, TICKET_LIST_FIELDS)
+    conditions, search_rank = ticket_filter_conditions(
+        current_user,
+        search=search,
+        status=status,
+        priority=priority,
+        category=category,
+        assigned_user_id=assigned_user_id,
+        assigned_department_id=assigned_department_id,
+        department_id=department_id,
+        station_id=station_id,
+        operator_id=operator_id,
+        created_by_id=created_by_id,
+        incident_type=incident_type,
+        my_tickets=my_tickets,
+        delegated_to_me=delegated_to_me,
+    )
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page).order_by(Ticket.created_at.desc())
+    total, total_mode = await count_total(db, select(TicketListView.id).where(*conditions), count)
+
+    # Lean projection: one SELECT of the displayed columns, no ORM hydration
+    query = ticket_list_query(fieldset).where(*conditions)
+
+    next_cursor = None
+    prev_cursor = None
+    if pagination == "cursor" or cursor is not None:
+        # Keyset pagination over (created_at, id), served by ix_ticket_list_view_created_at_id
+        position = decode_cursor(cursor) if cursor else None
+        sort_key = tuple_(TicketListView.created_at, TicketListView.id)
+        if position and position[2] == "prev":
+            query = query.where(sort_key > (position[0], position[1])).order_by(
+                TicketListView.created_at.asc(), TicketListView.id.asc()
+            )
+        else:
+            if position:
+                query = query.where(sort_key < (position[0], position[1]))
+            query = query.order_by(TicketListView.created_at.desc(), TicketListView.id.desc())
+
+        result = await db.execute(query.limit(per_page + 1))
+        rows = list(result.all())
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        backwards = bool(position) and position[2] == "prev"
+        if backwards:
+            rows.reverse()
+        if rows:
+            if has_more or backwards:
+                last = rows[-1]
+                next_cursor = encode_cursor(last.created_at, last.id, "next")
+            if (has_more and backwards) or (position and not backwards):
+                first = rows[0]
+                prev_cursor = encode_cursor(first.created_at, first.id, "prev")
+    else:
+        # Apply pagination; searches list the most relevant matches first
+        offset = (page - 1) * per_page
+        ordering = [TicketListView.created_at.desc(), TicketListView.id.desc()]
+        if search_rank is not None:
+            ordering.insert(0, search_rank.desc())
+        query = query.offset(offset).limit(per_page).order_by(*ordering)
 
-    result = await db.execute(query)
-    tickets = result.scalars().all()
+        result = await db.execute(query)
+        rows = result.all()
 
-    # Build response with counts
-    items = []
-    for ticket in tickets:
-        ticket_dict = TicketListResponse.model_validate(ticket).model_dump()
-        if ticket.station:
-            ticket_dict["station"] = {
-                "id": ticket.station.id,
-                "station_id": ticket.station.station_id,
-                "station_number": ticket.station.station_number,
-                "name": ticket.station.name,
-                "address": ticket.station.address,
-                "operator_name": ticket.station.operator.name if ticket.station.operator else "",
-            }
-        items.append(TicketListResponse(**ticket_dict))
-
-    return PaginatedResponse(
-        items=items,
+    page_data = dict(
+        items=[serialize_ticket_list_row(row, fieldset) for row in rows],
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page,
+        pages=page_count(total, per_page),
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+    if fields:
+        return fieldset_response(page_data)
+    return PaginatedResponse(**page_data)
+
+
+@router.get("/changes", response_model=TicketChangesResponse)
+async def list_ticket_changes(
+    db: DbSession,
+    current_user: CurrentUser,
+    since: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=1000),
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    assigned_user_id: Optional[int] = None,
+    assigned_department_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    station_id: Optional[int] = None,
+    operator_id: Optional[int] = None,
+    created_by_id: Optional[int] = None,
+    incident_type: Optional[str] = None,
+    my_tickets: bool = False,
+    delegated_to_me: bool = False,
+):
+    """Tickets changed since a watermark, for cheap client resync.
+
+    Call without ``since`` before loading the list to get a starting
+    watermark, then pass the returned ``watermark`` back on each poll with the
+    same filters as ``GET /tickets``. ``items`` are changed tickets that match
+    the filters; ``removed`` are ids that were deleted or no longer match.
+    Applying a response twice is harmless, so clients just upsert/remove.
+    While ``has_more`` is true, call again right away.
+    """
+    now = (await db.execute(select(func.now()))).scalar()
+    settled = (now - timedelta(seconds=CHANGES_SETTLE_SECONDS), 0)
+
+    if since is None:
+        return TicketChangesResponse(
+            items=[],
+            removed=[],
+            watermark=encode_watermark(settled, settled),
+            has_more=False,
+        )
+
+    ticket_position, tombstone_position = decode_watermark(since)
+    retention = timedelta(days=settings.TICKET_TOMBSTONE_RETENTION_DAYS)
+    if tombstone_position[0] < now - retention:
+        # Deletions this old may already be pruned
+        raise HTTPException(
+            status_code=410,  # `status` is shadowed by the filter parameter
+            detail="Watermark expired, reload the ticket list",
+        )
+
+    conditions, _ = ticket_filter_conditions(
+        current_user,
+        search=search,
+        status=status,
+        priority=priority,
+        category=category,
+        assigned_user_id=assigned_user_id,
+        assigned_department_id=assigned_department_id,
+        department_id=department_id,
+        station_id=station_id,
+        operator_id=operator_id,
+        created_by_id=created_by_id,
+        incident_type=incident_type,
+        my_tickets=my_tickets,
+        delegated_to_me=delegated_to_me,
+    )
+
+    # Changed tickets in watermark order, served by ix_ticket_list_view_changed_at_id.
+    # changed_at also moves when a related station, operator, department or
+    # user is renamed. Filters become a flag so tickets that left the view are
+    # reported too.
+    result = await db.execute(
+        ticket_list_query()
+        .add_columns(TicketListView.changed_at, and_(true(), *conditions).label("matches_filters"))
+        .where(tuple_(TicketListView.changed_at, TicketListView.id) > ticket_position)
+        .order_by(TicketListView.changed_at.asc(), TicketListView.id.asc())
+        .limit(limit + 1)
+    )
+    rows = list(result.all())
+    tickets_more = len(rows) > limit
+    rows = rows[:limit]
+
+    result = await db.execute(
+        select(TicketTombstone.id, TicketTombstone.ticket_id, TicketTombstone.deleted_at)
+        .where(tuple_(TicketTombstone.deleted_at, TicketTombstone.id) > tombstone_position)
+        .order_by(TicketTombstone.deleted_at.asc(), TicketTombstone.id.asc())
+        .limit(limit + 1)
+    )
+    tombstones = list(result.all())
+    tombstones_more = len(tombstones) > limit
+    tombstones = tombstones[:limit]
+
+    # A full page is consumed exactly; otherwise everything up to the settle
+    # line has been seen, and anything newer is re-sent by the next call.
+    # Never past the settle line: a transaction still open may yet commit a
+    # change dated before it.
+    next_ticket_position = (
+        min((rows[-1].changed_at, rows[-1].id), settled) if tickets_more else settled
+    )
+    next_tombstone_position = (
+        min((tombstones[-1].deleted_at, tombstones[-1].id), settled) if tombstones_more else settled
+    )
+    # A page that ran past the settle line ends this round; asking again
+    # right away would return the same page
+    tickets_more = tickets_more and next_ticket_position < settled
+    tombstones_more = tombstones_more and next_tombstone_position < settled
+
+    removed = [row.id for row in rows if not row.matches_filters]
+    removed += [tombstone.ticket_id for tombstone in tombstones]
+
+    return TicketChangesResponse(
+        items=[serialize_ticket_list_row(row) for row in rows if row.matches_filters],
+        removed=removed,
+        watermark=encode_watermark(next_ticket_position, next_tombstone_position),
+        has_more=tickets_more or tombstones_more,
     )
 
 
@@ -224,165 +397,399 @@ async def create_ticket(
         ticket_id=ticket.id,
         user_id=current_user.id,
         action="created",
-        new_value=json.dumps({"ticket_number": ticket_number}),
+        new_value={"ticket_number": ticket_number},
     )
     db.add(history)
 
     await db.commit()
 
-    # Reload ticket with all relationships properly loaded (including Station.operator)
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station).selectinload(Station.operator),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket.id)
-    )
-    ticket = result.scalar_one()
+    # Load the relations the response and notifications read, in one query
+    ticket = await _load_ticket_snapshot(db, ticket.id)
+
+    await publish_event("ticket.created", ticket_event_data(ticket))
 
     # Send notification about new ticket
     from app.services.notification_service import NotificationService
     notification_service = NotificationService(db)
     await notification_service.notify_ticket_created(ticket)
 
-    return await _build_ticket_response(ticket, db)
+    return _build_ticket_response(ticket)
 
 
 @router.get("/export")
 async def export_tickets(
     db: DbSession,
     current_user: CurrentUser,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    assigned_user_id: Optional[int] = None,
+    assigned_department_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    station_id: Optional[int] = None,
+    operator_id: Optional[int] = None,
+    created_by_id: Optional[int] = None,
+    incident_type: Optional[str] = None,
+    my_tickets: bool = False,
+    delegated_to_me: bool = False,
 ):
-    """Export tickets to Excel file with all ticket data"""
+    """Export tickets to Excel file with all ticket data.
+
+    Accepts the same filters as ``GET /tickets``. The workbook is built in
+    batches with constant memory and streamed to the client.
+    """
+    conditions, _ = ticket_filter_conditions(
+        current_user,
+        search=search,
+        status=status,
+        priority=priority,
+        category=category,
+        assigned_user_id=assigned_user_id,
+        assigned_department_id=assigned_department_id,
+        department_id=department_id,
+        station_id=station_id,
+        operator_id=operator_id,
+        created_by_id=created_by_id,
+        incident_type=incident_type,
+        my_tickets=my_tickets,
+        delegated_to_me=delegated_to_me,
+    )
+
+    filename = f"tickets_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+
+    return StreamingResponse(
+        stream_ticket_export(conditions),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+@router.post("/exports", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    job_data: ExportJobCreate,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """Queue a background export of the tickets matching the filters.
+
+    The file is built by the Celery worker; poll ``GET /tickets/exports/{id}``
+    for progress and download it once ``status`` is ``completed``.
+    """
+    job = ExportJob(
+        user_id=current_user.id,
+        file_format=job_data.file_format,
+        filters=job_data.model_dump(exclude={"file_format"}, exclude_defaults=True),
+        status="pending",
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+
+    from app.notifications.tasks import export_tickets_job
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment
-        from io import BytesIO
-        
-        query = (
-            select(Ticket)
-            .options(
-                selectinload(Ticket.station).selectinload(Station.operator),
-                selectinload(Ticket.assigned_user),
-                selectinload(Ticket.assigned_department),
-                selectinload(Ticket.created_by),
+        export_tickets_job.delay(job.id)
+    except Exception as e:
+        logger.error(f"Could not queue export job {job.id}: {e}", exc_info=True)
+        job.status = "failed"
+        job.error = "Export queue is unavailable"
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Export queue is unavailable",
+        )
+
+    return _build_export_job_response(job)
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: int,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """Get status and progress of an export job."""
+    job = await _get_own_export_job(db, job_id, current_user)
+    return _build_export_job_response(job)
+
+
+@router.get("/exports/{job_id}/download")
+async def download_export_job(
+    job_id: int,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """Download the file of a completed export job."""
+    job = await _get_own_export_job(db, job_id, current_user)
+
+    if job.status != "completed" or not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export file not available",
+        )
+
+    media_types = {
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "csv": "text/csv",
+    }
+    created = job.created_at.strftime("%Y%m%d_%H%M%S")
+    return FileResponse(
+        path=job.file_path,
+        filename=f"tickets_export_{created}.{job.file_format}",
+        media_type=media_types[job.file_format],
+    )
+
+
+async def _get_own_export_job(db: AsyncSession, job_id: int, current_user: User) -> ExportJob:
+    """Export job of the current user (admins see all)."""
+    job = await db.get(ExportJob, job_id)
+    if not job or (job.user_id != current_user.id and not current_user.is_admin):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found",
+        )
+    return job
+
+
+def _build_export_job_response(job: ExportJob) -> ExportJobResponse:
+    response = ExportJobResponse.model_validate(job)
+    if job.status == "completed":
+        response.download_url = f"/api/v1/tickets/exports/{job.id}/download"
+    return response
+
+
+@router.post("/bulk", response_model=TicketBulkResponse)
+async def bulk_update_tickets(
+    operation: TicketBulkOperation,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """Change status, assignee or department of many tickets at once.
+
+    Needs the permission of the matching single-ticket endpoint. Tickets are
+    updated set-based in one transaction; ids that do not exist are reported
+    per id and do not fail the others.
+    """
+    from app.core.permissions import check_permission
+
+    permission_code, event_type, _ = BULK_ACTIONS[operation.action]
+    if not await check_permission(current_user, permission_code, db):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission denied: {permission_code}",
+        )
+
+    if operation.action == "delegate":
+        department = await db.get(Department, operation.assigned_department_id)
+        if not department:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Department not found",
             )
-            .order_by(Ticket.created_at.desc())
+    if operation.action in ("assign", "delegate"):
+        await _get_assignee(db, operation.assigned_user_id)
+
+    tickets, old_values = await TicketBulkService(db).apply(operation, current_user)
+    await db.commit()
+
+    old_key = {
+        "status": ("old_status", "status"),
+        "assign": ("old_assigned_user_id", "assigned_user_id"),
+        "delegate": ("old_assigned_department_id", "assigned_department_id"),
+    }[operation.action]
+    # One event for the whole batch: one per ticket would cost a Redis round
+    # trip each and make every open ticket list refetch once per ticket.
+    # ``event`` names the single-ticket event each item stands for.
+    if tickets:
+        await publish_event(
+            "tickets.bulk_updated",
+            {
+                "action": operation.action,
+                "event": event_type,
+                "tickets": [
+                    {
+                        **ticket_event_data(ticket),
+                        old_key[0]: getattr(old_values[ticket.id], old_key[1]),
+                    }
+                    for ticket in tickets
+                ],
+            },
         )
 
-        result = await db.execute(query)
-        tickets = result.scalars().all()
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Tickets"
-
-        headers = [
-            "Номер тікету", "Заголовок", "Опис", "Категорія", "Пріоритет", "Статус",
-            "Тип інциденту", "Тип клієнта", "Джерело звернення",
-            "Номер станції", "Назва станції", "ID станції", "Адреса станції", "Власник станції",
-            "Тип порту", "Модель авто",
-            "Ім'я заявника", "Телефон заявника", "Email заявника",
-            "Відповідальний", "Відділ", "Створив",
-            "Дата створення", "Дата оновлення", "Дата вирішення", "Дата закриття",
-            "SLA дедлайн", "SLA порушено", "Логи станції",
-        ]
-
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
-        
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        for row_num, ticket in enumerate(tickets, 2):
-            station_number = ticket.station.station_number if ticket.station else ""
-            station_name = ticket.station.name if ticket.station else ""
-            station_id = ticket.station.station_id if ticket.station else ""
-            station_address = ticket.station.address if ticket.station else ""
-            station_operator = ticket.station.operator.name if ticket.station and ticket.station.operator else ""
-            
-            row_data = [
-                ticket.ticket_number, ticket.title, ticket.description,
-                ticket.category, ticket.priority, ticket.status,
-                ticket.incident_type or "", ticket.client_type or "", ticket.contact_source or "",
-                station_number, station_name, station_id, station_address, station_operator,
-                ticket.port_type or "", ticket.vehicle or "",
-                ticket.reporter_name or "", ticket.reporter_phone or "", ticket.reporter_email or "",
-                f"{ticket.assigned_user.first_name} {ticket.assigned_user.last_name}" if ticket.assigned_user else "",
-                ticket.assigned_department.name if ticket.assigned_department else "",
-                f"{ticket.created_by.first_name} {ticket.created_by.last_name}" if ticket.created_by else "",
-                ticket.created_at.strftime("%d.%m.%Y %H:%M") if ticket.created_at else "",
-                ticket.updated_at.strftime("%d.%m.%Y %H:%M") if ticket.updated_at else "",
-                ticket.resolved_at.strftime("%d.%m.%Y %H:%M") if ticket.resolved_at else "",
-                ticket.closed_at.strftime("%d.%m.%Y %H:%M") if ticket.closed_at else "",
-                ticket.sla_due_date.strftime("%d.%m.%Y %H:%M") if ticket.sla_due_date else "",
-                "Так" if ticket.sla_breached else "Ні",
-                ticket.station_logs or "",
-            ]
-            
-            for col_num, value in enumerate(row_data, 1):
-                ws.cell(row=row_num, column=col_num, value=value)
-
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
-
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
-        from fastapi.responses import StreamingResponse
-        filename = f"tickets_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        
-        return StreamingResponse(
-            output,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+    if tickets and operation.action != "assign":
+        await NotificationService(db).notify_tickets_bulk_updated(
+            operation.action, tickets, old_values, current_user
         )
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
+
+    return TicketBulkResponse(
+        results=[
+            TicketBulkItemResult(ticket_id=ticket_id, ok=True)
+            if ticket_id in old_values
+            else TicketBulkItemResult(ticket_id=ticket_id, ok=False, error="Ticket not found")
+            for ticket_id in dict.fromkeys(operation.ticket_ids)
+        ],
+        updated=len(tickets),
+    )
+
+
+@router.post("/queue/claim", response_model=TicketResponse)
+async def claim_next_ticket(
+    db: DbSession,
+    current_user: Annotated[User, Depends(PermissionRequired("tickets.assign"))],
+):
+    """Assign the next unassigned ticket of the caller's department to the caller.
+
+    Picks the highest-priority, oldest open ticket nobody is assigned to.
+    ``FOR UPDATE SKIP LOCKED`` makes concurrent callers take different
+    tickets instead of waiting on (or double-assigning) the same one.
+    """
+    if current_user.department_id is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Export failed: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no department",
         )
 
+    priority_rank = case(
+        {priority: rank for rank, priority in enumerate(CLAIM_PRIORITY_ORDER)},
+        value=Ticket.priority,
+        else_=len(CLAIM_PRIORITY_ORDER),
+    )
+    result = await db.execute(
+        select(Ticket.id)
+        .where(
+            Ticket.assigned_department_id == current_user.department_id,
+            Ticket.assigned_user_id.is_(None),
+            Ticket.status.in_(CLAIM_STATUSES),
+        )
+        .order_by(priority_rank, Ticket.created_at, Ticket.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    ticket_id = result.scalar()
+    if ticket_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No unassigned tickets in the queue",
+        )
 
-@router.get("/{ticket_id}", response_model=TicketDetailResponse)
-async def get_ticket(
-    ticket_id: int,
+    # Already locked by this transaction, so nobody can assign it meanwhile
+    ticket = await _load_ticket_snapshot(db, ticket_id)
+    ticket.assigned_user = current_user
+    if ticket.status == "new":
+        ticket.status = "in_progress"
+
+    history = TicketHistory(
+        ticket_id=ticket.id,
+        user_id=current_user.id,
+        action="assigned",
+        old_value={"assigned_user_id": None},
+        new_value={"assigned_user_id": current_user.id},
+    )
+    db.add(history)
+
+    await db.commit()
+
+    await publish_event(
+        "ticket.assigned",
+        {**ticket_event_data(ticket), "old_assigned_user_id": None},
+    )
+
+    return _build_ticket_response(ticket)
+
+
+@router.get("/batch", response_model=TicketBatchResponse)
+async def get_tickets_batch(
     db: DbSession,
     current_user: CurrentUser,
+    ids: str = Query(..., description="Comma-separated ticket ids"),
+    fields: Optional[str] = Query(None, description="Comma-separated ticket fields to return"),
 ):
-    """Get a specific ticket with all details."""
+    """Fetch many tickets by id in one round trip.
+
+    All tickets come from one ``IN`` query. Deferred text columns and the
+    related station, users and department are loaded only when ``fields``
+    asks for them, once for the whole batch. Ids that do not exist are
+    listed in ``missing``.
+    """
+    try:
+        ticket_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be comma-separated integers",
+        )
+    if not ticket_ids or len(ticket_ids) > TICKET_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pass between 1 and {TICKET_BATCH_MAX_IDS} ids",
+        )
+    fieldset = parse_fieldset(fields, TicketResponse.model_fields)
+
     result = await db.execute(
         select(Ticket)
-        .options(
-            selectinload(Ticket.station).selectinload(Station.operator),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-            selectinload(Ticket.comments).selectinload(TicketComment.user),
-            selectinload(Ticket.attachments).selectinload(TicketAttachment.uploaded_by),
-            selectinload(Ticket.history).selectinload(TicketHistory.user),
-            selectinload(Ticket.logs),
-        )
-        .where(Ticket.id == ticket_id)
+        .options(*_ticket_field_options(fieldset))
+        .where(Ticket.id.in_(ticket_ids))
     )
-    ticket = result.scalar_one_or_none()
+    tickets = {ticket.id: ticket for ticket in result.unique().scalars().all()}
+
+    visible_comments = None
+    if "comments_count" in fieldset and tickets:
+        from app.core.permissions import check_permission
+
+        if not await check_permission(current_user, "tickets.view_internal_comments", db):
+            # The stored counters include internal comments this user cannot see
+            counts = await db.execute(
+                select(TicketComment.ticket_id, func.count())
+                .where(
+                    TicketComment.ticket_id.in_(list(tickets)),
+                    TicketComment.is_internal == False,
+                )
+                .group_by(TicketComment.ticket_id)
+            )
+            visible_comments = dict(counts.all())
+
+    items = []
+    for ticket_id in ticket_ids:
+        ticket = tickets.get(ticket_id)
+        if ticket is None:
+            continue
+        item = _ticket_fields(ticket, fieldset)
+        if visible_comments is not None:
+            item["comments_count"] = visible_comments.get(ticket_id, 0)
+        items.append(item)
+
+    return TicketBatchResponse(
+        items=items,
+        missing=[ticket_id for ticket_id in ticket_ids if ticket_id not in tickets],
+    )
+
+
+@router.get("/{ticket_id}", response_model=TicketDetailResponse)
+async def get_ticket(
+    ticket_id: int,
+    db: DbSession,
+    current_user: CurrentUser,
+    include: Optional[str] = None,
+    section_limit: Optional[int] = Query(None, ge=1, le=200),
+):
+    """Get a specific ticket with all details.
+
+    ``include`` is a comma-separated subset of comments, attachments, history
+    and logs (default: all); sections left out are returned as ``null``.
+    With ``section_limit`` each section holds only its first N items and a
+    ``*_next_cursor`` for fetching the rest from the section's own endpoint.
+    """
+    sections = TICKET_DETAIL_SECTIONS
+    if include is not None:
+        sections = [s.strip() for s in include.split(",") if s.strip()]
+        unknown = set(sections) - set(TICKET_DETAIL_SECTIONS)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown sections: {', '.join(sorted(unknown))}",
+            )
+
+    ticket = await _load_ticket_snapshot(db, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -390,7 +797,9 @@ async def get_ticket(
             detail="Ticket not found",
         )
 
-    return await _build_ticket_detail_response(ticket, db, current_user)
+    return await _build_ticket_detail_response(
+        ticket, db, current_user, sections, section_limit
+    )
 
 
 @router.put("/{ticket_id}", response_model=TicketResponse)
@@ -401,17 +810,7 @@ async def update_ticket(
     current_user: Annotated[User, Depends(PermissionRequired("tickets.edit"))],
 ):
     """Update a ticket."""
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket_id)
-    )
-    ticket = result.scalar_one_or_none()
+    ticket = await _load_ticket_snapshot(db, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -431,32 +830,39 @@ async def update_ticket(
             new_values[field] = value
         setattr(ticket, field, value)
 
+    if "station_id" in new_values:
+        # Keep the snapshot's station in step with the new foreign key
+        station = None
+        if new_values["station_id"] is not None:
+            station = await db.get(
+                Station, new_values["station_id"], options=[joinedload(Station.operator)]
+            )
+            if not station:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Station not found",
+                )
+        ticket.station = station
+
     if old_values:
         history = TicketHistory(
             ticket_id=ticket.id,
             user_id=current_user.id,
             action="updated",
-            old_value=json.dumps(old_values, default=str),
-            new_value=json.dumps(new_values, default=str),
+            old_value=old_values,
+            new_value=new_values,
         )
         db.add(history)
 
     await db.commit()
 
-    # Reload ticket with all relationships properly loaded (including Station.operator)
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station).selectinload(Station.operator),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
+    if old_values:
+        await publish_event(
+            "ticket.updated",
+            {**ticket_event_data(ticket), "fields": list(new_values.keys())},
         )
-        .where(Ticket.id == ticket.id)
-    )
-    ticket = result.scalar_one()
 
-    return await _build_ticket_response(ticket, db)
+    return _build_ticket_response(ticket)
 
 
 @router.delete("/{ticket_id}")
@@ -483,9 +889,25 @@ async def delete_ticket(
                 detail="Only new or closed tickets can be deleted",
             )
 
+    # Logs and attachments go with the ticket; release the files they point at
+    blob_store = BlobStore(db)
+    files_result = await db.execute(
+        select(TicketAttachment.sha256, TicketAttachment.file_path)
+        .where(TicketAttachment.ticket_id == ticket_id)
+        .union_all(
+            select(TicketLog.sha256, TicketLog.file_path).where(TicketLog.ticket_id == ticket_id)
+        )
+    )
+    for sha256, file_path in files_result.all():
+        await blob_store.release(sha256, file_path)
+
+    # Tombstone lets delta-sync clients drop the ticket from their view
+    db.add(TicketTombstone(ticket_id=ticket.id, ticket_number=ticket.ticket_number))
     await db.delete(ticket)
     await db.commit()
 
+    await publish_event("ticket.deleted", {"ticket_id": ticket_id})
+
     return {"message": "Ticket deleted successfully"}
 
 
@@ -497,17 +919,7 @@ async def update_ticket_status(
     current_user: Annotated[User, Depends(PermissionRequired("tickets.change_status"))],
 ):
     """Update ticket status."""
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket_id)
-    )
-    ticket = result.scalar_one_or_none()
+    ticket = await _load_ticket_snapshot(db, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -532,8 +944,8 @@ async def update_ticket_status(
         ticket_id=ticket.id,
         user_id=current_user.id,
         action="status_changed",
-        old_value=json.dumps({"status": old_status}),
-        new_value=json.dumps({"status": status_data.status}),
+        old_value={"status": old_status},
+        new_value={"status": status_data.status},
     )
     db.add(history)
 
@@ -546,31 +958,23 @@ async def update_ticket_status(
             is_internal=True,
         )
         db.add(comment)
+        await TicketService(db).adjust_counters(ticket.id, comments=1)
 
     await db.commit()
 
+    await publish_event(
+        "ticket.status_changed",
+        {**ticket_event_data(ticket), "old_status": old_status},
+    )
+
     # Send notification on any status change
     if old_status != status_data.status:
-        from app.services.notification_service import NotificationService
         notification_service = NotificationService(db)
         await notification_service.notify_ticket_status_changed(
             ticket, old_status, status_data.status, current_user
         )
 
-    # Reload ticket with all relationships properly loaded (including Station.operator)
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station).selectinload(Station.operator),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket.id)
-    )
-    ticket = result.scalar_one()
-
-    return await _build_ticket_response(ticket, db)
+    return _build_ticket_response(ticket)
 
 
 @router.put("/{ticket_id}/assign", response_model=TicketResponse)
@@ -581,17 +985,7 @@ async def assign_ticket(
     current_user: Annotated[User, Depends(PermissionRequired("tickets.assign"))],
 ):
     """Assign ticket to a user."""
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket_id)
-    )
-    ticket = result.scalar_one_or_none()
+    ticket = await _load_ticket_snapshot(db, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -600,7 +994,7 @@ async def assign_ticket(
         )
 
     old_assigned = ticket.assigned_user_id
-    ticket.assigned_user_id = assign_data.assigned_user_id
+    ticket.assigned_user = await _get_assignee(db, assign_data.assigned_user_id)
 
     # Update status if new
     if ticket.status == "new":
@@ -611,8 +1005,8 @@ async def assign_ticket(
         ticket_id=ticket.id,
         user_id=current_user.id,
         action="assigned",
-        old_value=json.dumps({"assigned_user_id": old_assigned}),
-        new_value=json.dumps({"assigned_user_id": assign_data.assigned_user_id}),
+        old_value={"assigned_user_id": old_assigned},
+        new_value={"assigned_user_id": assign_data.assigned_user_id},
     )
     db.add(history)
 
@@ -625,23 +1019,16 @@ async def assign_ticket(
             is_internal=False,
         )
         db.add(comment)
+        await TicketService(db).adjust_counters(ticket.id, comments=1)
 
     await db.commit()
 
-    # Reload ticket with all relationships properly loaded (including Station.operator)
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station).selectinload(Station.operator),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket.id)
+    await publish_event(
+        "ticket.assigned",
+        {**ticket_event_data(ticket), "old_assigned_user_id": old_assigned},
     )
-    ticket = result.scalar_one()
 
-    return await _build_ticket_response(ticket, db)
+    return _build_ticket_response(ticket)
 
 
 @router.put("/{ticket_id}/delegate", response_model=TicketResponse)
@@ -652,17 +1039,7 @@ async def delegate_ticket(
     current_user: Annotated[User, Depends(PermissionRequired("tickets.delegate"))],
 ):
     """Delegate ticket to another department with optional auto-assignment."""
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket_id)
-    )
-    ticket = result.scalar_one_or_none()
+    ticket = await _load_ticket_snapshot(db, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -671,10 +1048,8 @@ async def delegate_ticket(
         )
 
     # Verify department exists
-    dept_result = await db.execute(
-        select(Department).where(Department.id == delegate_data.assigned_department_id)
-    )
-    if not dept_result.scalar_one_or_none():
+    department = await db.get(Department, delegate_data.assigned_department_id)
+    if not department:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Department not found",
@@ -684,26 +1059,29 @@ async def delegate_ticket(
     old_user = ticket.assigned_user_id
     old_status = ticket.status
 
-    ticket.assigned_department_id = delegate_data.assigned_department_id
+    ticket.assigned_department = department
 
     # Assign user only if explicitly specified
     # If not specified, leave it empty so someone from the department can accept it
     assigned_user_id = delegate_data.assigned_user_id
-    ticket.assigned_user_id = assigned_user_id
+    assigned_user = await _get_assignee(db, assigned_user_id)
+    ticket.assigned_user = assigned_user
+    ticket.delegated_to_user_id = assigned_user_id
+    ticket.last_delegated_at = datetime.utcnow()
 
     # Add history entry
     history = TicketHistory(
         ticket_id=ticket.id,
         user_id=current_user.id,
         action="delegated",
-        old_value=json.dumps({
+        old_value={
             "assigned_department_id": old_dept,
             "assigned_user_id": old_user,
-        }),
-        new_value=json.dumps({
+        },
+        new_value={
             "assigned_department_id": delegate_data.assigned_department_id,
             "assigned_user_id": assigned_user_id,
-        }),
+        },
     )
     db.add(history)
 
@@ -716,49 +1094,27 @@ async def delegate_ticket(
             is_internal=False,
         )
         db.add(comment)
+        await TicketService(db).adjust_counters(ticket.id, comments=1)
 
     await db.commit()
 
+    await publish_event(
+        "ticket.delegated",
+        {**ticket_event_data(ticket), "old_assigned_department_id": old_dept},
+    )
+
+    # Notifications read the same snapshot; no reloads
+    notification_service = NotificationService(db)
+
     # Send notification to assigned user
-    if assigned_user_id and assigned_user_id != old_user:
-        notification_service = NotificationService(db)
-        assigned_user = await db.get(User, assigned_user_id)
-        if assigned_user:
-            # Reload ticket for notification
-            result = await db.execute(
-                select(Ticket)
-                .options(selectinload(Ticket.created_by))
-                .where(Ticket.id == ticket.id)
-            )
-            ticket_for_notif = result.scalar_one()
-            await notification_service.notify_ticket_assigned(ticket_for_notif, assigned_user)
+    if assigned_user and assigned_user_id != old_user:
+        await notification_service.notify_ticket_assigned(ticket, assigned_user)
 
     # Notify new department about delegated ticket
     if old_dept != delegate_data.assigned_department_id:
-        notification_service = NotificationService(db)
-        # Reload ticket for notification
-        result = await db.execute(
-            select(Ticket)
-            .options(selectinload(Ticket.created_by), selectinload(Ticket.assigned_department))
-            .where(Ticket.id == ticket.id)
-        )
-        ticket_for_notif = result.scalar_one()
-        await notification_service.notify_ticket_created(ticket_for_notif)
+        await notification_service.notify_ticket_created(ticket)
 
-    # Reload ticket with all relationships properly loaded (including Station.operator)
-    result = await db.execute(
-        select(Ticket)
-        .options(
-            selectinload(Ticket.station).selectinload(Station.operator),
-            selectinload(Ticket.assigned_user),
-            selectinload(Ticket.assigned_department),
-            selectinload(Ticket.created_by),
-        )
-        .where(Ticket.id == ticket.id)
-    )
-    ticket = result.scalar_one()
-
-    return await _build_ticket_response(ticket, db)
+    return _build_ticket_response(ticket)
 
 
 @router.post("/{ticket_id}/comments", response_model=TicketCommentResponse, status_code=status.HTTP_201_CREATED)
@@ -795,13 +1151,19 @@ async def add_comment(
         ticket_id=ticket_id,
         user_id=current_user.id,
         action="commented",
-        new_value=json.dumps({"is_internal": comment_data.is_internal}),
+        new_value={"is_internal": comment_data.is_internal},
     )
     db.add(history)
+    await TicketService(db).adjust_counters(ticket_id, comments=1)
 
     await db.commit()
     await db.refresh(comment, ["user"])
 
+    await publish_event(
+        "ticket.commented",
+        {"ticket_id": ticket_id, "comment_id": comment.id, "is_internal": comment.is_internal},
+    )
+
     # Send notification about new comment
     notification_service = NotificationService(db)
     await notification_service.notify_ticket_commented(ticket, current_user, comment_data.is_internal)
@@ -812,12 +1174,19 @@ async def add_comment(
 @router.get("/{ticket_id}/comments", response_model=list[TicketCommentResponse])
 async def get_comments(
     ticket_id: int,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
 ):
-    """Get all comments for a ticket."""
+    """Get comments for a ticket, oldest first.
+
+    With ``limit`` the result is paged; the next page's cursor is returned
+    in the ``X-Next-Cursor`` header.
+    """
     # Verify ticket exists
-    ticket_result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
+    ticket_result = await db.execute(select(Ticket.id).where(Ticket.id == ticket_id))
     if not ticket_result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -826,25 +1195,17 @@ async def get_comments(
 
     # Check if user can see internal comments
     from app.core.permissions import check_permission
-    can_view_internal = await check_permission(
-        current_user, "tickets.view_internal_comments", db
-    )
-
-    query = (
-        select(TicketComment)
-        .options(selectinload(TicketComment.user))
-        .where(TicketComment.ticket_id == ticket_id)
-    )
-
-    if not can_view_internal:
-        query = query.where(TicketComment.is_internal == False)
-
-    query = query.order_by(TicketComment.created_at)
+    can_view_internal = await check_permission(
+        current_user, "tickets.view_internal_comments", db
+    )
 
-    result = await db.execute(query)
-    comments = result.scalars().all()
+    items, next_cursor = await _fetch_ticket_section(
+        db, "comments", ticket_id, limit, cursor, can_view_internal
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    return [TicketCommentResponse.model_validate(c) for c in comments]
+    return [TicketCommentResponse.model_validate(item) for item in items]
 
 
 @router.put("/{ticket_id}/comments/{comment_id}", response_model=TicketCommentResponse)
@@ -894,6 +1255,7 @@ async def delete_comment(
 
     # Parse comment content for attachment markers [📷 filename] and [📎 filename]
     filenames = re.findall(r'\[(?:📷|📎)\s+([^\]]+)\]', comment.content or '')
+    attachments_to_delete = []
     if filenames:
         att_result = await db.execute(
             select(TicketAttachment).where(
@@ -902,12 +1264,15 @@ async def delete_comment(
             )
         )
         attachments_to_delete = att_result.scalars().all()
+        blob_store = BlobStore(db)
         for att in attachments_to_delete:
-            if os.path.exists(att.file_path):
-                os.remove(att.file_path)
+            await blob_store.release(att.sha256, att.file_path)
             await db.delete(att)
 
     await db.delete(comment)
+    await TicketService(db).adjust_counters(
+        ticket_id, comments=-1, attachments=-len(attachments_to_delete)
+    )
     await db.commit()
     return {"message": "Comment deleted"}
 
@@ -915,41 +1280,267 @@ async def delete_comment(
 @router.get("/{ticket_id}/history", response_model=list[TicketHistoryResponse])
 async def get_history(
     ticket_id: int,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
 ):
-    """Get ticket history."""
+    """Get ticket history, newest first.
+
+    With ``limit`` the result is paged; the next page's cursor is returned
+    in the ``X-Next-Cursor`` header.
+    """
     # Verify ticket exists
-    ticket_result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
+    ticket_result = await db.execute(select(Ticket.id).where(Ticket.id == ticket_id))
     if not ticket_result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found",
         )
 
-    result = await db.execute(
-        select(TicketHistory)
-        .options(selectinload(TicketHistory.user))
-        .where(TicketHistory.ticket_id == ticket_id)
-        .order_by(TicketHistory.created_at.desc())
+    items, next_cursor = await _fetch_ticket_section(
+        db, "history", ticket_id, limit, cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return [TicketHistoryResponse.model_validate(item) for item in items]
+
+
+TICKET_DETAIL_SECTIONS = ["comments", "attachments", "history", "logs"]
+
+
+def _ticket_section_query(section: str, ticket_id: int):
+    """Base query, sort column, id column and whether newest comes first."""
+    if section == "comments":
+        query = (
+            select(TicketComment)
+            .options(selectinload(TicketComment.user))
+            .where(TicketComment.ticket_id == ticket_id)
+        )
+        return query, TicketComment.created_at, TicketComment.id, False
+    if section == "attachments":
+        query = (
+            select(TicketAttachment)
+            .options(selectinload(TicketAttachment.uploaded_by))
+            .where(TicketAttachment.ticket_id == ticket_id)
+        )
+        return query, TicketAttachment.uploaded_at, TicketAttachment.id, True
+    if section == "history":
+        query = (
+            select(TicketHistory)
+            .options(selectinload(TicketHistory.user))
+            .where(TicketHistory.ticket_id == ticket_id)
+        )
+        return query, TicketHistory.created_at, TicketHistory.id, True
+    query = select(TicketLog).where(TicketLog.ticket_id == ticket_id)
+    return query, TicketLog.collected_at, TicketLog.id, True
+
+
+async def _fetch_ticket_section(
+    db: AsyncSession,
+    section: str,
+    ticket_id: int,
+    limit: Optional[int],
+    cursor: Optional[str],
+    can_view_internal: bool = True,
+) -> tuple[list, Optional[str]]:
+    """Items of a ticket detail section and the cursor of the next page.
+
+    Comments are oldest first, the other sections newest first. Without
+    ``limit`` the whole section is returned and the cursor is ``None``.
+    """
+    query, sort_column, id_column, descending = _ticket_section_query(section, ticket_id)
+    if section == "comments" and not can_view_internal:
+        query = query.where(TicketComment.is_internal == False)
+
+    sort_key = tuple_(sort_column, id_column)
+    if cursor:
+        position = decode_cursor(cursor)
+        after = (position[0], position[1])
+        query = query.where(sort_key < after if descending else sort_key > after)
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    if limit:
+        query = query.limit(limit + 1)
+
+    result = await db.execute(query)
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if limit and len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), last.id)
+    return items, next_cursor
+
+
+# Timeline item kind -> (detail section, response schema). The order breaks
+# ties between kinds written in the same transaction (same timestamp).
+TIMELINE_KINDS = {
+    "history": ("history", TicketHistoryResponse),
+    "comment": ("comments", TicketCommentResponse),
+    "attachment": ("attachments", TicketAttachmentResponse),
+    "log": ("logs", TicketLogResponse),
+}
+TIMELINE_KIND_RANKS = {kind: rank for rank, kind in enumerate(TIMELINE_KINDS)}
+
+
+@router.get("/{ticket_id}/timeline", response_model=TicketTimelineResponse)
+async def get_ticket_timeline(
+    ticket_id: int,
+    db: DbSession,
+    current_user: CurrentUser,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+):
+    """Comments, history, attachments and logs of a ticket as one stream.
+
+    Each kind is read with a bounded keyset scan on its (ticket_id, time, id)
+    index and the scans are k-way merged by (time, kind, id), so a page costs
+    one query per kind no matter how long the ticket's history is.
+    """
+    ticket_result = await db.execute(select(Ticket.id).where(Ticket.id == ticket_id))
+    if not ticket_result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found",
+        )
+
+    from app.core.permissions import check_permission
+    can_view_internal = await check_permission(
+        current_user, "tickets.view_internal_comments", db
+    )
+
+    descending = order == "desc"
+    position = decode_timeline_cursor(cursor) if cursor else None
+    if position and position[1] not in TIMELINE_KINDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    streams = []
+    for kind, (section, schema) in TIMELINE_KINDS.items():
+        query, sort_column, id_column, _ = _ticket_section_query(section, ticket_id)
+        if section == "comments" and not can_view_internal:
+            query = query.where(TicketComment.is_internal == False)
+
+        if position:
+            # Resume strictly after (time, kind rank, id) of the cursor
+            after_time, after_kind, after_id = position
+            rank, after_rank = TIMELINE_KIND_RANKS[kind], TIMELINE_KIND_RANKS[after_kind]
+            if rank == after_rank:
+                sort_key = tuple_(sort_column, id_column)
+                after = (after_time, after_id)
+                query = query.where(sort_key < after if descending else sort_key > after)
+            elif (rank < after_rank) == descending:
+                query = query.where(sort_column <= after_time if descending else sort_column >= after_time)
+            else:
+                query = query.where(sort_column < after_time if descending else sort_column > after_time)
+
+        if descending:
+            query = query.order_by(sort_column.desc(), id_column.desc())
+        else:
+            query = query.order_by(sort_column.asc(), id_column.asc())
+
+        result = await db.execute(query.limit(limit + 1))
+        rank = TIMELINE_KIND_RANKS[kind]
+        streams.append([
+            (getattr(item, sort_column.key), rank, item.id, kind, schema, item)
+            for item in result.scalars().all()
+        ])
+
+    merged = heapq.merge(*streams, key=lambda entry: entry[:3], reverse=descending)
+    entries = [entry for _, entry in zip(range(limit + 1), merged)]
+
+    next_cursor = None
+    if len(entries) > limit:
+        entries = entries[:limit]
+        timestamp, _, item_id, kind, _, _ = entries[-1]
+        next_cursor = encode_timeline_cursor(timestamp, kind, item_id)
+
+    items = [
+        TicketTimelineItem(
+            kind=kind,
+            id=item_id,
+            timestamp=timestamp,
+            **{kind: schema.model_validate(item)},
+        )
+        for timestamp, _, item_id, kind, schema, item in entries
+    ]
+    return TicketTimelineResponse(items=items, next_cursor=next_cursor)
+
+
+def _ticket_snapshot_options() -> tuple:
+    """Eager loads for every relation a write response or notification reads."""
+    return (
+        undefer(Ticket.description),
+        undefer(Ticket.station_logs),
+        joinedload(Ticket.station).joinedload(Station.operator),
+        joinedload(Ticket.assigned_user),
+        joinedload(Ticket.assigned_department),
+        joinedload(Ticket.created_by),
     )
-    history = result.scalars().all()
 
-    return [TicketHistoryResponse.model_validate(h) for h in history]
+
+async def _load_ticket_snapshot(db: AsyncSession, ticket_id: int) -> Optional[Ticket]:
+    """Load a ticket and its many-to-one relations in one SELECT.
+
+    Write endpoints mutate this snapshot, commit (the UPDATE returns the new
+    updated_at, see Ticket.__mapper_args__) and build the response and
+    notifications from it, so nothing is reloaded after commit.
+    """
+    result = await db.execute(
+        select(Ticket).options(*_ticket_snapshot_options()).where(Ticket.id == ticket_id)
+    )
+    return result.unique().scalar_one_or_none()
+
+
+def _ticket_field_options(fieldset: list[str]) -> list:
+    """Snapshot loads narrowed to the text columns and relations in a fieldset."""
+    options = [undefer(getattr(Ticket, name)) for name in ("description", "station_logs") if name in fieldset]
+    if "station" in fieldset:
+        options.append(joinedload(Ticket.station).joinedload(Station.operator))
+    for name in TICKET_RELATION_SCHEMAS:
+        if name in fieldset:
+            options.append(joinedload(getattr(Ticket, name)))
+    return options
+
+
+def _ticket_fields(ticket: Ticket, fieldset: list[str]) -> dict:
+    """TicketResponse fields of a ticket loaded with _ticket_field_options."""
+    item = {}
+    for name in fieldset:
+        if name == "station":
+            item[name] = _station_short(ticket.station)
+        elif name in TICKET_RELATION_SCHEMAS:
+            related = getattr(ticket, name)
+            item[name] = TICKET_RELATION_SCHEMAS[name].model_validate(related).model_dump() if related else None
+        else:
+            item[name] = getattr(ticket, name)
+    return item
 
 
-async def _build_ticket_response(ticket: Ticket, db: AsyncSession) -> TicketResponse:
-    """Build ticket response with counts."""
-    # Count comments
-    comments_count = (await db.execute(
-        select(func.count()).where(TicketComment.ticket_id == ticket.id)
-    )).scalar()
+async def _get_assignee(db: AsyncSession, user_id: Optional[int]) -> Optional[User]:
+    """User to assign, served from the identity map when already loaded."""
+    if user_id is None:
+        return None
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    return user
 
-    # Count attachments
-    attachments_count = (await db.execute(
-        select(func.count()).where(TicketAttachment.ticket_id == ticket.id)
-    )).scalar()
 
+def _build_ticket_response(ticket: Ticket) -> TicketResponse:
+    """Build ticket response; counts come from the ticket row."""
     response_dict = {
         "id": ticket.id,
         "ticket_number": ticket.ticket_number,
@@ -959,7 +1550,7 @@ async def _build_ticket_response(ticket: Ticket, db: AsyncSession) -> TicketResp
         "priority": ticket.priority,
         "status": ticket.status,
         "station_id": ticket.station_id,
-        "station": None,
+        "station": _station_short(ticket.station),
         "port_number": ticket.port_number,
         "reporter_name": ticket.reporter_name,
         "reporter_phone": ticket.reporter_phone,
@@ -977,8 +1568,8 @@ async def _build_ticket_response(ticket: Ticket, db: AsyncSession) -> TicketResp
         "sla_due_date": ticket.sla_due_date,
         "sla_breached": ticket.sla_breached,
         "ai_log_analysis": ticket.ai_log_analysis,
-        "comments_count": comments_count,
-        "attachments_count": attachments_count,
+        "comments_count": ticket.comments_count,
+        "attachments_count": ticket.attachments_count,
         # New fields from TZ
         "incident_type": ticket.incident_type,
         "port_type": ticket.port_type,
@@ -988,92 +1579,53 @@ async def _build_ticket_response(ticket: Ticket, db: AsyncSession) -> TicketResp
         "client_type": ticket.client_type,
     }
 
-    if ticket.station:
-        response_dict["station"] = {
-            "id": ticket.station.id,
-            "station_id": ticket.station.station_id,
-            "station_number": ticket.station.station_number,
-            "name": ticket.station.name,
-            "address": ticket.station.address,
-            "operator_name": ticket.station.operator.name if ticket.station.operator else "",
-        }
-
     return TicketResponse(**response_dict)
 
 
+def _station_short(station: Optional[Station]) -> Optional[dict]:
+    if not station:
+        return None
+    return {
+        "id": station.id,
+        "station_id": station.station_id,
+        "station_number": station.station_number,
+        "name": station.name,
+        "address": station.address,
+        "operator_name": station.operator.name if station.operator else "",
+    }
+
+
 async def _build_ticket_detail_response(
-    ticket: Ticket, db: AsyncSession, current_user: User
+    ticket: Ticket,
+    db: AsyncSession,
+    current_user: User,
+    sections: list[str],
+    section_limit: Optional[int] = None,
 ) -> TicketDetailResponse:
-    """Build detailed ticket response."""
+    """Build detailed ticket response with the requested sections."""
     from app.core.permissions import check_permission
 
     can_view_internal = await check_permission(
         current_user, "tickets.view_internal_comments", db
     )
 
-    # Filter internal comments if needed
-    comments = ticket.comments
-    if not can_view_internal:
-        comments = [c for c in comments if not c.is_internal]
+    response_dict = _build_ticket_response(ticket).model_dump()
 
-    response_dict = {
-        "id": ticket.id,
-        "ticket_number": ticket.ticket_number,
-        "title": ticket.title,
-        "description": ticket.description,
-        "category": ticket.category,
-        "priority": ticket.priority,
-        "status": ticket.status,
-        "station_id": ticket.station_id,
-        "station": None,
-        "port_number": ticket.port_number,
-        "reporter_name": ticket.reporter_name,
-        "reporter_phone": ticket.reporter_phone,
-        "reporter_email": ticket.reporter_email,
-        "assigned_user_id": ticket.assigned_user_id,
-        "assigned_user": ticket.assigned_user,
-        "assigned_department_id": ticket.assigned_department_id,
-        "assigned_department": ticket.assigned_department,
-        "created_by_id": ticket.created_by_id,
-        "created_by": ticket.created_by,
-        "created_at": ticket.created_at,
-        "updated_at": ticket.updated_at,
-        "resolved_at": ticket.resolved_at,
-        "closed_at": ticket.closed_at,
-        "sla_due_date": ticket.sla_due_date,
-        "sla_breached": ticket.sla_breached,
-        "ai_log_analysis": ticket.ai_log_analysis,
-        "comments_count": len(comments),
-        "attachments_count": len(ticket.attachments),
-        "comments": comments,
-        "attachments": ticket.attachments,
-        "history": sorted(ticket.history, key=lambda h: h.created_at, reverse=True),
-        "logs": ticket.logs,
-        # New fields from TZ
-        "incident_type": ticket.incident_type,
-        "port_type": ticket.port_type,
-        "contact_source": ticket.contact_source,
-        "station_logs": ticket.station_logs,
-        "vehicle": ticket.vehicle,
-        "client_type": ticket.client_type,
-    }
+    if not can_view_internal:
+        # The stored counter includes internal comments this user cannot see
+        response_dict["comments_count"] = (await db.execute(
+            select(func.count()).where(
+                TicketComment.ticket_id == ticket.id,
+                TicketComment.is_internal == False,
+            )
+        )).scalar()
 
-    if ticket.station:
-        response_dict["station"] = {
-            "id": ticket.station.id,
-            "station_id": ticket.station.station_id,
-            "station_number": ticket.station.station_number,
-            "name": ticket.station.name,
-            "address": ticket.station.address,
-            "operator_name": ticket.station.operator.name if ticket.station.operator else "",
-        }
-        response_dict["station"] = {
-            "id": ticket.station.id,
-            "station_id": ticket.station.station_id,
-            "name": ticket.station.name,
-            "address": ticket.station.address,
-            "operator_name": ticket.station.operator.name if ticket.station.operator else "",
-        }
+    for section in sections:
+        items, next_cursor = await _fetch_ticket_section(
+            db, section, ticket.id, section_limit, None, can_view_internal
+        )
+        response_dict[section] = items
+        response_dict[f"{section}_next_cursor"] = next_cursor
 
     return TicketDetailResponse(**response_dict)
 
@@ -1102,34 +1654,18 @@ async def upload_ticket_log(
             detail="Ticket not found",
         )
 
-    # Check file size
-    content = await file.read()
-    if len(content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE // (1024*1024)}MB",
-        )
-
-    # Create storage directory
-    storage_path = Path(settings.LOGS_STORAGE_PATH) / str(ticket_id)
-    storage_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate unique filename
-    file_ext = Path(file.filename).suffix if file.filename else ".log"
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = storage_path / unique_filename
-
-    # Save file
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content)
+    # Stream to disk in chunks, enforcing the size limit as it goes
+    stored = await store_upload(file, blob_incoming_dir(), "", settings.MAX_UPLOAD_SIZE)
+    stored = await BlobStore(db).add(stored)
 
     # Create log record
     log = TicketLog(
         ticket_id=ticket_id,
         log_type="manual",
-        filename=file.filename or unique_filename,
-        file_path=str(file_path),
-        file_size=len(content),
+        filename=file.filename or stored.path.name,
+        file_path=str(stored.path),
+        file_size=stored.size,
+        sha256=stored.sha256,
         station_id=ticket.station_id,
         log_start_time=log_start_time,
         log_end_time=log_end_time,
@@ -1142,7 +1678,7 @@ async def upload_ticket_log(
         ticket_id=ticket_id,
         user_id=current_user.id,
         action="log_uploaded",
-        new_value=json.dumps({"filename": file.filename}),
+        new_value={"filename": file.filename},
     )
     db.add(history)
 
@@ -1176,27 +1712,21 @@ async def upload_text_log(
             detail="Ticket not found",
         )
 
-    # Create storage directory
-    storage_path = Path(settings.LOGS_STORAGE_PATH) / str(ticket_id)
-    storage_path.mkdir(parents=True, exist_ok=True)
-
     # Generate unique filename
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     unique_filename = f"text_log_{timestamp}_{uuid.uuid4().hex[:8]}.log"
-    file_path = storage_path / unique_filename
 
-    # Save content to file
-    content_bytes = request.content.encode("utf-8")
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content_bytes)
+    # Save content to the blob store
+    stored = await BlobStore(db).add_bytes(request.content.encode("utf-8"))
 
     # Create log record
     log = TicketLog(
         ticket_id=ticket_id,
         log_type="text",
         filename=unique_filename,
-        file_path=str(file_path),
-        file_size=len(content_bytes),
+        file_path=str(stored.path),
+        file_size=stored.size,
+        sha256=stored.sha256,
         station_id=ticket.station_id,
         description=request.description or "Pasted text log",
     )
@@ -1207,7 +1737,7 @@ async def upload_text_log(
         ticket_id=ticket_id,
         user_id=current_user.id,
         action="log_uploaded",
-        new_value=json.dumps({"filename": unique_filename, "type": "text"}),
+        new_value={"filename": unique_filename, "type": "text"},
     )
     db.add(history)
 
@@ -1220,36 +1750,43 @@ async def upload_text_log(
 @router.get("/{ticket_id}/logs", response_model=list[TicketLogResponse])
 async def get_ticket_logs(
     ticket_id: int,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
 ):
-    """Get all logs for a ticket."""
+    """Get logs for a ticket, newest first.
+
+    With ``limit`` the result is paged; the next page's cursor is returned
+    in the ``X-Next-Cursor`` header.
+    """
     # Verify ticket exists
-    ticket_result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
+    ticket_result = await db.execute(select(Ticket.id).where(Ticket.id == ticket_id))
     if not ticket_result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found",
         )
 
-    result = await db.execute(
-        select(TicketLog)
-        .where(TicketLog.ticket_id == ticket_id)
-        .order_by(TicketLog.collected_at.desc())
+    items, next_cursor = await _fetch_ticket_section(
+        db, "logs", ticket_id, limit, cursor
     )
-    logs = result.scalars().all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    return [TicketLogResponse.model_validate(log) for log in logs]
+    return [TicketLogResponse.model_validate(item) for item in items]
 
 
 @router.get("/{ticket_id}/logs/{log_id}/download")
 async def download_ticket_log(
     ticket_id: int,
     log_id: int,
+    request: Request,
     db: DbSession,
     current_user: CurrentUser,
 ):
-    """Download a log file."""
+    """Download a log file; supports byte ranges and conditional requests."""
     result = await db.execute(
         select(TicketLog).where(
             TicketLog.id == log_id,
@@ -1270,10 +1807,12 @@ async def download_ticket_log(
             detail="Log file not found on disk",
         )
 
-    return FileResponse(
-        path=log.file_path,
-        filename=log.filename,
-        media_type="application/octet-stream",
+    return file_download_response(
+        request,
+        log.file_path,
+        log.filename,
+        "application/octet-stream",
+        sha256=log.sha256,
     )
 
 
@@ -1299,16 +1838,15 @@ async def delete_ticket_log(
             detail="Log not found",
         )
 
-    # Delete file from disk
-    if os.path.exists(log.file_path):
-        os.remove(log.file_path)
+    # Drop the file's reference; unshared content is collected later
+    await BlobStore(db).release(log.sha256, log.file_path)
 
     # Add history entry
     history = TicketHistory(
         ticket_id=ticket_id,
         user_id=current_user.id,
         action="log_deleted",
-        old_value=json.dumps({"filename": log.filename}),
+        old_value={"filename": log.filename},
     )
     db.add(history)
 
@@ -1399,27 +1937,73 @@ async def parse_customer_message(
 @router.get("/{ticket_id}/attachments", response_model=list[TicketAttachmentResponse])
 async def get_ticket_attachments(
     ticket_id: int,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
 ):
-    """Get all attachments for a ticket."""
+    """Get attachments for a ticket, newest first.
+
+    With ``limit`` the result is paged; the next page's cursor is returned
+    in the ``X-Next-Cursor`` header.
+    """
     # Verify ticket exists
-    ticket_result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
+    ticket_result = await db.execute(select(Ticket.id).where(Ticket.id == ticket_id))
     if not ticket_result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ticket not found",
         )
 
-    result = await db.execute(
-        select(TicketAttachment)
-        .options(selectinload(TicketAttachment.uploaded_by))
-        .where(TicketAttachment.ticket_id == ticket_id)
-        .order_by(TicketAttachment.uploaded_at.desc())
+    items, next_cursor = await _fetch_ticket_section(
+        db, "attachments", ticket_id, limit, cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return [TicketAttachmentResponse.model_validate(item) for item in items]
+
+
+async def _add_attachment(
+    db: AsyncSession,
+    ticket_id: int,
+    user: User,
+    filename: str,
+    content_type: Optional[str],
+    stored: StoredUpload,
+) -> TicketAttachment:
+    """Record a stored file as a ticket attachment, with history and counters."""
+    # Determine mime type - fallback to extension-based detection
+    import mimetypes
+    mime = content_type
+    if not mime or mime == "application/octet-stream":
+        guessed, _ = mimetypes.guess_type(filename)
+        if guessed:
+            mime = guessed
+
+    attachment = TicketAttachment(
+        ticket_id=ticket_id,
+        filename=filename,
+        file_path=str(stored.path),
+        file_size=stored.size,
+        sha256=stored.sha256,
+        mime_type=mime or "application/octet-stream",
+        uploaded_by_id=user.id,
+    )
+    db.add(attachment)
+
+    # Add history entry
+    history = TicketHistory(
+        ticket_id=ticket_id,
+        user_id=user.id,
+        action="attachment_uploaded",
+        new_value={"filename": filename},
     )
-    attachments = result.scalars().all()
+    db.add(history)
+    await TicketService(db).adjust_counters(ticket_id, attachments=1)
 
-    return [TicketAttachmentResponse.model_validate(a) for a in attachments]
+    return attachment
 
 
 @router.post("/{ticket_id}/attachments", response_model=TicketAttachmentResponse, status_code=status.HTTP_201_CREATED)
@@ -1439,70 +2023,283 @@ async def upload_ticket_attachment(
             detail="Ticket not found",
         )
 
-    # Check file size (250MB)
-    content = await file.read()
-    max_size = 250 * 1024 * 1024  # 250MB
-    if len(content) > max_size:
+    # Stream to disk in chunks, enforcing the size limit as it goes
+    stored = await store_upload(file, blob_incoming_dir(), "", settings.MAX_ATTACHMENT_SIZE)
+    stored = await BlobStore(db).add(stored)
+
+    attachment = await _add_attachment(
+        db,
+        ticket_id,
+        current_user,
+        file.filename or stored.path.name,
+        file.content_type,
+        stored,
+    )
+
+    await db.commit()
+    await db.refresh(attachment, ["uploaded_by"])
+
+    return TicketAttachmentResponse.model_validate(attachment)
+
+
+def _attachment_upload_expiry() -> datetime:
+    return datetime.utcnow() + timedelta(hours=settings.ATTACHMENT_UPLOAD_EXPIRE_HOURS)
+
+
+async def _get_attachment_upload(
+    db: AsyncSession,
+    ticket_id: int,
+    upload_id: int,
+    user: User,
+) -> TicketAttachmentUpload:
+    """Load an unexpired resumable upload started by ``user`` or raise 404."""
+    result = await db.execute(
+        select(TicketAttachmentUpload).where(
+            TicketAttachmentUpload.id == upload_id,
+            TicketAttachmentUpload.ticket_id == ticket_id,
+            TicketAttachmentUpload.uploaded_by_id == user.id,
+            TicketAttachmentUpload.expires_at > func.now(),
+        )
+    )
+    upload = result.scalar_one_or_none()
+    if not upload or not os.path.exists(upload.file_path):
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="File too large. Maximum size is 250MB",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found",
         )
+    return upload
+
+
+def _attachment_upload_response(
+    upload: TicketAttachmentUpload,
+    offset: int,
+) -> TicketAttachmentUploadResponse:
+    return TicketAttachmentUploadResponse(
+        id=upload.id,
+        filename=upload.filename,
+        mime_type=upload.mime_type,
+        total_size=upload.total_size,
+        offset=offset,
+        expires_at=upload.expires_at,
+    )
 
-    # Create storage directory
-    storage_path = Path(settings.ATTACHMENTS_STORAGE_PATH) / str(ticket_id)
-    storage_path.mkdir(parents=True, exist_ok=True)
 
-    # Generate unique filename
-    file_ext = Path(file.filename).suffix if file.filename else ".bin"
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = storage_path / unique_filename
+@router.post(
+    "/{ticket_id}/attachments/uploads",
+    response_model=TicketAttachmentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_attachment_upload(
+    ticket_id: int,
+    data: TicketAttachmentUploadCreate,
+    db: DbSession,
+    current_user: Annotated[User, Depends(PermissionRequired("tickets.upload_attachments"))],
+):
+    """Start a resumable attachment upload.
+
+    Chunks are sent with ``PUT .../uploads/{upload_id}?offset=``, the received
+    offset can be read back with ``GET`` after an interruption, and
+    ``POST .../complete`` turns the upload into an attachment. Uploads that
+    see no chunk for ATTACHMENT_UPLOAD_EXPIRE_HOURS are removed.
+    """
+    ticket_result = await db.execute(select(Ticket.id).where(Ticket.id == ticket_id))
+    if ticket_result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found",
+        )
 
-    # Save file
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content)
+    if data.total_size > settings.MAX_ATTACHMENT_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size is {settings.MAX_ATTACHMENT_SIZE // (1024 * 1024)}MB",
+        )
 
-    # Determine mime type - fallback to extension-based detection
-    import mimetypes
-    mime = file.content_type
-    if not mime or mime == "application/octet-stream":
-        guessed, _ = mimetypes.guess_type(file.filename or "")
-        if guessed:
-            mime = guessed
+    # Under the blob root, so completing is a rename on the same filesystem
+    upload_dir = partial_uploads_dir()
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    file_path = upload_dir / f"{uuid.uuid4()}.part"
+    file_path.touch()
 
-    # Create attachment record
-    attachment = TicketAttachment(
+    upload = TicketAttachmentUpload(
         ticket_id=ticket_id,
-        filename=file.filename or unique_filename,
-        file_path=str(file_path),
-        file_size=len(content),
-        mime_type=mime or "application/octet-stream",
         uploaded_by_id=current_user.id,
+        filename=data.filename,
+        mime_type=data.mime_type,
+        total_size=data.total_size,
+        file_path=str(file_path),
+        expires_at=_attachment_upload_expiry(),
     )
-    db.add(attachment)
+    db.add(upload)
+    await db.commit()
+    await db.refresh(upload)
 
-    # Add history entry
-    history = TicketHistory(
-        ticket_id=ticket_id,
-        user_id=current_user.id,
-        action="attachment_uploaded",
-        new_value=json.dumps({"filename": file.filename}),
+    return _attachment_upload_response(upload, 0)
+
+
+@router.get(
+    "/{ticket_id}/attachments/uploads/{upload_id}",
+    response_model=TicketAttachmentUploadResponse,
+)
+async def get_attachment_upload(
+    ticket_id: int,
+    upload_id: int,
+    db: DbSession,
+    current_user: Annotated[User, Depends(PermissionRequired("tickets.upload_attachments"))],
+):
+    """Get a resumable upload with the offset the next chunk must start at."""
+    upload = await _get_attachment_upload(db, ticket_id, upload_id, current_user)
+    return _attachment_upload_response(upload, os.path.getsize(upload.file_path))
+
+
+@router.put(
+    "/{ticket_id}/attachments/uploads/{upload_id}",
+    response_model=TicketAttachmentUploadResponse,
+)
+async def upload_attachment_chunk(
+    ticket_id: int,
+    upload_id: int,
+    request: Request,
+    db: DbSession,
+    current_user: Annotated[User, Depends(PermissionRequired("tickets.upload_attachments"))],
+    offset: int = Query(..., ge=0),
+):
+    """Append the raw request body to a resumable upload at ``offset``.
+
+    ``offset`` must equal the bytes received so far; otherwise 409 is returned
+    with the current offset in the ``Upload-Offset`` header. Bytes that arrive
+    before a dropped connection are kept.
+    """
+    upload = await _get_attachment_upload(db, ticket_id, upload_id, current_user)
+    # Give the connection back to the pool while the chunk crawls in
+    await db.commit()
+
+    received = await append_upload_chunk(
+        request.stream(),
+        Path(upload.file_path),
+        offset,
+        upload.total_size,
     )
-    db.add(history)
 
+    upload.expires_at = _attachment_upload_expiry()
     await db.commit()
+
+    return _attachment_upload_response(upload, received)
+
+
+@router.post(
+    "/{ticket_id}/attachments/uploads/{upload_id}/complete",
+    response_model=TicketAttachmentResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def complete_attachment_upload(
+    ticket_id: int,
+    upload_id: int,
+    data: TicketAttachmentUploadComplete,
+    db: DbSession,
+    current_user: Annotated[User, Depends(PermissionRequired("tickets.upload_attachments"))],
+):
+    """Turn a fully received resumable upload into a ticket attachment."""
+    upload = await _get_attachment_upload(db, ticket_id, upload_id, current_user)
+
+    staged = await finish_partial_upload(
+        Path(upload.file_path),
+        blob_incoming_dir(),
+        "",
+        upload.total_size,
+        data.sha256,
+    )
+
+    try:
+        # The staged file is kept until the commit went through, so a failure
+        # can still hand it back to the upload for a retry; a blob file created
+        # here without a committed row is removed by the orphaned blob sweep
+        stored = await BlobStore(db).add(staged, keep_staged=True)
+        attachment = await _add_attachment(
+            db,
+            ticket_id,
+            current_user,
+            upload.filename,
+            upload.mime_type,
+            stored,
+        )
+        await db.delete(upload)
+        await db.commit()
+    except BaseException:
+        os.replace(staged.path, upload.file_path)
+        raise
+
+    staged.path.unlink(missing_ok=True)
+
     await db.refresh(attachment, ["uploaded_by"])
 
     return TicketAttachmentResponse.model_validate(attachment)
 
 
+@router.delete("/{ticket_id}/attachments/uploads/{upload_id}")
+async def cancel_attachment_upload(
+    ticket_id: int,
+    upload_id: int,
+    db: DbSession,
+    current_user: Annotated[User, Depends(PermissionRequired("tickets.upload_attachments"))],
+):
+    """Abandon a resumable upload and delete the received bytes."""
+    upload = await _get_attachment_upload(db, ticket_id, upload_id, current_user)
+
+    Path(upload.file_path).unlink(missing_ok=True)
+    await db.delete(upload)
+    await db.commit()
+
+    return {"message": "Upload cancelled"}
+
+
+@router.post(
+    "/{ticket_id}/attachments/{attachment_id}/download-token",
+    response_model=TicketAttachmentDownloadToken,
+)
+async def create_attachment_download_token(
+    ticket_id: int,
+    attachment_id: int,
+    request: Request,
+    db: DbSession,
+    current_user: CurrentUser,
+):
+    """Issue a short-lived token for putting this attachment's download URL in ``<video src>``."""
+    result = await db.execute(
+        select(TicketAttachment.id).where(
+            TicketAttachment.id == attachment_id,
+            TicketAttachment.ticket_id == ticket_id,
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Attachment not found",
+        )
+
+    path = request.url_for(
+        "download_ticket_attachment", ticket_id=ticket_id, attachment_id=attachment_id
+    ).path
+    return TicketAttachmentDownloadToken(
+        token=create_download_token(current_user.id, path),
+        expires_at=datetime.utcnow() + timedelta(minutes=settings.DOWNLOAD_TOKEN_EXPIRE_MINUTES),
+    )
+
+
 @router.get("/{ticket_id}/attachments/{attachment_id}/download")
 async def download_ticket_attachment(
     ticket_id: int,
     attachment_id: int,
+    request: Request,
     db: DbSession,
-    current_user: CurrentUser,
+    current_user: DownloadUser,
 ):
-    """Download an attachment file."""
+    """Download an attachment file.
+
+    Supports byte ranges, so inline video players can seek, and conditional
+    requests. ``<video src>`` cannot send headers and authenticates with
+    ``?token=`` from the download-token endpoint instead.
+    """
     result = await db.execute(
         select(TicketAttachment).where(
             TicketAttachment.id == attachment_id,
@@ -1523,24 +2320,16 @@ async def download_ticket_attachment(
             detail="Attachment file not found on disk",
         )
 
-    # For text/image/video/pdf files, show inline (in browser) instead of downloading
-    inline_types = [
-        "text/", "image/", "video/", "audio/",
-        "application/pdf", "application/json", "application/xml",
-    ]
-    is_inline = any(attachment.mime_type and attachment.mime_type.startswith(t) for t in inline_types)
-
-    if is_inline:
-        return FileResponse(
-            path=attachment.file_path,
-            media_type=attachment.mime_type,
-            headers={"Content-Disposition": f'inline; filename="{attachment.filename}"'},
-        )
+    mime_type = (attachment.mime_type or "").split(";")[0].strip().lower()
+    is_inline = mime_type.startswith(INLINE_ATTACHMENT_TYPES)
 
-    return FileResponse(
-        path=attachment.file_path,
-        filename=attachment.filename,
-        media_type=attachment.mime_type,
+    return file_download_response(
+        request,
+        attachment.file_path,
+        attachment.filename,
+        attachment.mime_type,
+        inline=is_inline,
+        sha256=attachment.sha256,
     )
 
 
@@ -1566,20 +2355,20 @@ async def delete_ticket_attachment(
             detail="Attachment not found",
         )
 
-    # Delete file from disk
-    if os.path.exists(attachment.file_path):
-        os.remove(attachment.file_path)
+    # Drop the file's reference; unshared content is collected later
+    await BlobStore(db).release(attachment.sha256, attachment.file_path)
 
     # Add history entry
     history = TicketHistory(
         ticket_id=ticket_id,
         user_id=current_user.id,
         action="attachment_deleted",
-        old_value=json.dumps({"filename": attachment.filename}),
+        old_value={"filename": attachment.filename},
     )
     db.add(history)
 
     await db.delete(attachment)
+    await TicketService(db).adjust_counters(ticket_id, attachments=-1)
     await db.commit()
 
     return {"message": "Attachment deleted successfully"}
@@ -2,13 +2,14 @@ from typing import Annotated, Optional
 
 from pydantic import BaseModel as PydanticBaseModel
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import CurrentUser, DbSession, PermissionRequired
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole, UserNotificationSettings
+from app.models.department import Department
 from app.models.role import Role
 from app.schemas.common import PaginatedResponse
 from app.schemas.user import (
@@ -20,10 +21,52 @@ from app.schemas.user import (
     UserRolesUpdate,
     UserUpdate,
 )
+from app.services.count_service import COUNT_MODE_PATTERN, count_total
+from app.utils.fieldsets import (
+    FieldSpec,
+    column_field,
+    fieldset_columns,
+    fieldset_response,
+    parse_fieldset,
+    serialize_fieldset,
+    translated_field,
+)
+from app.utils.pagination import page_count
 
 router = APIRouter()
 
 
+def user_list_fields(lang: Optional[str]) -> FieldSpec:
+    """UserListResponse fields, with names in ``lang`` where translated.
+
+    ``roles`` reads no columns; list_users fills it with one query per page.
+    """
+    use_en = lang == "en"
+    return {
+        "id": column_field(User.id),
+        "email": column_field(User.email),
+        "first_name": translated_field(User.first_name, User.first_name_en, use_en),
+        "last_name": translated_field(User.last_name, User.last_name_en, use_en),
+        "phone": column_field(User.phone),
+        "is_active": column_field(User.is_active),
+        "is_admin": column_field(User.is_admin),
+        "department_id": column_field(User.department_id),
+        "department": (
+            (
+                Department.id.label("department_pk"),
+                Department.name.label("department_name"),
+                Department.name_en.label("department_name_en"),
+            ),
+            lambda row: {
+                "id": row.department_pk,
+                "name": row.department_name_en if use_en and row.department_name_en else row.department_name,
+            } if row.department_pk is not None else None,
+        ),
+        "roles": ((), lambda row: []),
+        "created_at": column_field(User.created_at),
+    }
+
+
 @router.get("", response_model=PaginatedResponse[UserListResponse])
 async def list_users(
     db: DbSession,
@@ -34,62 +77,70 @@ async def list_users(
     department_id: Optional[int] = None,
     is_active: Optional[bool] = None,
     lang: Optional[str] = Query(None, description="Language code (en, uk)"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return"),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN),
 ):
-    """List all users with pagination and filters."""
-    query = select(User).options(selectinload(User.department), selectinload(User.roles))
+    """List all users with pagination and filters.
+
+    ``fields`` limits the items, and the columns read, to those fields;
+    the department and roles are loaded only when asked for. ``count``
+    picks how the total is computed (exact, estimate or none).
+    """
+    spec = user_list_fields(lang)
+    fieldset = parse_fieldset(fields, spec)
 
     # Apply filters
+    conditions = []
     if search:
         search_filter = f"%{search}%"
-        query = query.where(
+        conditions.append(
             (User.email.ilike(search_filter))
             | (User.first_name.ilike(search_filter))
             | (User.last_name.ilike(search_filter))
         )
     if department_id is not None:
-        query = query.where(User.department_id == department_id)
+        conditions.append(User.department_id == department_id)
     if is_active is not None:
-        query = query.where(User.is_active == is_active)
+        conditions.append(User.is_active == is_active)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    total, total_mode = await count_total(db, select(User.id).where(*conditions), count)
+
+    query = select(*fieldset_columns(spec, fieldset)).select_from(User).where(*conditions)
+    if "department" in fieldset:
+        query = query.outerjoin(Department, Department.id == User.department_id)
 
     # Apply pagination
     offset = (page - 1) * per_page
     query = query.offset(offset).limit(per_page).order_by(User.created_at.desc())
 
     result = await db.execute(query)
-    users = result.scalars().all()
-
-    # Build response with translated names
-    items = []
-    for user in users:
-        user_dict = {
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name_en if lang == "en" and user.first_name_en else user.first_name,
-            "last_name": user.last_name_en if lang == "en" and user.last_name_en else user.last_name,
-            "phone": user.phone,
-            "is_active": user.is_active,
-            "is_admin": user.is_admin,
-            "department_id": user.department_id,
-            "department": {
-                "id": user.department.id,
-                "name": user.department.name_en if lang == "en" and user.department.name_en else user.department.name
-            } if user.department else None,
-            "roles": [{"id": r.id, "name": r.name} for r in user.roles],
-            "created_at": user.created_at,
-        }
-        items.append(UserListResponse(**user_dict))
-
-    return PaginatedResponse(
+    items = [serialize_fieldset(row, spec, fieldset) for row in result.all()]
+
+    if "roles" in fieldset and items:
+        roles_result = await db.execute(
+            select(UserRole.user_id, Role.id, Role.name)
+            .join(Role, Role.id == UserRole.role_id)
+            .where(UserRole.user_id.in_([item["id"] for item in items]))
+            .order_by(Role.id)
+        )
+        roles_by_user: dict[int, list[dict]] = {}
+        for user_id, role_id, role_name in roles_result.all():
+            roles_by_user.setdefault(user_id, []).append({"id": role_id, "name": role_name})
+        for item in items:
+            item["roles"] = roles_by_user.get(item["id"], [])
+
+    page_data = dict(
         items=items,
         total=total,
+        total_mode=total_mode,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page,
+        pages=page_count(total, per_page),
     )
+    if fields:
+        return fieldset_response(page_data)
+    return PaginatedResponse(**page_data)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
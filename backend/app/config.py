@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    DOWNLOAD_TOKEN_EXPIRE_MINUTES: int = 60  # Single-file tokens put in media URLs
+    STREAM_TOKEN_EXPIRE_MINUTES: int = 1  # Tokens that open the event stream
 
     # OpenAI
     OPENAI_API_KEY: str = ""
@@ -30,7 +32,19 @@ class Settings(BaseSettings):
     # Storage
     LOGS_STORAGE_PATH: str = "/app/logs"
     ATTACHMENTS_STORAGE_PATH: str = "/app/attachments"
+    BLOBS_STORAGE_PATH: str = "/app/blobs"  # Deduplicated log and attachment content
+    EXPORTS_STORAGE_PATH: str = "/app/exports"
+    EXPORT_RETENTION_HOURS: int = 24
+    EXPORT_JOB_TIMEOUT_MINUTES: int = 60  # Unfinished jobs older than this are failed
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50MB
+    MAX_ATTACHMENT_SIZE: int = 250 * 1024 * 1024  # 250MB
+    ATTACHMENT_UPLOAD_EXPIRE_HOURS: int = 24  # Resumable uploads idle this long are removed
+    # When set (e.g. "/_protected_files"), downloads are handed to nginx with
+    # X-Accel-Redirect: <prefix><file path> instead of being sent by the API
+    DOWNLOAD_ACCEL_REDIRECT_PREFIX: str = ""
+
+    # Delta sync: deleted-ticket tombstones older than this are pruned
+    TICKET_TOMBSTONE_RETENTION_DAYS: int = 30
 
     # Email
     SMTP_HOST: str = "smtp.gmail.com"
@@ -36,6 +36,28 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def create_download_token(user_id: int, path: str) -> str:
+    """Short-lived token that only authenticates a GET of ``path``.
+
+    Meant for URLs (``<video src>``), which end up in access logs and
+    browser history, so the access token itself is never put in one.
+    """
+    expire = datetime.utcnow() + timedelta(minutes=settings.DOWNLOAD_TOKEN_EXPIRE_MINUTES)
+    to_encode = {"sub": str(user_id), "path": path, "exp": expire, "type": "download"}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def create_stream_token(user_id: int) -> str:
+    """Short-lived token that only opens the event stream.
+
+    EventSource cannot send headers, so the token goes in the stream URL;
+    it is checked when the stream opens, the stream itself is time-limited.
+    """
+    expire = datetime.utcnow() + timedelta(minutes=settings.STREAM_TOKEN_EXPIRE_MINUTES)
+    to_encode = {"sub": str(user_id), "exp": expire, "type": "stream"}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
 def decode_token(token: str) -> dict[str, Any] | None:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
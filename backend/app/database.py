@@ -1,3 +1,5 @@
+import json
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -12,6 +14,8 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    # JSON(B) payloads such as ticket history may carry dates and decimals
+    json_serializer=lambda value: json.dumps(value, default=str),
 )
 
 async_session_maker = async_sessionmaker(
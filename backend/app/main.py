@@ -12,6 +12,7 @@ from app.api.v1.router import api_router
 from app.config import settings
 from app.core.rate_limit import limiter
 from app.integrations.registry import IntegrationRegistry
+from app.services.realtime_service import event_broker
 
 # Configure logging
 logging.basicConfig(
@@ -28,8 +29,10 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Service Desk API...")
     IntegrationRegistry.discover_modules()
     logger.info(f"Loaded {len(IntegrationRegistry.get_all())} integration modules")
+    await event_broker.start()
     yield
     logger.info("Shutting down Service Desk API...")
+    await event_broker.stop()
 
 
 app = FastAPI(
@@ -58,6 +61,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
     max_age=3600,
 )
 
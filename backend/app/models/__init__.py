@@ -3,12 +3,23 @@ from app.models.department import Department
 from app.models.role import Role, Permission, RolePermission
 from app.models.operator import Operator
 from app.models.station import Station, StationPort
-from app.models.ticket import Ticket, TicketComment, TicketAttachment, TicketHistory, TicketLog
+from app.models.ticket import (
+    Ticket,
+    TicketComment,
+    TicketAttachment,
+    TicketAttachmentUpload,
+    TicketHistory,
+    TicketListView,
+    TicketLog,
+    TicketTombstone,
+)
 from app.models.knowledge_base import KnowledgeArticle, KnowledgeArticleVersion
 from app.models.audit_log import AuditLog
 from app.models.integration import Integration, IntegrationLog
 from app.models.notification import Notification
 from app.models.incident_type import IncidentType
+from app.models.export_job import ExportJob
+from app.models.blob import Blob
 
 __all__ = [
     "User",
@@ -24,8 +35,11 @@ __all__ = [
     "Ticket",
     "TicketComment",
     "TicketAttachment",
+    "TicketAttachmentUpload",
     "TicketHistory",
+    "TicketListView",
     "TicketLog",
+    "TicketTombstone",
     "KnowledgeArticle",
     "KnowledgeArticleVersion",
     "AuditLog",
@@ -33,4 +47,6 @@ __all__ = [
     "IntegrationLog",
     "Notification",
     "IncidentType",
+    "ExportJob",
+    "Blob",
 ]
@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func, JSON
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Sequence, String, Text, func, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -11,9 +12,15 @@ if TYPE_CHECKING:
     from app.models.department import Department
     from app.models.station import Station
 
+# Allocates short sequential ticket numbers (see migration 025)
+ticket_number_seq = Sequence("ticket_number_seq", metadata=Base.metadata)
+
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    # Fetch updated_at via RETURNING on flush, so write endpoints can build
+    # their response from the same instance without reloading it
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     ticket_number: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
@@ -32,17 +39,23 @@ class Ticket(Base):
     # Classification
     category: Mapped[str] = mapped_column(String(20), nullable=False)  # hardware, software, network, billing, other
     priority: Mapped[str] = mapped_column(String(10), default="medium")  # low, medium, high, critical
-    status: Mapped[str] = mapped_column(String(20), default="new", index=True)  # new, in_progress, pending, reviewing, closed
+    status: Mapped[str] = mapped_column(String(20), default="new")  # new, in_progress, pending, reviewing, closed
 
     # Content
     title: Mapped[str] = mapped_column(String(300), nullable=False)
-    description: Mapped[str] = mapped_column(Text, nullable=False)
+    # Bulky text is deferred: select(Ticket) leaves it in TOAST, and reading it
+    # without undefer() raises instead of lazy-loading (see migration 031)
+    description: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_raiseload=True
+    )
     
     # New fields from TZ (migration 009)
     incident_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     port_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     contact_source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    station_logs: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    station_logs: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )  # Pasted OCPP logs, often tens of KB
     vehicle: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)  # Vehicle info
     client_type: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # B2C or B2B
 
@@ -54,6 +67,14 @@ class Ticket(Base):
         Integer, ForeignKey("departments.id"), nullable=True
     )
 
+    # Latest delegation, kept by delegate_ticket for the "delegated to me" queue
+    last_delegated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    delegated_to_user_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+
     # Author and dates
     created_by_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
@@ -77,6 +98,10 @@ class Ticket(Base):
     )
     sla_breached: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Denormalized counters, kept by TicketService.adjust_counters
+    comments_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    attachments_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
     # AI Log Analysis (stored as JSON)
     ai_log_analysis: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
@@ -136,6 +161,7 @@ class TicketAttachment(Base):
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
     uploaded_by_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
@@ -149,6 +175,33 @@ class TicketAttachment(Base):
     uploaded_by: Mapped[Optional["User"]] = relationship("User")
 
 
+class TicketAttachmentUpload(Base):
+    """Resumable attachment upload that has not been completed yet.
+
+    Chunks are appended to ``file_path``, whose size is the received offset;
+    completing the upload turns it into a TicketAttachment.
+    """
+
+    __tablename__ = "ticket_attachment_uploads"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    ticket_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    uploaded_by_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    mime_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    total_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    # Moved forward by every chunk; abandoned uploads are removed after it
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+
 class TicketHistory(Base):
     __tablename__ = "ticket_history"
 
@@ -160,8 +213,8 @@ class TicketHistory(Base):
         Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     action: Mapped[str] = mapped_column(String(50), nullable=False)  # created, status_changed, assigned, commented, etc.
-    old_value: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON
-    new_value: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON
+    old_value: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    new_value: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -182,6 +235,7 @@ class TicketLog(Base):
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     collected_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -200,3 +254,68 @@ class TicketLog(Base):
 
     # Relationships
     ticket: Mapped["Ticket"] = relationship("Ticket", back_populates="logs")
+
+
+class TicketTombstone(Base):
+    """Record of a deleted ticket, read by the delta-sync endpoint."""
+
+    __tablename__ = "ticket_tombstones"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    ticket_id: Mapped[int] = mapped_column(Integer, nullable=False)  # No FK: the ticket is gone
+    ticket_number: Mapped[str] = mapped_column(String(20), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class TicketListView(Base):
+    """Flat read model of the ticket list, one row per ticket.
+
+    Maintained by database triggers on tickets, stations, operators, users and
+    departments (migration 032), so every write path keeps it current inside
+    its own transaction. Never written by the application.
+    """
+
+    __tablename__ = "ticket_list_view"
+
+    id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tickets.id", ondelete="CASCADE"), primary_key=True
+    )
+    ticket_number: Mapped[str] = mapped_column(String(20), nullable=False)
+    title: Mapped[str] = mapped_column(String(300), nullable=False)
+    category: Mapped[str] = mapped_column(String(20), nullable=False)
+    priority: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    incident_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Last change to the row, renamed stations/users/... included (delta-sync order)
+    changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    sla_due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    sla_breached: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    comments_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    attachments_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Station and operator
+    station_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    station_code: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Station.station_id
+    station_number: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    station_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    station_address: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    operator_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    operator_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+
+    # Assignment and author
+    assigned_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    assigned_user_first_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    assigned_user_last_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    assigned_user_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    assigned_department_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    assigned_department_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    delegated_to_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_delegated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_by_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    created_by_first_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_by_last_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_by_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from celery import Celery
 
@@ -30,21 +31,64 @@ celery_app.conf.update(
             "schedule": 86400.0,  # Daily
             "options": {"expires": 3600},
         },
+        "reconcile-ticket-counters": {
+            "task": "app.notifications.tasks.reconcile_ticket_counters",
+            "schedule": 86400.0,  # Daily
+            "options": {"expires": 3600},
+        },
+        "cleanup-export-jobs": {
+            "task": "app.notifications.tasks.cleanup_export_jobs",
+            "schedule": 3600.0,  # Hourly
+        },
+        "cleanup-attachment-uploads": {
+            "task": "app.notifications.tasks.cleanup_attachment_uploads",
+            "schedule": 3600.0,  # Hourly
+        },
+        "collect-unreferenced-blobs": {
+            "task": "app.notifications.tasks.collect_unreferenced_blobs",
+            "schedule": 3600.0,  # Hourly
+        },
+        "register-orphaned-blob-files": {
+            "task": "app.notifications.tasks.register_orphaned_blob_files",
+            "schedule": 86400.0,  # Daily
+            "options": {"expires": 3600},
+        },
+        "prune-ticket-tombstones": {
+            "task": "app.notifications.tasks.prune_ticket_tombstones",
+            "schedule": 86400.0,  # Daily
+            "options": {"expires": 3600},
+        },
     },
 )
 
 
+def _run_async(coro):
+    """Run a task coroutine in a fresh event loop, as each task invocation does.
+
+    asyncio.run closes its loop, while the shared engine's pool would keep
+    asyncpg connections bound to it and hand them to the next task in this
+    worker process. Disposing the engine before the loop closes avoids that.
+    """
+    async def run():
+        from app.database import engine
+
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def _export_file_path(job) -> Path:
+    """Final file of an export job; it is written as ``<name>.part`` first."""
+    return Path(settings.EXPORTS_STORAGE_PATH) / f"tickets_export_{job.id}.{job.file_format}"
+
+
 @celery_app.task
 def check_sla_warnings():
     """Check for tickets approaching SLA breach and send warnings."""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    loop.run_until_complete(_check_sla_warnings_async())
+    _run_async(_check_sla_warnings_async())
 
 
 async def _check_sla_warnings_async():
@@ -80,7 +124,7 @@ async def _check_sla_warnings_async():
 @celery_app.task
 def send_daily_digest():
     """Send daily digest of open tickets to department heads."""
-    asyncio.run(_send_daily_digest_async())
+    _run_async(_send_daily_digest_async())
 
 
 async def _send_daily_digest_async():
@@ -166,7 +210,7 @@ async def _send_daily_digest_async():
 @celery_app.task
 def update_sla_breached():
     """Update SLA breached status for overdue tickets."""
-    asyncio.run(_update_sla_breached_async())
+    _run_async(_update_sla_breached_async())
 
 
 async def _update_sla_breached_async():
@@ -195,3 +239,352 @@ async def _update_sla_breached_async():
             logger.info(f"SLA breached for ticket {ticket.ticket_number}")
 
         await db.commit()
+
+
+@celery_app.task
+def prune_ticket_tombstones():
+    """Delete tombstones of deleted tickets past the delta-sync retention."""
+    _run_async(_prune_ticket_tombstones_async())
+
+
+async def _prune_ticket_tombstones_async():
+    """Async implementation of tombstone pruning."""
+    from sqlalchemy import delete
+
+    from app.database import async_session_maker
+    from app.models.ticket import TicketTombstone
+
+    async with async_session_maker() as db:
+        cutoff = datetime.utcnow() - timedelta(days=settings.TICKET_TOMBSTONE_RETENTION_DAYS)
+
+        result = await db.execute(
+            delete(TicketTombstone).where(TicketTombstone.deleted_at < cutoff)
+        )
+        await db.commit()
+
+        logger.info(f"Pruned {result.rowcount} ticket tombstones")
+
+
+@celery_app.task
+def reconcile_ticket_counters():
+    """Repair drift in the denormalized ticket comment/attachment counters."""
+    _run_async(_reconcile_ticket_counters_async())
+
+
+async def _reconcile_ticket_counters_async():
+    """Async implementation of counter reconciliation."""
+    from sqlalchemy import func, or_, select, update
+
+    from app.database import async_session_maker
+    from app.models.ticket import Ticket, TicketAttachment, TicketComment
+
+    async with async_session_maker() as db:
+        comments = (
+            select(func.count())
+            .where(TicketComment.ticket_id == Ticket.id)
+            .correlate(Ticket)
+            .scalar_subquery()
+        )
+        attachments = (
+            select(func.count())
+            .where(TicketAttachment.ticket_id == Ticket.id)
+            .correlate(Ticket)
+            .scalar_subquery()
+        )
+
+        # Only rows that drifted are written, so updated_at stays meaningful
+        result = await db.execute(
+            update(Ticket)
+            .where(or_(Ticket.comments_count != comments, Ticket.attachments_count != attachments))
+            .values(comments_count=comments, attachments_count=attachments)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        if result.rowcount:
+            logger.warning(f"Reconciled counters on {result.rowcount} tickets")
+
+
+@celery_app.task
+def export_tickets_job(job_id: int):
+    """Build the file of a background ticket export job."""
+    _run_async(_export_tickets_job_async(job_id))
+
+
+async def _export_tickets_job_async(job_id: int):
+    """Async implementation of a ticket export job."""
+    import os
+
+    from sqlalchemy import func, select
+
+    from app.database import async_session_maker
+    from app.models.export_job import ExportJob
+    from app.models.ticket import TicketListView
+    from app.models.user import User
+    from app.services.ticket_export_service import write_ticket_export_file
+    from app.services.ticket_query_service import ticket_filter_conditions
+
+    async with async_session_maker() as db:
+        job = await db.get(ExportJob, job_id)
+        if not job or job.status != "pending":
+            return
+        user = await db.get(User, job.user_id)
+
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        conditions, _ = ticket_filter_conditions(user, **job.filters)
+        job.rows_total = (await db.execute(
+            select(func.count()).select_from(TicketListView).where(*conditions)
+        )).scalar()
+        await db.commit()
+
+        file_path = _export_file_path(job)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name so a crash never leaves a file that looks complete
+        part_path = file_path.with_name(file_path.name + ".part")
+
+        async def on_progress(rows_written: int):
+            job.rows_written = rows_written
+            if job.rows_total:
+                job.progress = min(99, rows_written * 100 // job.rows_total)
+            await db.commit()
+
+        try:
+            rows_written = await write_ticket_export_file(
+                conditions, part_path, job.file_format, on_progress
+            )
+            os.replace(part_path, file_path)
+        except Exception as e:
+            logger.error(f"Export job {job.id} failed: {e}", exc_info=True)
+            part_path.unlink(missing_ok=True)
+            job.status = "failed"
+            job.error = str(e)[:1000]
+            job.finished_at = datetime.utcnow()
+            await db.commit()
+            return
+
+        job.status = "completed"
+        job.rows_written = rows_written
+        job.progress = 100
+        job.file_path = str(file_path)
+        job.file_size = file_path.stat().st_size
+        job.finished_at = datetime.utcnow()
+        await db.commit()
+
+        logger.info(f"Export job {job.id} wrote {rows_written} tickets to {file_path}")
+
+
+@celery_app.task
+def cleanup_export_jobs():
+    """Fail stuck export jobs; delete old jobs and their files."""
+    _run_async(_cleanup_export_jobs_async())
+
+
+async def _cleanup_export_jobs_async():
+    """Async implementation of export job cleanup."""
+    import os
+
+    from sqlalchemy import and_, or_, select
+
+    from app.database import async_session_maker
+    from app.models.export_job import ExportJob
+
+    async with async_session_maker() as db:
+        # Jobs whose worker died (or whose message was lost) never finish by themselves
+        stuck_cutoff = datetime.utcnow() - timedelta(minutes=settings.EXPORT_JOB_TIMEOUT_MINUTES)
+        result = await db.execute(
+            select(ExportJob).where(
+                or_(
+                    and_(ExportJob.status == "running", ExportJob.started_at < stuck_cutoff),
+                    and_(ExportJob.status == "pending", ExportJob.created_at < stuck_cutoff),
+                )
+            )
+        )
+        stuck_jobs = result.scalars().all()
+
+        for job in stuck_jobs:
+            part_path = _export_file_path(job)
+            part_path.with_name(part_path.name + ".part").unlink(missing_ok=True)
+            job.status = "failed"
+            job.error = "Export timed out"
+            job.finished_at = datetime.utcnow()
+
+        cutoff = datetime.utcnow() - timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+
+        result = await db.execute(select(ExportJob).where(ExportJob.created_at < cutoff))
+        jobs = result.scalars().all()
+
+        for job in jobs:
+            if job.file_path and os.path.exists(job.file_path):
+                os.remove(job.file_path)
+            part_path = _export_file_path(job)
+            part_path.with_name(part_path.name + ".part").unlink(missing_ok=True)
+            await db.delete(job)
+
+        await db.commit()
+
+        if stuck_jobs:
+            logger.warning(f"Marked {len(stuck_jobs)} stuck export jobs as failed")
+        if jobs:
+            logger.info(f"Removed {len(jobs)} expired export jobs")
+
+
+@celery_app.task
+def cleanup_attachment_uploads():
+    """Delete resumable attachment uploads that were abandoned."""
+    _run_async(_cleanup_attachment_uploads_async())
+
+
+async def _cleanup_attachment_uploads_async():
+    """Async implementation of abandoned upload cleanup."""
+    import os
+    import time
+
+    from sqlalchemy import delete, select
+
+    from app.database import async_session_maker
+    from app.models.ticket import TicketAttachmentUpload
+    from app.services.blob_store import partial_uploads_dir
+
+    async with async_session_maker() as db:
+        result = await db.execute(
+            delete(TicketAttachmentUpload)
+            .where(TicketAttachmentUpload.expires_at < datetime.utcnow())
+            .returning(TicketAttachmentUpload.file_path)
+        )
+        file_paths = result.scalars().all()
+        await db.commit()
+
+        live_result = await db.execute(select(TicketAttachmentUpload.file_path))
+        live_paths = set(live_result.scalars().all())
+
+    for file_path in file_paths:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    # Files whose row went with a deleted ticket or was never committed
+    upload_dir = partial_uploads_dir()
+    cutoff = time.time() - settings.ATTACHMENT_UPLOAD_EXPIRE_HOURS * 3600
+    orphans = 0
+    if upload_dir.exists():
+        for part in upload_dir.glob("*.part"):
+            if str(part) not in live_paths and part.stat().st_mtime < cutoff:
+                part.unlink(missing_ok=True)
+                orphans += 1
+
+    if file_paths or orphans:
+        logger.info(f"Removed {len(file_paths)} expired attachment uploads and {orphans} orphaned files")
+
+
+@celery_app.task
+def collect_unreferenced_blobs():
+    """Delete stored files no log or attachment points at any more."""
+    _run_async(_collect_unreferenced_blobs_async())
+
+
+async def _collect_unreferenced_blobs_async(batch_size: int = 500):
+    """Async implementation of blob collection."""
+    import time
+
+    from sqlalchemy import delete, select
+
+    from app.database import async_session_maker
+    from app.models.blob import Blob
+    from app.services.blob_store import blob_incoming_dir, blob_path
+
+    collected = 0
+    async with async_session_maker() as db:
+        while True:
+            # Locked rows keep BlobStore.add waiting, so a blob being
+            # referenced again cannot lose its file; locked ones are skipped
+            result = await db.execute(
+                select(Blob.sha256)
+                .where(Blob.ref_count <= 0)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            hashes = result.scalars().all()
+            if not hashes:
+                break
+
+            for sha256 in hashes:
+                blob_path(sha256).unlink(missing_ok=True)
+            await db.execute(delete(Blob).where(Blob.sha256.in_(hashes)))
+            await db.commit()
+            collected += len(hashes)
+
+    # Staged files left behind by requests that died before taking a reference
+    stale = 0
+    incoming_dir = blob_incoming_dir()
+    cutoff = time.time() - 86400
+    if incoming_dir.exists():
+        for staged in incoming_dir.iterdir():
+            if staged.stat().st_mtime < cutoff:
+                staged.unlink(missing_ok=True)
+                stale += 1
+
+    if collected or stale:
+        logger.info(f"Collected {collected} unreferenced blobs and {stale} stale staged files")
+
+
+@celery_app.task
+def register_orphaned_blob_files():
+    """Hand blob files that have no blobs row over to the collector."""
+    _run_async(_register_orphaned_blob_files_async())
+
+
+async def _register_orphaned_blob_files_async(batch_size: int = 500):
+    """Async implementation of the orphaned blob file sweep.
+
+    BlobStore.add puts the file in place before the caller commits, so a
+    rolled back request leaves a blob file without a row. Each file found is
+    given a row at ref_count 0, which the collector then deletes. Rows that
+    exist, committed or not, are left alone: the insert waits for a pending
+    BlobStore.add and does nothing once it commits.
+    """
+    import re
+
+    from sqlalchemy.dialects.postgresql import insert
+
+    from app.database import async_session_maker
+    from app.models.blob import Blob
+
+    blob_name = re.compile("^[0-9a-f]{64}$")
+    root = Path(settings.BLOBS_STORAGE_PATH)
+    if not root.exists():
+        return
+
+    registered = 0
+    async with async_session_maker() as db:
+
+        async def register(batch: dict[str, int]) -> int:
+            result = await db.execute(
+                insert(Blob)
+                .values([
+                    {"sha256": sha256, "size": size, "ref_count": 0}
+                    for sha256, size in sorted(batch.items())
+                ])
+                .on_conflict_do_nothing(index_elements=[Blob.sha256])
+                .returning(Blob.sha256)
+            )
+            count = len(result.scalars().all())
+            await db.commit()
+            return count
+
+        batch: dict[str, int] = {}
+        # Only the ab/cd/ shard directories; .incoming and .uploads are not blobs
+        for path in root.glob("[0-9a-f][0-9a-f]/[0-9a-f][0-9a-f]/*"):
+            if not blob_name.match(path.name):
+                continue
+            try:
+                batch[path.name] = path.stat().st_size
+            except FileNotFoundError:
+                continue
+            if len(batch) >= batch_size:
+                registered += await register(batch)
+                batch = {}
+        if batch:
+            registered += await register(batch)
+
+    if registered:
+        logger.warning(f"Registered {registered} orphaned blob files for collection")
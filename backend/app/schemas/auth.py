@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, EmailStr
 
 
@@ -18,6 +20,11 @@ class TokenPayload(BaseModel):
     type: str
 
 
+class StreamToken(BaseModel):
+    token: str  # Pass as ?token= to /events/stream
+    expires_at: datetime
+
+
 class ChangePasswordRequest(BaseModel):
     current_password: str
     new_password: str
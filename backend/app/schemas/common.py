@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -16,10 +16,14 @@ class PaginationParams(BaseModel):
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: Optional[int] = None  # None when counting was skipped (count=none)
+    total_mode: str = "exact"  # How total was computed: exact, estimate or none
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    # Keyset pagination tokens (cursor mode only)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class MessageResponse(BaseModel):
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ExportJobCreate(BaseModel):
+    file_format: str = Field(default="xlsx", pattern="^(xlsx|csv)$")
+    # Same filters as GET /tickets
+    search: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    category: Optional[str] = None
+    assigned_user_id: Optional[int] = None
+    assigned_department_id: Optional[int] = None
+    department_id: Optional[int] = None
+    station_id: Optional[int] = None
+    operator_id: Optional[int] = None
+    created_by_id: Optional[int] = None
+    incident_type: Optional[str] = None
+    my_tickets: bool = False
+    delegated_to_me: bool = False
+
+
+class ExportJobResponse(BaseModel):
+    id: int
+    file_format: str
+    filters: dict
+    status: str
+    rows_total: Optional[int]
+    rows_written: int
+    progress: int
+    file_size: Optional[int]
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    download_url: Optional[str] = None  # Set once the job has completed
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,8 @@
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 
 class TicketBase(BaseModel):
@@ -64,6 +65,36 @@ class TicketDelegateUpdate(BaseModel):
     comment: Optional[str] = None
 
 
+class TicketBulkOperation(BaseModel):
+    """One status/assign/delegate change applied to many tickets."""
+
+    ticket_ids: list[int] = Field(..., min_length=1, max_length=500)
+    action: str = Field(..., pattern="^(status|assign|delegate)$")
+    status: Optional[str] = Field(None, pattern="^(new|in_progress|pending|reviewing|closed)$")
+    assigned_user_id: Optional[int] = None
+    assigned_department_id: Optional[int] = None
+    comment: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_action_fields(self):
+        if self.action == "status" and not self.status:
+            raise ValueError("status is required for the status action")
+        if self.action == "delegate" and self.assigned_department_id is None:
+            raise ValueError("assigned_department_id is required for the delegate action")
+        return self
+
+
+class TicketBulkItemResult(BaseModel):
+    ticket_id: int
+    ok: bool
+    error: Optional[str] = None
+
+
+class TicketBulkResponse(BaseModel):
+    results: list[TicketBulkItemResult]
+    updated: int
+
+
 class UserShort(BaseModel):
     id: int
     first_name: str
@@ -129,11 +160,20 @@ class TicketHistoryResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_validator("old_value", "new_value", mode="before")
+    @classmethod
+    def serialize_payload(cls, value):
+        # Stored as JSONB; still sent as a JSON string as before
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value, default=str)
+
 
 class TicketAttachmentResponse(BaseModel):
     id: int
     filename: str
     file_size: int
+    sha256: Optional[str] = None
     mime_type: str
     uploaded_by: Optional[UserShort]
     uploaded_at: datetime
@@ -142,11 +182,37 @@ class TicketAttachmentResponse(BaseModel):
         from_attributes = True
 
 
+class TicketAttachmentUploadCreate(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    total_size: int = Field(..., gt=0)
+    mime_type: Optional[str] = Field(None, max_length=100)
+
+
+class TicketAttachmentUploadComplete(BaseModel):
+    # Checked against the received file when the client sends it
+    sha256: Optional[str] = Field(None, pattern="^[0-9a-f]{64}$")
+
+
+class TicketAttachmentUploadResponse(BaseModel):
+    id: int
+    filename: str
+    mime_type: Optional[str]
+    total_size: int
+    offset: int  # Bytes received so far; the next chunk starts here
+    expires_at: datetime
+
+
+class TicketAttachmentDownloadToken(BaseModel):
+    token: str  # Pass as ?token= to this attachment's download URL only
+    expires_at: datetime
+
+
 class TicketLogResponse(BaseModel):
     id: int
     log_type: str
     filename: str
     file_size: int
+    sha256: Optional[str] = None
     collected_at: datetime
     log_start_time: Optional[datetime]
     log_end_time: Optional[datetime]
@@ -211,16 +277,52 @@ class TicketListResponse(BaseModel):
     created_at: datetime
     sla_due_date: Optional[datetime]
     sla_breached: bool
+    comments_count: int = 0
+    attachments_count: int = 0
 
     class Config:
         from_attributes = True
 
 
+class TicketChangesResponse(BaseModel):
+    items: list[TicketListResponse]  # Changed tickets matching the filters
+    removed: list[int]  # Deleted tickets and tickets that left the filters
+    watermark: str  # Pass back as `since` on the next call
+    has_more: bool
+
+
+class TicketBatchResponse(BaseModel):
+    items: list[dict[str, Any]]  # TicketResponse fields limited to ?fields=, in ids order
+    missing: list[int]  # Requested ids that do not exist
+
+
 class TicketDetailResponse(TicketResponse):
-    comments: list[TicketCommentResponse]
-    attachments: list[TicketAttachmentResponse]
-    history: list[TicketHistoryResponse]
-    logs: list[TicketLogResponse]
+    # None when the section was not requested via ?include=
+    comments: Optional[list[TicketCommentResponse]] = None
+    attachments: Optional[list[TicketAttachmentResponse]] = None
+    history: Optional[list[TicketHistoryResponse]] = None
+    logs: Optional[list[TicketLogResponse]] = None
+    # Set when ?section_limit= cut a section short
+    comments_next_cursor: Optional[str] = None
+    attachments_next_cursor: Optional[str] = None
+    history_next_cursor: Optional[str] = None
+    logs_next_cursor: Optional[str] = None
+
+
+class TicketTimelineItem(BaseModel):
+    kind: str  # history, comment, attachment, log
+    id: int
+    timestamp: datetime
+    # Exactly one of these is set, matching `kind`
+    history: Optional[TicketHistoryResponse] = None
+    comment: Optional[TicketCommentResponse] = None
+    attachment: Optional[TicketAttachmentResponse] = None
+    log: Optional[TicketLogResponse] = None
+
+
+class TicketTimelineResponse(BaseModel):
+    items: list[TicketTimelineItem]
+    next_cursor: Optional[str] = None
 
 
 class ParseMessageRequest(BaseModel):
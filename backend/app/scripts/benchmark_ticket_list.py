@@ -0,0 +1,97 @@
+"""Compare the ORM and projection read paths of the ticket list.
+
+Usage: python -m app.scripts.benchmark_ticket_list [repeats]
+
+Runs both paths against the configured database for 20, 100 and 1000 rows and
+prints the median wall time. Read-only; needs at least 1000 tickets for the
+largest size to be meaningful.
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+
+from app.database import async_session_maker
+from app.models.station import Station
+from app.models.ticket import Ticket, TicketListView
+from app.schemas.ticket import TicketListResponse
+from app.services.ticket_query_service import serialize_ticket_list_row, ticket_list_query
+
+SIZES = [20, 100, 1000]
+
+
+async def orm_path(db, limit: int) -> list:
+    """Previous list_tickets implementation: ORM objects + three Pydantic passes."""
+    result = await db.execute(
+        select(Ticket)
+        .options(
+            selectinload(Ticket.station).selectinload(Station.operator),
+            selectinload(Ticket.assigned_user),
+            selectinload(Ticket.assigned_department),
+            selectinload(Ticket.created_by),
+        )
+        .order_by(Ticket.created_at.desc(), Ticket.id.desc())
+        .limit(limit)
+    )
+    items = []
+    for ticket in result.scalars().all():
+        ticket_dict = TicketListResponse.model_validate(ticket).model_dump()
+        if ticket.station:
+            ticket_dict["station"] = {
+                "id": ticket.station.id,
+                "station_id": ticket.station.station_id,
+                "station_number": ticket.station.station_number,
+                "name": ticket.station.name,
+                "address": ticket.station.address,
+                "operator_name": ticket.station.operator.name if ticket.station.operator else "",
+            }
+        items.append(TicketListResponse(**ticket_dict).model_dump())
+    return items
+
+
+async def projection_path(db, limit: int) -> list:
+    """Current list_tickets implementation: one column projection, one validation."""
+    result = await db.execute(
+        ticket_list_query()
+        .order_by(TicketListView.created_at.desc(), TicketListView.id.desc())
+        .limit(limit)
+    )
+    return [
+        TicketListResponse.model_validate(serialize_ticket_list_row(row)).model_dump()
+        for row in result.all()
+    ]
+
+
+async def measure(path, limit: int, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        # Fresh session each run so the identity map does not hide ORM cost
+        async with async_session_maker() as db:
+            started = time.perf_counter()
+            await path(db, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def main(repeats: int):
+    async with async_session_maker() as db:
+        total = (await db.execute(select(func.count()).select_from(Ticket))).scalar()
+    print(f"Tickets in database: {total}")
+    print(f"{'rows':>6} {'orm ms':>10} {'projection ms':>14} {'speedup':>8}")
+
+    for size in SIZES:
+        # Warm up connection pool and statement cache
+        await measure(orm_path, size, 1)
+        await measure(projection_path, size, 1)
+
+        orm_ms = await measure(orm_path, size, repeats)
+        projection_ms = await measure(projection_path, size, repeats)
+        speedup = orm_ms / projection_ms if projection_ms else float("inf")
+        print(f"{size:>6} {orm_ms:>10.1f} {projection_ms:>14.1f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,126 @@
+"""Measure what bulky ticket text costs the ticket read paths.
+
+Usage: python -m app.scripts.benchmark_ticket_text_columns [tickets_to_seed] [repeats]
+
+Seeds synthetic tickets (default 2000) with ~50 KB pasted OCPP logs and a
+~2 KB description inside a transaction that is rolled back at the end, then
+loads pages of 20, 100 and 500 tickets three ways:
+
+- ``orm_undeferred``: select(Ticket) with both text columns loaded, i.e. the
+  mapping before description/station_logs were deferred
+- ``orm_deferred``: select(Ticket) with the current mapping
+- ``projection``: the list_tickets column projection
+
+and prints the median wall time and the process RSS growth per path.
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app.database import engine
+from app.models.ticket import Ticket, TicketListView
+from app.services.ticket_query_service import serialize_ticket_list_row, ticket_list_query
+
+SIZES = [20, 100, 500]
+
+# ~1400 lines of 36 bytes: hex digests compress about as badly as real logs
+SEED_SQL = """
+    INSERT INTO tickets (
+        ticket_number, title, description, category, priority, status,
+        station_logs, created_at, updated_at, sla_breached,
+        comments_count, attachments_count
+    )
+    SELECT
+        'TEXT-' || g,
+        'Text column benchmark ' || g,
+        (SELECT string_agg(md5(g::text || '-d-' || i), ' ') FROM generate_series(1, 60) AS i),
+        'hardware', 'medium', 'new',
+        (SELECT string_agg('[OCPP] ' || md5(g::text || '-l-' || i), E'\\n')
+         FROM generate_series(1, 1300) AS i),
+        now() - g * interval '1 minute',
+        now() - g * interval '1 minute',
+        false, 0, 0
+    FROM generate_series(1, CAST(:count AS integer)) AS g
+"""
+
+
+def rss_kb() -> int:
+    """Current resident set size of this process (Linux)."""
+    with open("/proc/self/status") as status_file:
+        for line in status_file:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def orm_undeferred(db: AsyncSession, limit: int) -> list:
+    result = await db.execute(
+        select(Ticket)
+        .options(undefer(Ticket.description), undefer(Ticket.station_logs))
+        .order_by(Ticket.created_at.desc(), Ticket.id.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def orm_deferred(db: AsyncSession, limit: int) -> list:
+    result = await db.execute(
+        select(Ticket).order_by(Ticket.created_at.desc(), Ticket.id.desc()).limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def projection(db: AsyncSession, limit: int) -> list:
+    result = await db.execute(
+        ticket_list_query()
+        .order_by(TicketListView.created_at.desc(), TicketListView.id.desc())
+        .limit(limit)
+    )
+    return [serialize_ticket_list_row(row) for row in result.all()]
+
+
+async def measure(conn, path, limit: int, repeats: int) -> tuple[float, int]:
+    timings = []
+    rss_growth = 0
+    for _ in range(repeats):
+        # Fresh session each run so the identity map does not hide ORM cost
+        db = AsyncSession(bind=conn)
+        before = rss_kb()
+        started = time.perf_counter()
+        items = await path(db, limit)
+        timings.append((time.perf_counter() - started) * 1000)
+        rss_growth = max(rss_growth, rss_kb() - before)
+        del items
+        await db.close()
+    return statistics.median(timings), rss_growth
+
+
+async def main(seed_count: int, repeats: int):
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        try:
+            await conn.execute(text(SEED_SQL), {"count": seed_count})
+            await conn.execute(text("ANALYZE tickets"))
+            print(f"Seeded {seed_count} tickets with ~50 KB station logs")
+
+            paths = [orm_undeferred, orm_deferred, projection]
+            print(f"{'rows':>5}  " + "  ".join(f"{p.__name__:>26}" for p in paths))
+            for limit in SIZES:
+                cells = []
+                for path in paths:
+                    elapsed, growth = await measure(conn, path, limit, repeats)
+                    cells.append(f"{elapsed:9.1f} ms {growth / 1024:9.1f} MB RSS")
+                print(f"{limit:>5}  " + "  ".join(f"{cell:>26}" for cell in cells))
+        finally:
+            await outer.rollback()
+
+
+if __name__ == "__main__":
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    asyncio.run(main(seed, repeats))
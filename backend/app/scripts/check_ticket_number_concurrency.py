@@ -0,0 +1,117 @@
+"""Create tickets from many concurrent sessions and check their numbers.
+
+Usage: python -m app.scripts.check_ticket_number_concurrency [count] [workers]
+
+Tickets are created through the create_ticket endpoint, each worker in its
+own session, like concurrent requests. A first batch is created one at a
+time, so the concurrent creates are numbered against rows already in the
+table (besides any existing tickets). Fails on an IntegrityError from any
+create and on any ticket number the table then holds twice. Notification
+fan-out and event publishing are switched off, and every ticket created is
+deleted through delete_ticket at the end. Exits with status 1 on failure.
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from app.api.v1 import tickets as tickets_api
+from app.database import async_session_maker
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.schemas.ticket import TicketCreate
+from app.services.notification_service import NotificationService
+
+SEED_COUNT = 20
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+async def create_one(db, user: User, label: str, created: dict, errors: list):
+    try:
+        ticket = await tickets_api.create_ticket(
+            TicketCreate(title=f"Ticket number check {label}"), db, user
+        )
+    except IntegrityError as e:
+        await db.rollback()
+        errors.append(str(e.orig))
+        return
+    created[ticket.id] = ticket.ticket_number
+
+
+async def worker(queue: asyncio.Queue, user: User, created: dict, errors: list):
+    async with async_session_maker() as db:
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await create_one(db, user, str(i), created, errors)
+
+
+async def main(count: int, workers: int) -> int:
+    for name in [n for n in dir(NotificationService) if n.startswith("notify_")]:
+        setattr(NotificationService, name, _noop)
+    tickets_api.publish_event = _noop
+
+    async with async_session_maker() as db:
+        user = (await db.execute(select(User).where(User.is_active == True).limit(1))).scalar()
+        if not user:
+            print("Need at least one active user")
+            return 1
+        existing = (await db.execute(select(func.count()).select_from(Ticket))).scalar()
+
+    created: dict[int, str] = {}
+    errors: list[str] = []
+    try:
+        async with async_session_maker() as db:
+            for i in range(SEED_COUNT):
+                await create_one(db, user, f"seed {i}", created, errors)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in range(count):
+            queue.put_nowait(i)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(queue, user, created, errors) for _ in range(workers)))
+        elapsed = time.perf_counter() - started
+
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(Ticket.ticket_number)
+                .group_by(Ticket.ticket_number)
+                .having(func.count() > 1)
+            )
+            duplicates = result.scalars().all()
+    finally:
+        async with async_session_maker() as db:
+            for ticket_id in created:
+                await tickets_api.delete_ticket(ticket_id, db, user)
+        print(f"Deleted {len(created)} check tickets")
+
+    numbers = list(created.values())
+    print(
+        f"Created {len(numbers)} tickets ({SEED_COUNT} seeded, then {count} with "
+        f"{workers} workers in {elapsed:.2f}s) next to {existing} existing tickets"
+    )
+    if numbers:
+        print(f"Range: {min(numbers, key=int)}..{max(numbers, key=int)}")
+    print(f"Integrity errors: {len(errors)}, duplicate numbers: {len(duplicates)}")
+    for error in errors[:5]:
+        print(f"  {error}")
+    for number in duplicates[:5]:
+        print(f"  duplicate: {number}")
+
+    failed = errors or duplicates or len(numbers) != SEED_COUNT + count
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    # The default engine pool holds 15 connections
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    sys.exit(asyncio.run(main(count, workers)))
@@ -0,0 +1,142 @@
+"""Check that every ticket queue filter is served by an index.
+
+Usage: python -m app.scripts.check_ticket_query_plans [tickets_to_seed]
+
+Seeds synthetic tickets (default 50000) inside a transaction that is rolled
+back at the end, runs ANALYZE, then EXPLAINs the list_tickets page query for
+each filter combination the queue views use. Exits with status 1 if any plan
+reads tickets or ticket_list_view with a sequential scan. Needs at least one active
+user and one department; the database is left unchanged.
+"""
+import asyncio
+import json
+import sys
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.models.department import Department
+from app.models.ticket import TicketListView
+from app.models.user import User
+from app.services.ticket_query_service import ticket_filter_conditions, ticket_list_query
+
+PER_PAGE = 20
+# The list reads ticket_list_view, filled from tickets by triggers
+SCANNED_TABLES = ("tickets", "ticket_list_view")
+
+# Mostly finished tickets, like a real service desk after a few months
+SEED_SQL = """
+    WITH ids AS (
+        SELECT CAST(:user_ids AS integer[]) AS users,
+               CAST(:department_ids AS integer[]) AS departments
+    )
+    INSERT INTO tickets (
+        ticket_number, title, description, category, priority, status,
+        incident_type, assigned_department_id, assigned_user_id, created_by_id,
+        delegated_to_user_id, last_delegated_at, created_at, updated_at, sla_breached,
+        comments_count, attachments_count
+    )
+    SELECT
+        'PLAN-' || g,
+        'Query plan check ' || g,
+        'Synthetic ticket',
+        (ARRAY['hardware', 'software', 'network', 'billing', 'other'])[1 + g % 5],
+        (ARRAY['low', 'medium', 'medium', 'high', 'critical'])[1 + g % 5],
+        CASE WHEN g % 20 = 0 THEN 'new'
+             WHEN g % 20 IN (1, 2) THEN 'in_progress'
+             WHEN g % 20 = 3 THEN 'pending'
+             WHEN g % 20 = 4 THEN 'reviewing'
+             ELSE 'closed' END,
+        CASE WHEN g % 50 = 0 THEN 'plan_check' END,
+        departments[1 + g % cardinality(departments)],
+        CASE WHEN g % 3 = 0 THEN users[1 + g % cardinality(users)] END,
+        users[1 + (g / 7) % cardinality(users)],
+        CASE WHEN g % 97 = 0 THEN users[1 + g % cardinality(users)] END,
+        CASE WHEN g % 97 IN (0, 1) THEN now() - g * interval '5 minutes' END,
+        now() - g * interval '5 minutes',
+        now() - g * interval '5 minutes',
+        false, 0, 0
+    FROM ids, generate_series(1, CAST(:count AS integer)) AS g
+"""
+
+
+def queue_filters(user: User, department_id: int) -> dict[str, dict]:
+    """list_tickets filter combinations used by TicketsList and IncomingQueue."""
+    return {
+        "all": {},
+        "status": {"status": "new"},
+        "statuses": {"status": "in_progress,pending"},
+        "priority": {"priority": "critical"},
+        "category": {"category": "network"},
+        "incident type": {"incident_type": "plan_check"},
+        "department": {"assigned_department_id": department_id},
+        "incoming": {"department_id": department_id, "status": "new"},
+        "in progress": {"department_id": department_id, "status": "in_progress,pending"},
+        "completed": {"department_id": department_id, "status": "reviewing,closed"},
+        "assignee": {"assigned_user_id": user.id},
+        "my tickets tab": {"assigned_user_id": user.id, "status": "new,in_progress,pending,reviewing"},
+        "my tickets": {"my_tickets": True},
+        "created by": {"created_by_id": user.id},
+        "delegated to me": {"delegated_to_me": True},
+    }
+
+
+def seq_scanned_relations(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scanned_relations(child))
+    return found
+
+
+async def main(seed_count: int) -> int:
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        db = AsyncSession(bind=conn)
+        try:
+            user = (await db.execute(select(User).where(User.is_active == True).limit(1))).scalar()
+            user_ids = list((await db.execute(select(User.id))).scalars().all())
+            department_ids = list((await db.execute(select(Department.id))).scalars().all())
+            if not (user and department_ids):
+                print("Need at least one active user and department")
+                return 1
+
+            await db.execute(
+                text(SEED_SQL),
+                {"user_ids": user_ids, "department_ids": department_ids, "count": seed_count},
+            )
+            await db.execute(text("ANALYZE tickets, ticket_list_view"))
+            print(f"Seeded {seed_count} tickets")
+
+            failed = False
+            for name, filters in queue_filters(user, department_ids[0]).items():
+                conditions, _ = ticket_filter_conditions(user, **filters)
+                query = (
+                    ticket_list_query()
+                    .where(*conditions)
+                    .order_by(TicketListView.created_at.desc(), TicketListView.id.desc())
+                    .limit(PER_PAGE)
+                )
+                sql = str(query.compile(
+                    dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+                ))
+                # Driver-level execute: the literal SQL may contain "::" casts
+                plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                scanned = seq_scanned_relations(plan[0]["Plan"])
+                hit = [relation for relation in scanned if relation in SCANNED_TABLES]
+                failed = failed or bool(hit)
+                print(f"{name:<16} {'SEQ SCAN on ' + ', '.join(hit) if hit else 'ok'}")
+        finally:
+            await db.close()
+            await outer.rollback()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)))
@@ -0,0 +1,111 @@
+"""Check how many SQL statements the ticket write endpoints issue.
+
+Usage: python -m app.scripts.check_ticket_write_query_budget [ticket_id]
+
+Calls update, status, assign and delegate on an existing ticket inside an
+outer transaction that is rolled back at the end (endpoint commits become
+savepoints), so the database is left unchanged. Notification fan-out and
+event publishing are switched off: their query count depends on recipients,
+not on the endpoint. Exits with status 1 if any endpoint exceeds its budget.
+"""
+import asyncio
+import sys
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import tickets as tickets_api
+from app.database import engine
+from app.models.department import Department
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.schemas.ticket import (
+    TicketAssignUpdate,
+    TicketDelegateUpdate,
+    TicketStatusUpdate,
+    TicketUpdate,
+)
+from app.services.notification_service import NotificationService
+
+# Snapshot SELECT, history INSERT, ticket UPDATE ... RETURNING, plus one
+# lookup per newly referenced user/department not already in the session
+BUDGETS = {
+    "update_ticket": 3,
+    "update_ticket_status": 3,
+    "assign_ticket": 4,
+    "delegate_ticket": 5,
+}
+
+TRANSACTION_CONTROL = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+async def main(ticket_id: int = None) -> int:
+    for name in [n for n in dir(NotificationService) if n.startswith("notify_")]:
+        setattr(NotificationService, name, _noop)
+    tickets_api.publish_event = _noop
+
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        db = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+
+        ticket_id = ticket_id or (await db.execute(select(Ticket.id).limit(1))).scalar()
+        user = (await db.execute(select(User).where(User.is_active == True).limit(1))).scalar()
+        department_id = (await db.execute(select(Department.id).limit(1))).scalar()
+        if not (ticket_id and user and department_id):
+            print("Need at least one ticket, active user and department")
+            return 1
+        assignee_id = user.id
+
+        statements: list[str] = []
+
+        def count(conn, cursor, statement, *args):
+            if not statement.lstrip().upper().startswith(TRANSACTION_CONTROL):
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+        calls = {
+            "update_ticket": lambda: tickets_api.update_ticket(
+                ticket_id, TicketUpdate(title="Query budget check"), db, user
+            ),
+            "update_ticket_status": lambda: tickets_api.update_ticket_status(
+                ticket_id, TicketStatusUpdate(status="pending"), db, user
+            ),
+            "assign_ticket": lambda: tickets_api.assign_ticket(
+                ticket_id, TicketAssignUpdate(assigned_user_id=assignee_id), db, user
+            ),
+            "delegate_ticket": lambda: tickets_api.delegate_ticket(
+                ticket_id,
+                TicketDelegateUpdate(assigned_department_id=department_id, assigned_user_id=assignee_id),
+                db,
+                user,
+            ),
+        }
+
+        failed = False
+        try:
+            for name, call in calls.items():
+                # Start every endpoint from an empty identity map, like a request
+                db.expunge_all()
+                statements.clear()
+                await call()
+                used = len(statements)
+                ok = used <= BUDGETS[name]
+                failed = failed or not ok
+                print(f"{name:<22} {used:>3} / {BUDGETS[name]:<3} {'ok' if ok else 'OVER BUDGET'}")
+                if not ok:
+                    for statement in statements:
+                        print("    " + " ".join(statement.split())[:160])
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+            await db.close()
+            await outer.rollback()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else None)))
@@ -0,0 +1,176 @@
+"""Move existing log and attachment files into the content-addressed blob store.
+
+Usage: python -m app.scripts.dedupe_blob_storage [--dry-run]
+
+Files written before migration 036 live under LOGS_STORAGE_PATH and
+ATTACHMENTS_STORAGE_PATH, one copy per ticket. For every TicketLog and
+TicketAttachment row not yet in the store, the file is hashed (unless the
+row has its sha256), a reference to its blob is taken, the file is linked or
+copied to its blob path if that content is not stored yet, and the row
+repointed; the old files are deleted once the batch is committed. Afterwards every blob's ref_count is recounted from the rows,
+so content left without references is removed by the collector.
+
+Safe to re-run; rows already in the store are skipped. Run it while uploads
+are stopped, since the recount races with references taken meanwhile.
+--dry-run only reports how much space deduplication would free.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import sys
+import uuid
+from pathlib import Path
+
+from sqlalchemy import func, literal_column, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.blob import Blob
+from app.models.ticket import TicketAttachment, TicketLog
+from app.services.blob_store import blob_incoming_dir, blob_path
+from app.services.upload_service import UPLOAD_CHUNK_SIZE
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 200
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def materialize_blob(source: str, sha256: str) -> None:
+    """Give the content of ``source`` its blob path, leaving ``source`` in place."""
+    target = blob_path(sha256)
+    if target.exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staged = blob_incoming_dir() / str(uuid.uuid4())
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, staged)
+    except OSError:
+        # Old storage is on another volume
+        shutil.copyfile(source, staged)
+    os.replace(staged, target)
+
+
+async def migrate_files(model, dry_run: bool, seen: dict[str, int]) -> tuple[int, int]:
+    """Move one table's files into the store; returns (files moved, bytes freed)."""
+    blob_root = str(Path(settings.BLOBS_STORAGE_PATH)) + os.sep
+    moved = 0
+    freed = 0
+    last_id = 0
+
+    async with async_session_maker() as db:
+        while True:
+            result = await db.execute(
+                select(model.id, model.file_path, model.file_size, model.sha256)
+                .where(model.id > last_id, ~model.file_path.startswith(blob_root))
+                .order_by(model.id)
+                .limit(BATCH_SIZE)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            old_paths = []
+            for row in rows:
+                if not os.path.exists(row.file_path):
+                    logger.warning(f"{model.__tablename__} {row.id}: missing file {row.file_path}")
+                    continue
+
+                sha256 = row.sha256 or await asyncio.to_thread(hash_file, row.file_path)
+                if sha256 in seen or blob_path(sha256).exists():
+                    freed += row.file_size
+                seen.setdefault(sha256, row.file_size)
+                moved += 1
+                if dry_run:
+                    continue
+
+                # The row comes first, so the blob file is never without one and
+                # the row lock keeps the collector away until the batch commits
+                await db.execute(
+                    insert(Blob)
+                    .values(sha256=sha256, size=row.file_size, ref_count=1)
+                    .on_conflict_do_update(
+                        index_elements=[Blob.sha256],
+                        set_={"ref_count": Blob.ref_count + 1},
+                    )
+                )
+                await asyncio.to_thread(materialize_blob, row.file_path, sha256)
+                await db.execute(
+                    update(model)
+                    .where(model.id == row.id)
+                    .values(file_path=str(blob_path(sha256)), sha256=sha256)
+                )
+                old_paths.append(row.file_path)
+
+            await db.commit()
+            for path in old_paths:
+                os.remove(path)
+
+            logger.info(f"{model.__tablename__}: {moved} files processed")
+
+    return moved, freed
+
+
+async def recount_references() -> None:
+    """Set every blob's ref_count to the number of rows pointing at it."""
+    blob_root = str(Path(settings.BLOBS_STORAGE_PATH)) + os.sep
+    refs = union_all(
+        select(TicketAttachment.sha256, TicketAttachment.file_size.label("size"))
+        .where(TicketAttachment.file_path.startswith(blob_root)),
+        select(TicketLog.sha256, TicketLog.file_size.label("size"))
+        .where(TicketLog.file_path.startswith(blob_root)),
+    ).subquery()
+
+    async with async_session_maker() as db:
+        await db.execute(update(Blob).values(ref_count=0))
+        counts = select(
+            refs.c.sha256,
+            func.max(refs.c.size),
+            func.count(),
+        ).group_by(refs.c.sha256)
+        stmt = insert(Blob).from_select(["sha256", "size", "ref_count"], counts)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Blob.sha256],
+                set_={"ref_count": literal_column("excluded.ref_count")},
+            )
+        )
+        await db.commit()
+
+        total = (await db.execute(select(func.count()).select_from(Blob))).scalar()
+        unreferenced = (
+            await db.execute(select(func.count()).where(Blob.ref_count <= 0))
+        ).scalar()
+        logger.info(f"Recounted {total} blobs, {unreferenced} unreferenced")
+
+
+async def main(dry_run: bool) -> None:
+    seen: dict[str, int] = {}
+    moved = freed = 0
+    for model in (TicketAttachment, TicketLog):
+        model_moved, model_freed = await migrate_files(model, dry_run, seen)
+        moved += model_moved
+        freed += model_freed
+
+    verb = "Would free" if dry_run else "Freed"
+    logger.info(f"{moved} files, {len(seen)} distinct; {verb} {freed / (1024 * 1024):.1f}MB")
+
+    if not dry_run:
+        await recount_references()
+
+
+if __name__ == "__main__":
+    asyncio.run(main("--dry-run" in sys.argv[1:]))
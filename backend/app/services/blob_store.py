@@ -0,0 +1,104 @@
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import aiofiles
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.blob import Blob
+from app.services.upload_service import StoredUpload
+
+
+def blob_path(sha256: str) -> Path:
+    """Where the content with this hash lives: ``<root>/ab/cd/abcd...``."""
+    return Path(settings.BLOBS_STORAGE_PATH) / sha256[:2] / sha256[2:4] / sha256
+
+
+def blob_incoming_dir() -> Path:
+    """Staging directory for new files, on the same filesystem as the blobs."""
+    return Path(settings.BLOBS_STORAGE_PATH) / ".incoming"
+
+
+def partial_uploads_dir() -> Path:
+    """Directory of resumable uploads that have not been completed yet."""
+    return Path(settings.BLOBS_STORAGE_PATH) / ".uploads"
+
+
+class BlobStore:
+    """Content-addressed, reference-counted storage behind log and attachment files.
+
+    Each distinct content is kept once under its SHA-256, and ``blobs.ref_count``
+    counts the rows pointing at it. References are taken and dropped in the
+    caller's transaction; the caller commits. Blob files are only deleted by
+    the collector, once their count is zero (see ``collect_unreferenced_blobs``);
+    files left without a row by a rolled back transaction are handed to it by
+    ``register_orphaned_blob_files``.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add(self, stored: StoredUpload, keep_staged: bool = False) -> StoredUpload:
+        """Take one reference to the content of a staged, hashed file.
+
+        The staged file becomes the blob if the content is new, and is
+        discarded if the blob already exists. With ``keep_staged`` it is
+        linked to the blob path instead and always left to the caller, who
+        can then still put it back if the transaction fails. Returns the
+        blob location.
+        """
+        result = await self.db.execute(
+            insert(Blob)
+            .values(sha256=stored.sha256, size=stored.size, ref_count=1)
+            .on_conflict_do_update(
+                index_elements=[Blob.sha256],
+                set_={"ref_count": Blob.ref_count + 1},
+            )
+            .returning(Blob.ref_count)
+        )
+        ref_count = result.scalar_one()
+
+        path = blob_path(stored.sha256)
+        # A blob at 1 is new or was just collected, so its file may be gone;
+        # the row lock taken above keeps the collector off it until commit
+        if ref_count == 1 or not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if keep_staged:
+                # Linked under a temporary name first, since the blob path may hold an orphan
+                linked = blob_incoming_dir() / str(uuid.uuid4())
+                os.link(stored.path, linked)
+                os.replace(linked, path)
+            else:
+                os.replace(stored.path, path)
+        elif not keep_staged:
+            stored.path.unlink(missing_ok=True)
+
+        return StoredUpload(path, stored.size, stored.sha256)
+
+    async def add_bytes(self, data: bytes) -> StoredUpload:
+        """Take one reference to in-memory content, staging it first."""
+        directory = blob_incoming_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        staged = directory / str(uuid.uuid4())
+        async with aiofiles.open(staged, "wb") as f:
+            await f.write(data)
+        return await self.add(StoredUpload(staged, len(data), hashlib.sha256(data).hexdigest()))
+
+    async def release(self, sha256: Optional[str], file_path: str) -> None:
+        """Drop the reference a deleted log or attachment row held.
+
+        Files stored before the blob store existed are deleted directly.
+        """
+        if sha256 and Path(file_path) == blob_path(sha256):
+            await self.db.execute(
+                update(Blob)
+                .where(Blob.sha256 == sha256)
+                .values(ref_count=Blob.ref_count - 1)
+            )
+        elif os.path.exists(file_path):
+            os.remove(file_path)
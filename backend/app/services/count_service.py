@@ -0,0 +1,59 @@
+import json
+from typing import Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+# Query pattern of the ``count=`` option taken by every paginated list
+COUNT_MODE_PATTERN = "^(exact|estimate|none)$"
+
+# Below this many estimated rows an exact count is cheap, and a planner
+# estimate would be visibly wrong, so ``estimate`` counts exactly instead.
+ESTIMATE_EXACT_BELOW = 1000
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_rows(db: AsyncSession, query: Select) -> int:
+    """Rows the planner expects ``query`` to return; nothing is executed."""
+    plan = (await db.execute(Explain(query.order_by(None)))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_total(
+    db: AsyncSession,
+    query: Select,
+    mode: str = "exact",
+) -> tuple[Optional[int], str]:
+    """Total rows of a filtered, unpaginated list query for the ``count=`` mode.
+
+    Returns the total and the mode actually used: ``none`` skips counting,
+    ``estimate`` reads the planner's row estimate and ``exact`` runs
+    ``count(*)``. Small estimates are counted exactly and reported as such.
+    """
+    if mode == "none":
+        return None, "none"
+
+    if mode == "estimate":
+        estimate = await estimate_rows(db, query)
+        if estimate >= ESTIMATE_EXACT_BELOW:
+            return estimate, "estimate"
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar(), "exact"
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +12,7 @@ from app.models.notification import Notification
 from app.notifications.base import NotificationEvent
 from app.notifications.email_sender import EmailSender
 from app.notifications.telegram_sender import TelegramSender
+from app.services.realtime_service import publish_event
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ class NotificationService:
         self.db = db
         self.email_sender = EmailSender()
         self.telegram_sender = TelegramSender()
+        self._pending_notifications: list[Notification] = []
 
     async def notify_ticket_created(self, ticket: Ticket):
         """Notify about new ticket creation."""
@@ -62,9 +64,9 @@ class NotificationService:
                     title=f"Новий тікет #{ticket.ticket_number}",
                     message=f"Прийшов новий тікет \"{ticket.title}\" (пріоритет: {self._translate_priority(ticket.priority)})",
                 )
-                self.db.add(notification)
+                self._add_notification(notification)
         
-        await self.db.commit()
+        await self._commit_notifications()
 
         # Also send to standard recipients (assigned user, department head)
         recipients = await self._get_recipients(ticket, NotificationEvent.TICKET_CREATED)
@@ -92,8 +94,8 @@ class NotificationService:
             title=f"Вам призначено тікет #{ticket.ticket_number}",
             message=f"Вам призначено тікет \"{ticket.title}\" (пріоритет: {self._translate_priority(ticket.priority)})",
         )
-        self.db.add(notification)
-        await self.db.commit()
+        self._add_notification(notification)
+        await self._commit_notifications()
 
         # Check if user wants external notifications
         user_settings = await self._get_user_notification_settings(assigned_to.id)
@@ -134,7 +136,7 @@ class NotificationService:
                 title=f"Статус тікету #{ticket.ticket_number} змінено",
                 message=f"Статус тікету \"{ticket.title}\" змінено з \"{self._translate_status(old_status)}\" на \"{self._translate_status(new_status)}\"",
             )
-            self.db.add(notification)
+            self._add_notification(notification)
         
         # If status changed to resolved or closed, notify ticket handlers from the assigned department
         if new_status in ["reviewing", "closed"] and ticket.assigned_department_id:
@@ -168,9 +170,9 @@ class NotificationService:
                         title=f"Тікет #{ticket.ticket_number} {self._translate_status(new_status).lower()}",
                         message=f"Тікет \"{ticket.title}\" змінив статус на \"{self._translate_status(new_status)}\"",
                     )
-                    self.db.add(notification)
+                    self._add_notification(notification)
         
-        await self.db.commit()
+        await self._commit_notifications()
 
         template_data = {
             "ticket_number": ticket.ticket_number,
@@ -221,6 +223,171 @@ class NotificationService:
 
         await self._send_notifications(recipients, "ticket_sla_warning", template_data)
 
+    async def notify_tickets_bulk_updated(
+        self,
+        action: str,
+        tickets: list,
+        old_values: dict,
+        changed_by: User,
+    ):
+        """Notify about a bulk status change or delegation, once per recipient.
+
+        ``tickets`` are the updated rows and ``old_values`` the rows before the
+        change, keyed by ticket id. Each ticket picks its recipients the way
+        notify_ticket_status_changed, notify_ticket_assigned and
+        notify_ticket_created do; everyone then gets a single in-app
+        notification and at most one email/Telegram message listing all of
+        their tickets. Bulk assignment notifies nobody, like the single one.
+        """
+        from app.models.role import Role
+
+        department_ids = {t.assigned_department_id for t in tickets if t.assigned_department_id}
+        heads: dict[int, Optional[int]] = {}
+        members: dict[int, list[int]] = {}
+        if department_ids:
+            head_result = await self.db.execute(
+                select(Department.id, Department.head_user_id).where(Department.id.in_(department_ids))
+            )
+            heads = dict(head_result.all())
+            # Ticket handlers: the unified "user" role within each department
+            member_result = await self.db.execute(
+                select(User.id, User.department_id)
+                .join(User.roles)
+                .where(Role.name == "user", User.department_id.in_(department_ids))
+            )
+            for user_id, department_id in member_result.all():
+                members.setdefault(department_id, []).append(user_id)
+
+        def standard_recipients(ticket) -> set[int]:
+            """Creator, assignee and department head, as in _get_recipients."""
+            return {
+                user_id
+                for user_id in (
+                    ticket.created_by_id,
+                    ticket.assigned_user_id,
+                    heads.get(ticket.assigned_department_id),
+                )
+                if user_id
+            }
+
+        candidate_ids = set()
+        for ticket in tickets:
+            candidate_ids |= standard_recipients(ticket)
+        settings_result = await self.db.execute(
+            select(UserNotificationSettings).where(UserNotificationSettings.user_id.in_(candidate_ids))
+        )
+        settings_by_user = {s.user_id: s for s in settings_result.scalars().all()}
+
+        def wants(user_id: int, event: NotificationEvent) -> bool:
+            user_settings = settings_by_user.get(user_id)
+            return bool(user_settings and self._should_notify(user_settings, event))
+
+        # user_id -> {ticket_id: ticket}
+        in_app: dict[int, dict[int, Any]] = {}
+        external: dict[int, dict[int, Any]] = {}
+
+        for ticket in tickets:
+            old = old_values[ticket.id]
+
+            if action == "status":
+                if old.status == ticket.status:
+                    continue
+                for user_id in standard_recipients(ticket):
+                    if wants(user_id, NotificationEvent.TICKET_STATUS_CHANGED):
+                        in_app.setdefault(user_id, {})[ticket.id] = ticket
+                        external.setdefault(user_id, {})[ticket.id] = ticket
+                if ticket.status in ["reviewing", "closed"]:
+                    for user_id in members.get(ticket.assigned_department_id, []):
+                        in_app.setdefault(user_id, {})[ticket.id] = ticket
+
+            elif action == "delegate":
+                assignee_id = ticket.assigned_user_id
+                if assignee_id and assignee_id != old.assigned_user_id:
+                    in_app.setdefault(assignee_id, {})[ticket.id] = ticket
+                    if wants(assignee_id, NotificationEvent.TICKET_ASSIGNED):
+                        external.setdefault(assignee_id, {})[ticket.id] = ticket
+                if ticket.assigned_department_id != old.assigned_department_id:
+                    for user_id in members.get(ticket.assigned_department_id, []):
+                        if user_id != ticket.created_by_id:
+                            in_app.setdefault(user_id, {})[ticket.id] = ticket
+                    for user_id in standard_recipients(ticket):
+                        if wants(user_id, NotificationEvent.TICKET_CREATED):
+                            external.setdefault(user_id, {})[ticket.id] = ticket
+
+        if action == "status":
+            title_prefix = "Змінено статус тікетів"
+        else:
+            title_prefix = "Делеговано тікети"
+
+        for user_id, user_tickets in in_app.items():
+            rows = list(user_tickets.values())
+            self._add_notification(Notification(
+                user_id=user_id,
+                ticket_id=rows[0].id if len(rows) == 1 else None,
+                type="tickets_bulk_updated",
+                title=f"{title_prefix} ({len(rows)})",
+                message=self._ticket_numbers_summary(rows),
+            ))
+        await self._commit_notifications()
+
+        if not external:
+            return
+
+        users_result = await self.db.execute(select(User).where(User.id.in_(list(external))))
+        users = {user.id: user for user in users_result.scalars().all()}
+
+        for user_id, user_tickets in external.items():
+            user = users.get(user_id)
+            if not user:
+                continue
+            rows = list(user_tickets.values())
+            template_data = {
+                "action": action,
+                "count": len(rows),
+                "tickets": [
+                    {
+                        "ticket_number": ticket.ticket_number,
+                        "title": ticket.title,
+                        "status": self._translate_status(ticket.status),
+                        "url": f"{settings.FRONTEND_URL}/tickets/{ticket.id}",
+                    }
+                    for ticket in rows
+                ],
+                "changed_by": f"{changed_by.first_name} {changed_by.last_name}",
+                "url": f"{settings.FRONTEND_URL}/tickets",
+                "subject": f"{title_prefix} ({len(rows)})",
+            }
+            await self._send_to_user(user, settings_by_user[user_id], "tickets_bulk_updated", template_data)
+
+    def _ticket_numbers_summary(self, tickets: list, limit: int = 10) -> str:
+        """'#A, #B, #C та ще N' for an in-app notification message."""
+        numbers = ", ".join(f"#{ticket.ticket_number}" for ticket in tickets[:limit])
+        if len(tickets) > limit:
+            numbers += f" та ще {len(tickets) - limit}"
+        return numbers
+
+    def _add_notification(self, notification: Notification):
+        """Stage an in-app notification; pushed to the user after commit."""
+        self.db.add(notification)
+        self._pending_notifications.append(notification)
+
+    async def _commit_notifications(self):
+        """Commit staged notifications and push them to connected clients."""
+        await self.db.commit()
+        pending, self._pending_notifications = self._pending_notifications, []
+
+        # One pub/sub message per distinct notification, addressed to all its recipients
+        grouped: dict[tuple, list[int]] = {}
+        for notification in pending:
+            key = (notification.type, notification.ticket_id, notification.title)
+            grouped.setdefault(key, []).append(notification.user_id)
+        for (notification_type, ticket_id, title), user_ids in grouped.items():
+            await publish_event(
+                "notification.created",
+                {"type": notification_type, "ticket_id": ticket_id, "title": title},
+                user_ids=user_ids,
+            )
+
     async def _get_recipients(
         self,
         ticket: Ticket,
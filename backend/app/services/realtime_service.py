@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "servicedesk:events"
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def _get_redis() -> aioredis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def publish_event(
+    event_type: str,
+    data: dict[str, Any],
+    user_ids: Optional[list[int]] = None,
+):
+    """Publish an event to every API worker through Redis pub/sub.
+
+    ``user_ids`` limits delivery to those users; ``None`` broadcasts to all
+    connected clients. Push is best-effort: failures are logged and never break
+    the write path that emitted the event.
+    """
+    message = {
+        "type": event_type,
+        "data": data,
+        "user_ids": user_ids,
+        "ts": datetime.utcnow().isoformat(),
+    }
+    try:
+        await _get_redis().publish(EVENTS_CHANNEL, json.dumps(message, default=str))
+    except Exception as e:
+        logger.warning(f"Failed to publish {event_type} event: {e}")
+
+
+def ticket_event_data(ticket) -> dict[str, Any]:
+    """Small ticket payload that lets clients decide whether to refetch."""
+    return {
+        "ticket_id": ticket.id,
+        "ticket_number": ticket.ticket_number,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "assigned_user_id": ticket.assigned_user_id,
+        "assigned_department_id": ticket.assigned_department_id,
+    }
+
+
+class EventBroker:
+    """Per-worker fan-out of Redis events to connected stream clients.
+
+    Each uvicorn worker keeps one Redis subscription and a queue per open
+    stream, so the number of Redis connections does not grow with clients.
+    """
+
+    QUEUE_SIZE = 100
+    RECONNECT_DELAY = 3
+
+    def __init__(self):
+        self._subscribers: dict[asyncio.Queue, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._subscribers[queue] = user_id
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.pop(queue, None)
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _dispatch(self, message: dict):
+        user_ids = message.get("user_ids")
+        event = {"type": message["type"], "data": message.get("data", {}), "ts": message.get("ts")}
+        for queue, user_id in list(self._subscribers.items()):
+            if user_ids is not None and user_id not in user_ids:
+                continue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow client: drop the event, it will resync on reconnect
+                logger.debug(f"Dropping event for slow stream of user {user_id}")
+
+    async def _listen(self):
+        while True:
+            pubsub = None
+            try:
+                pubsub = _get_redis().pubsub()
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                async for raw in pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    try:
+                        self._dispatch(json.loads(raw["data"]))
+                    except (ValueError, KeyError) as e:
+                        logger.warning(f"Malformed realtime event: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Realtime subscription lost: {e}, reconnecting")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+
+event_broker = EventBroker()
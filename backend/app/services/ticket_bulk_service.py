@@ -0,0 +1,142 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, case, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ticket import Ticket, TicketComment, TicketHistory
+from app.models.user import User
+from app.schemas.ticket import TicketBulkOperation
+
+# action -> (permission code of the single-ticket endpoint, realtime event, history action)
+BULK_ACTIONS = {
+    "status": ("tickets.change_status", "ticket.status_changed", "status_changed"),
+    "assign": ("tickets.assign", "ticket.assigned", "assigned"),
+    "delegate": ("tickets.delegate", "ticket.delegated", "delegated"),
+}
+
+
+class TicketBulkService:
+    """Apply one status/assign/delegate change to many tickets in a few statements.
+
+    The changes mirror the single-ticket endpoints, but instead of loading
+    every ticket they run one locking SELECT of the old values, one
+    ``UPDATE ... RETURNING`` and one multi-row INSERT each for history and
+    comments, all in the caller's transaction. The caller commits.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(
+        self,
+        operation: TicketBulkOperation,
+        user: User,
+    ) -> tuple[list[Row], dict[int, Row]]:
+        """Return the updated ticket rows and the old values keyed by ticket id.
+
+        Ids that do not exist are simply missing from both.
+        """
+        ticket_ids = list(dict.fromkeys(operation.ticket_ids))
+
+        # Lock in id order so two overlapping bulk requests cannot deadlock
+        old_result = await self.db.execute(
+            select(
+                Ticket.id,
+                Ticket.status,
+                Ticket.assigned_user_id,
+                Ticket.assigned_department_id,
+            )
+            .where(Ticket.id.in_(ticket_ids))
+            .order_by(Ticket.id)
+            .with_for_update()
+        )
+        old_values = {row.id: row for row in old_result.all()}
+        if not old_values:
+            return [], old_values
+
+        values = self._update_values(operation)
+        if operation.comment:
+            values["comments_count"] = Ticket.comments_count + 1
+
+        result = await self.db.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(list(old_values)))
+            .values(**values)
+            .returning(
+                Ticket.id,
+                Ticket.ticket_number,
+                Ticket.title,
+                Ticket.priority,
+                Ticket.status,
+                Ticket.created_by_id,
+                Ticket.assigned_user_id,
+                Ticket.assigned_department_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        tickets = sorted(result.all(), key=lambda row: row.id)
+
+        history_action = BULK_ACTIONS[operation.action][2]
+        await self.db.execute(
+            insert(TicketHistory),
+            [
+                {
+                    "ticket_id": ticket.id,
+                    "user_id": user.id,
+                    "action": history_action,
+                    "old_value": self._history_value(operation.action, old_values[ticket.id]),
+                    "new_value": self._history_value(operation.action, ticket),
+                }
+                for ticket in tickets
+            ],
+        )
+
+        if operation.comment:
+            await self.db.execute(
+                insert(TicketComment),
+                [
+                    {
+                        "ticket_id": ticket.id,
+                        "user_id": user.id,
+                        "content": operation.comment,
+                        # Same visibility as the single-ticket endpoints
+                        "is_internal": operation.action == "status",
+                    }
+                    for ticket in tickets
+                ],
+            )
+
+        return tickets, old_values
+
+    def _update_values(self, operation: TicketBulkOperation) -> dict[str, Any]:
+        if operation.action == "status":
+            values: dict[str, Any] = {"status": operation.status}
+            if operation.status == "reviewing":
+                values["resolved_at"] = datetime.utcnow()
+            elif operation.status == "closed":
+                values["closed_at"] = datetime.utcnow()
+            return values
+
+        if operation.action == "assign":
+            return {
+                "assigned_user_id": operation.assigned_user_id,
+                "status": case((Ticket.status == "new", "in_progress"), else_=Ticket.status),
+            }
+
+        return {
+            "assigned_department_id": operation.assigned_department_id,
+            "assigned_user_id": operation.assigned_user_id,
+            "delegated_to_user_id": operation.assigned_user_id,
+            "last_delegated_at": datetime.utcnow(),
+        }
+
+    def _history_value(self, action: str, row: Row) -> dict[str, Any]:
+        if action == "status":
+            return {"status": row.status}
+        if action == "assign":
+            return {"assigned_user_id": row.assigned_user_id}
+        return {
+            "assigned_department_id": row.assigned_department_id,
+            "assigned_user_id": row.assigned_user_id,
+        }
@@ -0,0 +1,280 @@
+import asyncio
+import csv
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+from app.database import async_session_maker
+from app.models.ticket import Ticket, TicketListView
+from app.services.ticket_query_service import ticket_list_query
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_ROWS = 500  # rows fetched and written per batch
+OUTPUT_CHUNK_BYTES = 64 * 1024  # bytes per chunk sent to the client
+MAX_COLUMN_WIDTH = 50
+
+EXPORT_HEADERS = [
+    "Номер тікету", "Заголовок", "Опис", "Категорія", "Пріоритет", "Статус",
+    "Тип інциденту", "Тип клієнта", "Джерело звернення",
+    "Номер станції", "Назва станції", "ID станції", "Адреса станції", "Власник станції",
+    "Тип порту", "Модель авто",
+    "Ім'я заявника", "Телефон заявника", "Email заявника",
+    "Відповідальний", "Відділ", "Створив",
+    "Дата створення", "Дата оновлення", "Дата вирішення", "Дата закриття",
+    "SLA дедлайн", "SLA порушено", "Логи станції",
+]
+
+
+def ticket_export_query(conditions: list):
+    """Column projection of everything the export writes, newest first.
+
+    The list row comes from ticket_list_view; only the columns the list does
+    not carry are read from tickets, joined on the primary key.
+    """
+    return (
+        ticket_list_query()
+        .join(Ticket, Ticket.id == TicketListView.id)
+        .add_columns(
+            Ticket.description,
+            Ticket.incident_type,
+            Ticket.client_type,
+            Ticket.contact_source,
+            Ticket.port_type,
+            Ticket.vehicle,
+            Ticket.reporter_name,
+            Ticket.reporter_phone,
+            Ticket.reporter_email,
+            Ticket.updated_at,
+            Ticket.resolved_at,
+            Ticket.closed_at,
+            Ticket.station_logs,
+        )
+        .where(*conditions)
+        .order_by(TicketListView.created_at.desc(), TicketListView.id.desc())
+    )
+
+
+def _format_date(value) -> str:
+    return value.strftime("%d.%m.%Y %H:%M") if value else ""
+
+
+def _full_name(first_name: Optional[str], last_name: Optional[str]) -> str:
+    return f"{first_name} {last_name}" if first_name is not None else ""
+
+
+def export_row_values(row) -> list:
+    """Cell values of one export row, in EXPORT_HEADERS order."""
+    return [
+        row.ticket_number, row.title, row.description,
+        row.category, row.priority, row.status,
+        row.incident_type or "", row.client_type or "", row.contact_source or "",
+        row.station_number or "", row.station_name or "", row.station_code or "",
+        row.station_address or "", row.operator_name or "",
+        row.port_type or "", row.vehicle or "",
+        row.reporter_name or "", row.reporter_phone or "", row.reporter_email or "",
+        _full_name(row.assigned_user_first_name, row.assigned_user_last_name),
+        row.assigned_department_name or "",
+        _full_name(row.created_by_first_name, row.created_by_last_name),
+        _format_date(row.created_at),
+        _format_date(row.updated_at),
+        _format_date(row.resolved_at),
+        _format_date(row.closed_at),
+        _format_date(row.sla_due_date),
+        "Так" if row.sla_breached else "Ні",
+        row.station_logs or "",
+    ]
+
+
+class _ChunkWriter:
+    """Unseekable file object that hands written bytes to a queue in chunks.
+
+    zipfile writes to it with data descriptors instead of seeking back, so
+    the finished workbook never has to exist in memory as a whole.
+    """
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event):
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._buffer = bytearray()
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        if len(self._buffer) >= OUTPUT_CHUNK_BYTES:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        while True:
+            try:
+                self._chunks.put(chunk, timeout=1)
+                return
+            except queue.Full:
+                if self._cancelled.is_set():
+                    raise RuntimeError("Export cancelled by client")
+
+    def close(self):
+        self.flush()
+
+
+class _ExportWorkbook:
+    """Write-only workbook fed in batches; rows spill to a temp file, not RAM."""
+
+    def __init__(self):
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Tickets")
+        self._header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        self._header_font = Font(bold=True, color="FFFFFF")
+        self._header_alignment = Alignment(horizontal="center", vertical="center")
+        self._started = False
+
+    def _start(self, first_batch: list[list]):
+        # Write-only sheets emit column widths before any row, so they are
+        # sized from the header and the first batch instead of every cell
+        widths = [len(header) for header in EXPORT_HEADERS]
+        for values in first_batch:
+            for index, value in enumerate(values):
+                widths[index] = max(widths[index], len(str(value)))
+        for index, width in enumerate(widths, 1):
+            self.sheet.column_dimensions[get_column_letter(index)].width = min(
+                width + 2, MAX_COLUMN_WIDTH
+            )
+
+        header_cells = []
+        for header in EXPORT_HEADERS:
+            cell = WriteOnlyCell(self.sheet, value=header)
+            cell.fill = self._header_fill
+            cell.font = self._header_font
+            cell.alignment = self._header_alignment
+            header_cells.append(cell)
+        self.sheet.append(header_cells)
+        self._started = True
+
+    def append_batch(self, rows: list):
+        batch = [export_row_values(row) for row in rows]
+        if not self._started:
+            self._start(batch)
+        for values in batch:
+            self.sheet.append(values)
+
+    def finish(self, path: Path):
+        if not self._started:
+            self._start([])
+        self.workbook.save(path)
+
+    def save(self, chunks: queue.Queue, cancelled: threading.Event):
+        if not self._started:
+            self._start([])
+        writer = _ChunkWriter(chunks, cancelled)
+        self.workbook.save(writer)
+        writer.close()
+
+
+class _CsvExport:
+    """CSV export written straight to its file, one batch at a time."""
+
+    def __init__(self, path: Path):
+        # BOM so Excel opens the Cyrillic headers as UTF-8
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(EXPORT_HEADERS)
+
+    def append_batch(self, rows: list):
+        self._writer.writerows(export_row_values(row) for row in rows)
+
+    def finish(self, path: Path):
+        self._file.close()
+
+
+async def write_ticket_export_file(
+    conditions: list,
+    path: Path,
+    file_format: str = "xlsx",
+    on_progress: Optional[Callable[[int], Awaitable[None]]] = None,
+) -> int:
+    """Write the tickets matching ``conditions`` to ``path`` as xlsx or csv.
+
+    Used by background export jobs. Reads in EXPORT_CHUNK_ROWS batches like
+    stream_ticket_export and awaits ``on_progress(rows_written)`` after each
+    one. Returns the number of rows written.
+    """
+    export = _CsvExport(path) if file_format == "csv" else _ExportWorkbook()
+    rows_written = 0
+
+    async with async_session_maker() as db:
+        result = await db.stream(
+            ticket_export_query(conditions).execution_options(yield_per=EXPORT_CHUNK_ROWS)
+        )
+        async for rows in result.partitions():
+            await asyncio.to_thread(export.append_batch, rows)
+            rows_written += len(rows)
+            if on_progress:
+                await on_progress(rows_written)
+
+    await asyncio.to_thread(export.finish, path)
+    return rows_written
+
+
+async def stream_ticket_export(conditions: list) -> AsyncIterator[bytes]:
+    """Yield an .xlsx of the tickets matching ``conditions`` chunk by chunk.
+
+    Rows are read with a server-side cursor in EXPORT_CHUNK_ROWS batches and
+    written in a worker thread, so memory stays flat and the event loop keeps
+    serving other requests. Uses its own session because StreamingResponse
+    bodies run after request dependencies are closed.
+    """
+    export = _ExportWorkbook()
+
+    async with async_session_maker() as db:
+        result = await db.stream(
+            ticket_export_query(conditions).execution_options(yield_per=EXPORT_CHUNK_ROWS)
+        )
+        async for rows in result.partitions():
+            await asyncio.to_thread(export.append_batch, rows)
+
+    # Zip the sheet in a thread and forward its output as it is produced;
+    # the bounded queue stops the thread when the client reads slowly
+    chunks: queue.Queue = queue.Queue(maxsize=16)
+    cancelled = threading.Event()
+    done = object()
+    errors: list[BaseException] = []
+
+    def save():
+        try:
+            export.save(chunks, cancelled)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            while not cancelled.is_set():
+                try:
+                    chunks.put(done, timeout=1)
+                    break
+                except queue.Full:
+                    pass
+
+    thread = threading.Thread(target=save, name="ticket-export", daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = await asyncio.to_thread(chunks.get)
+            if chunk is done:
+                break
+            yield chunk
+    finally:
+        # Client went away: unblock the writer thread so it can exit
+        cancelled.set()
+
+    if errors:
+        logger.error(f"Ticket export failed while writing the workbook: {errors[0]}")
+        raise errors[0]
@@ -0,0 +1,167 @@
+from typing import Any, Optional
+
+from sqlalchemy import Select, or_, select
+
+from app.models.ticket import TicketListView
+from app.models.user import User
+from app.services.ticket_search_service import build_ticket_search
+from app.utils.fieldsets import FieldSpec, column_field, fieldset_columns, serialize_fieldset
+
+
+# TicketListResponse field -> (ticket_list_view columns, value from a row)
+TICKET_LIST_FIELDS: FieldSpec = {
+    "id": column_field(TicketListView.id),
+    "ticket_number": column_field(TicketListView.ticket_number),
+    "title": column_field(TicketListView.title),
+    "category": column_field(TicketListView.category),
+    "priority": column_field(TicketListView.priority),
+    "status": column_field(TicketListView.status),
+    "station": (
+        (
+            TicketListView.station_id.label("station_pk"),
+            TicketListView.station_code,
+            TicketListView.station_number,
+            TicketListView.station_name,
+            TicketListView.station_address,
+            TicketListView.operator_name,
+        ),
+        lambda row: {
+            "id": row.station_pk,
+            "station_id": row.station_code,
+            "station_number": row.station_number,
+            "name": row.station_name,
+            "address": row.station_address,
+            "operator_name": row.operator_name or "",
+        } if row.station_pk is not None else None,
+    ),
+    "assigned_user": (
+        (
+            TicketListView.assigned_user_id,
+            TicketListView.assigned_user_first_name,
+            TicketListView.assigned_user_last_name,
+            TicketListView.assigned_user_email,
+        ),
+        lambda row: {
+            "id": row.assigned_user_id,
+            "first_name": row.assigned_user_first_name,
+            "last_name": row.assigned_user_last_name,
+            "email": row.assigned_user_email,
+        } if row.assigned_user_id is not None else None,
+    ),
+    "assigned_department": (
+        (TicketListView.assigned_department_id, TicketListView.assigned_department_name),
+        lambda row: {
+            "id": row.assigned_department_id,
+            "name": row.assigned_department_name,
+        } if row.assigned_department_id is not None else None,
+    ),
+    "created_by": (
+        (
+            TicketListView.created_by_id,
+            TicketListView.created_by_first_name,
+            TicketListView.created_by_last_name,
+            TicketListView.created_by_email,
+        ),
+        lambda row: {
+            "id": row.created_by_id,
+            "first_name": row.created_by_first_name,
+            "last_name": row.created_by_last_name,
+            "email": row.created_by_email,
+        } if row.created_by_id is not None else None,
+    ),
+    "created_at": column_field(TicketListView.created_at),
+    "sla_due_date": column_field(TicketListView.sla_due_date),
+    "sla_breached": column_field(TicketListView.sla_breached),
+    "comments_count": column_field(TicketListView.comments_count),
+    "attachments_count": column_field(TicketListView.attachments_count),
+}
+
+
+def ticket_list_query(fieldset: Optional[list[str]] = None) -> Select:
+    """Single-table SELECT of exactly the columns a ticket list row needs.
+
+    Reads the ``ticket_list_view`` read model, which already carries station,
+    operator, assignee, creator and department names, so there are no joins,
+    no ORM objects and no heavy columns such as ``description``. Filter and
+    order with TicketListView columns. A ``fieldset`` narrows the projection
+    to those TicketListResponse fields; ``id`` and ``created_at`` are always
+    selected for keyset cursors.
+    """
+    fieldset = list(fieldset or TICKET_LIST_FIELDS)
+    return select(*fieldset_columns(TICKET_LIST_FIELDS, [*fieldset, "id", "created_at"]))
+
+
+def serialize_ticket_list_row(row: Any, fieldset: Optional[list[str]] = None) -> dict:
+    """Turn a ticket_list_query() row into a TicketListResponse-shaped dict."""
+    return serialize_fieldset(row, TICKET_LIST_FIELDS, fieldset or TICKET_LIST_FIELDS)
+
+
+def ticket_filter_conditions(
+    current_user: User,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    assigned_user_id: Optional[int] = None,
+    assigned_department_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    station_id: Optional[int] = None,
+    operator_id: Optional[int] = None,
+    created_by_id: Optional[int] = None,
+    incident_type: Optional[str] = None,
+    my_tickets: bool = False,
+    delegated_to_me: bool = False,
+) -> tuple[list, Optional[Any]]:
+    """WHERE conditions for the ticket list filters, on TicketListView.
+
+    Shared by every endpoint that takes the list filters so they select the
+    same tickets. Returns the conditions and, for searches, the relevance rank
+    expression (``None`` otherwise).
+    """
+    conditions = []
+
+    search_rank = None
+    if search and search.strip():
+        search_condition, search_rank = build_ticket_search(search)
+        conditions.append(search_condition)
+    if status:
+        # Support multiple statuses separated by comma
+        if ',' in status:
+            statuses = [s.strip() for s in status.split(',')]
+            conditions.append(TicketListView.status.in_(statuses))
+        else:
+            conditions.append(TicketListView.status == status)
+    if priority:
+        conditions.append(TicketListView.priority == priority)
+    if category:
+        conditions.append(TicketListView.category == category)
+    if assigned_user_id is not None:
+        conditions.append(TicketListView.assigned_user_id == assigned_user_id)
+    if assigned_department_id is not None:
+        conditions.append(TicketListView.assigned_department_id == assigned_department_id)
+    if department_id is not None:
+        # Filter by department (either assigned or related)
+        conditions.append(TicketListView.assigned_department_id == department_id)
+    if station_id is not None:
+        conditions.append(TicketListView.station_id == station_id)
+    if operator_id is not None:
+        conditions.append(TicketListView.operator_id == operator_id)
+    if created_by_id is not None:
+        conditions.append(TicketListView.created_by_id == created_by_id)
+    if incident_type is not None:
+        conditions.append(TicketListView.incident_type == incident_type)
+    if my_tickets:
+        conditions.append(
+            or_(
+                TicketListView.assigned_user_id == current_user.id,
+                TicketListView.created_by_id == current_user.id,
+            )
+        )
+    if delegated_to_me:
+        # Tickets that were ever delegated and are now assigned to the current
+        # user, including ones delegated to a department and then claimed
+        # (partial index ix_ticket_list_view_delegated_assigned_user_id)
+        conditions.append(TicketListView.last_delegated_at.isnot(None))
+        conditions.append(TicketListView.assigned_user_id == current_user.id)
+
+    return conditions, search_rank
@@ -0,0 +1,55 @@
+from sqlalchemy import case, func, literal, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.ticket import TicketListView
+
+# pg_trgm extracts trigrams, so shorter terms never hit the GIN indexes
+MIN_TRIGRAM_LENGTH = 3
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_ticket_search(term: str) -> tuple[ColumnElement, ColumnElement]:
+    """Build the WHERE condition and relevance expression for a search term.
+
+    Long terms use ILIKE '%term%', served by the pg_trgm GIN indexes on
+    ticket_list_view (migration 032), and are ranked by trigram similarity.
+    Shorter terms cannot use trigrams and fall back to prefix matches: on
+    the ticket number, and case-insensitively on the title and station
+    number/code, each served by a pattern index on lower(column).
+
+    Station numbers live on the same ticket_list_view row as the ticket
+    columns, so the OR is planned as a BitmapOr over one table's indexes.
+    """
+    term = term.strip()
+    escaped = _escape_like(term)
+
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        prefix = f"{escaped.lower()}%"
+        condition = or_(
+            TicketListView.ticket_number.like(f"{escaped}%"),
+            func.lower(TicketListView.title).like(prefix),
+            func.lower(TicketListView.station_number).like(prefix),
+            func.lower(TicketListView.station_code).like(prefix),
+        )
+        rank = case((TicketListView.ticket_number == term, 1.0), else_=0.0)
+    else:
+        pattern = f"%{escaped}%"
+        condition = or_(
+            TicketListView.ticket_number.ilike(pattern),
+            TicketListView.title.ilike(pattern),
+            TicketListView.station_number.ilike(pattern),
+            TicketListView.station_code.ilike(pattern),
+        )
+        rank = case(
+            (TicketListView.ticket_number == term, 2.0),
+            else_=func.greatest(
+                func.similarity(TicketListView.ticket_number, literal(term)),
+                func.word_similarity(literal(term), TicketListView.title),
+            ),
+        )
+
+    return condition, rank
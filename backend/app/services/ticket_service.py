@@ -1,8 +1,10 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.department import Department
 from app.models.ticket import Ticket
@@ -13,6 +15,35 @@ class TicketService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def adjust_counters(
+        self,
+        ticket_id: int,
+        comments: int = 0,
+        attachments: int = 0,
+    ) -> None:
+        """Shift the denormalized comments_count/attachments_count of a ticket.
+
+        A single ``UPDATE ... SET n = n + delta`` in the caller's transaction,
+        so concurrent writers never lose an increment. A Ticket already loaded
+        in the session is given the new values without another query.
+        """
+        result = await self.db.execute(
+            update(Ticket)
+            .where(Ticket.id == ticket_id)
+            .values(
+                comments_count=Ticket.comments_count + comments,
+                attachments_count=Ticket.attachments_count + attachments,
+            )
+            .returning(Ticket.comments_count, Ticket.attachments_count, Ticket.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        ticket = self.db.identity_map.get(identity_key(Ticket, ticket_id))
+        if row is not None and ticket is not None:
+            set_committed_value(ticket, "comments_count", row.comments_count)
+            set_committed_value(ticket, "attachments_count", row.attachments_count)
+            set_committed_value(ticket, "updated_at", row.updated_at)
+
     async def auto_assign_ticket(
         self,
         ticket: Ticket,
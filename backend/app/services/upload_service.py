@@ -0,0 +1,164 @@
+import asyncio
+import fcntl
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, NamedTuple, Optional
+
+import aiofiles
+from fastapi import HTTPException, UploadFile, status
+from starlette.requests import ClientDisconnect
+
+# Bytes read, hashed and written per step; peak memory per upload
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredUpload(NamedTuple):
+    path: Path
+    size: int
+    sha256: str
+
+
+async def store_upload(
+    file: UploadFile,
+    directory: Path,
+    suffix: str,
+    max_size: int,
+) -> StoredUpload:
+    """Stream an upload into ``directory`` one chunk at a time.
+
+    The size limit is checked and the SHA-256 computed as chunks arrive, so
+    an oversized upload is rejected with 413 as soon as it passes the limit.
+    Data goes to a ``.part`` file in the target directory that is fsynced and
+    renamed into place only when the whole upload was accepted; on any error
+    it is removed and nothing is left behind.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    final_path = directory / f"{uuid.uuid4()}{suffix}"
+    temp_path = directory / f".{final_path.name}.part"
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Maximum size is {max_size // (1024 * 1024)}MB",
+                    )
+                digest.update(chunk)
+                await out.write(chunk)
+            await out.flush()
+            await asyncio.to_thread(os.fsync, out.fileno())
+        os.replace(temp_path, final_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return StoredUpload(final_path, size, digest.hexdigest())
+
+
+def _lock_partial_upload(fileno: int) -> None:
+    """Take the exclusive lock on a resumable upload file, or fail with 409.
+
+    Released when the file is closed, so only one request writes or
+    completes an upload at a time.
+    """
+    try:
+        fcntl.flock(fileno, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Another request is writing this upload",
+        )
+
+
+def _offset_mismatch(received: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Upload offset mismatch, {received} bytes received",
+        headers={"Upload-Offset": str(received)},
+    )
+
+
+async def append_upload_chunk(
+    chunks: AsyncIterator[bytes],
+    path: Path,
+    offset: int,
+    total_size: int,
+) -> int:
+    """Append a request body to a resumable upload file at ``offset``.
+
+    The file's size is the number of bytes received, and ``offset`` must
+    match it (409 with the real offset in ``Upload-Offset`` otherwise). If
+    the client disconnects mid-chunk, the bytes that did arrive are kept so
+    the next chunk resumes after them. Returns the new received size.
+    """
+    async with aiofiles.open(path, "r+b") as out:
+        _lock_partial_upload(out.fileno())
+        received = os.fstat(out.fileno()).st_size
+        if offset != received:
+            raise _offset_mismatch(received)
+
+        await out.seek(offset)
+        size = offset
+        try:
+            async for chunk in chunks:
+                if size + len(chunk) > total_size:
+                    await out.truncate(offset)
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Chunk runs past the upload size of {total_size} bytes",
+                    )
+                await out.write(chunk)
+                size += len(chunk)
+        except ClientDisconnect:
+            pass
+        await out.flush()
+        await asyncio.to_thread(os.fsync, out.fileno())
+
+    return size
+
+
+def _hash_file(fileno: int) -> str:
+    digest = hashlib.sha256()
+    os.lseek(fileno, 0, os.SEEK_SET)
+    while chunk := os.read(fileno, UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def finish_partial_upload(
+    path: Path,
+    directory: Path,
+    suffix: str,
+    total_size: int,
+    expected_sha256: Optional[str] = None,
+) -> StoredUpload:
+    """Move a fully received resumable upload into ``directory``.
+
+    Fails with 409 while bytes are missing or another request holds the
+    upload, and with 400 if the content does not match ``expected_sha256``.
+    The SHA-256 is computed in a worker thread, one chunk at a time.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    final_path = directory / f"{uuid.uuid4()}{suffix}"
+
+    with open(path, "rb") as part:
+        _lock_partial_upload(part.fileno())
+        received = os.fstat(part.fileno()).st_size
+        if received != total_size:
+            raise _offset_mismatch(received)
+        sha256 = await asyncio.to_thread(_hash_file, part.fileno())
+        if expected_sha256 and sha256 != expected_sha256:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Uploaded content does not match the sha256 checksum",
+            )
+        # Renamed while still locked so no chunk can be written after hashing
+        os.replace(path, final_path)
+
+    return StoredUpload(final_path, total_size, sha256)
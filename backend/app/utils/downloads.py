@@ -0,0 +1,152 @@
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
+
+import aiofiles
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.config import settings
+
+# Bytes read per step when sending part of a file
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+def _content_disposition(filename: str, inline: bool) -> str:
+    disposition = "inline" if inline else "attachment"
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{filename}"'
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Whether the client's cached copy is current (If-None-Match wins over If-Modified-Since)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _requested_range(
+    request: Request,
+    size: int,
+    etag: str,
+    last_modified: str,
+) -> Optional[tuple[int, int]]:
+    """Inclusive byte range asked for by a single-range ``Range`` header.
+
+    ``None`` means send the whole file: no header, a syntax or multi-range
+    request we do not serve, or an ``If-Range`` validator that no longer
+    matches. Raises 416 when the range lies past the end of the file.
+    """
+    header = request.headers.get("range")
+    if not header:
+        return None
+
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() not in (etag, last_modified):
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = spec.strip().partition("-")
+    if not dash:
+        return None
+
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start, end = max(size - int(last), 0), size - 1
+    except ValueError:
+        return None
+
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
+async def _file_chunks(path: str, start: int, length: int) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def file_download_response(
+    request: Request,
+    path: str,
+    filename: str,
+    media_type: str,
+    inline: bool = False,
+    sha256: Optional[str] = None,
+) -> Response:
+    """Send a stored file once the caller has checked access to it.
+
+    With DOWNLOAD_ACCEL_REDIRECT_PREFIX set, only an ``X-Accel-Redirect``
+    header is returned and nginx sends the bytes itself, ranges and
+    revalidation included (nginx drops the security headers on the redirect,
+    so its internal location sets them again). Otherwise the file is served here with an ETag
+    (the content hash when known) and Last-Modified, answering conditional
+    requests with 304 and single byte ranges with 206.
+    """
+    headers = {
+        "Content-Disposition": _content_disposition(filename, inline),
+        "Accept-Ranges": "bytes",
+        # Authenticated content: cache per user, but revalidate every time
+        "Cache-Control": "private, no-cache",
+        # User-supplied content on the app's origin: never sniffed into
+        # something executable, and opened as an opaque origin if rendered
+        "X-Content-Type-Options": "nosniff",
+        "Content-Security-Policy": "sandbox",
+    }
+
+    if settings.DOWNLOAD_ACCEL_REDIRECT_PREFIX:
+        headers["X-Accel-Redirect"] = settings.DOWNLOAD_ACCEL_REDIRECT_PREFIX + quote(path)
+        return Response(headers=headers, media_type=media_type)
+
+    stat = os.stat(path)
+    etag = f'"{sha256}"' if sha256 else f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+    headers["ETag"] = etag
+    headers["Last-Modified"] = last_modified
+
+    if _not_modified(request, etag, stat.st_mtime):
+        del headers["Content-Disposition"]
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = _requested_range(request, stat.st_size, etag, last_modified)
+    if byte_range is None:
+        return FileResponse(path, headers=headers, media_type=media_type, stat_result=stat)
+
+    start, end = byte_range
+    length = end - start + 1
+    headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    headers["Content-Length"] = str(length)
+    return StreamingResponse(
+        _file_chunks(path, start, length),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        headers=headers,
+        media_type=media_type,
+    )
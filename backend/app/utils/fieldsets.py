@@ -0,0 +1,72 @@
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Response field -> (columns to SELECT, value built from a result row)
+FieldSpec = dict[str, tuple[tuple, Callable[[Any], Any]]]
+
+
+def parse_fieldset(
+    fields: Optional[str],
+    allowed: Iterable[str],
+    always: Iterable[str] = ("id",),
+) -> list[str]:
+    """Parse a sparse fieldset such as ``fields=id,title,status``.
+
+    Returns the requested names in ``allowed`` order, plus ``always``;
+    ``None`` or an empty value means every allowed field. Raises 400 on
+    unknown names.
+    """
+    allowed = list(allowed)
+    if not fields:
+        return allowed
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    requested |= set(always)
+    return [name for name in allowed if name in requested]
+
+
+def column_field(column) -> tuple[tuple, Callable[[Any], Any]]:
+    """FieldSpec entry for a field that is a single column returned as is."""
+    return (column,), attrgetter(column.key)
+
+
+def translated_field(column, column_en, use_en: bool) -> tuple[tuple, Callable[[Any], Any]]:
+    """FieldSpec entry preferring the ``*_en`` column when English is asked for and set."""
+    def value(row):
+        if use_en and getattr(row, column_en.key):
+            return getattr(row, column_en.key)
+        return getattr(row, column.key)
+
+    return (column, column_en), value
+
+
+def fieldset_columns(spec: FieldSpec, fieldset: Iterable[str]) -> list:
+    """Columns to SELECT for the fields in a fieldset, each once."""
+    columns = {}
+    for name in fieldset:
+        for column in spec[name][0]:
+            columns.setdefault(column.key, column)
+    return list(columns.values())
+
+
+def serialize_fieldset(row: Any, spec: FieldSpec, fieldset: Iterable[str]) -> dict[str, Any]:
+    """Build the fieldset's response values from a fieldset_columns() row."""
+    return {name: spec[name][1](row) for name in fieldset}
+
+
+def fieldset_response(content: dict[str, Any]) -> JSONResponse:
+    """Send a response whose items only carry the requested fields.
+
+    Returned as a Response, so FastAPI skips the endpoint's response_model,
+    which would reject the missing fields.
+    """
+    return JSONResponse(jsonable_encoder(content))
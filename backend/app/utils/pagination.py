@@ -0,0 +1,95 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, item_id: int, direction: str = "next") -> str:
+    """Encode a keyset position into an opaque URL-safe token."""
+    payload = {"c": created_at.isoformat(), "i": item_id, "d": direction}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[datetime, int, str]:
+    """Decode a token produced by encode_cursor. Raises 400 on malformed input."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at = datetime.fromisoformat(payload["c"])
+        item_id = int(payload["i"])
+        direction = payload.get("d", "next")
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return created_at, item_id, direction
+
+
+def encode_watermark(
+    ticket_position: tuple[datetime, int],
+    tombstone_position: tuple[datetime, int],
+) -> str:
+    """Encode delta-sync positions (ticket ``updated_at``/id and tombstone
+    ``deleted_at``/id) into an opaque URL-safe token."""
+    payload = {
+        "t": [ticket_position[0].isoformat(), ticket_position[1]],
+        "d": [tombstone_position[0].isoformat(), tombstone_position[1]],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_watermark(token: str) -> tuple[tuple[datetime, int], tuple[datetime, int]]:
+    """Decode a token produced by encode_watermark. Raises 400 on malformed input."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        positions = []
+        for key in ("t", "d"):
+            timestamp, item_id = payload[key]
+            timestamp = datetime.fromisoformat(timestamp)
+            if timestamp.tzinfo is None:
+                raise ValueError(timestamp)
+            positions.append((timestamp, int(item_id)))
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid watermark",
+        )
+    return positions[0], positions[1]
+
+
+def encode_timeline_cursor(timestamp: datetime, kind: str, item_id: int) -> str:
+    """Encode a ticket timeline position into an opaque URL-safe token."""
+    payload = {"c": timestamp.isoformat(), "k": kind, "i": item_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_timeline_cursor(token: str) -> tuple[datetime, str, int]:
+    """Decode a token produced by encode_timeline_cursor. Raises 400 on malformed input."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        timestamp = datetime.fromisoformat(payload["c"])
+        kind = str(payload["k"])
+        item_id = int(payload["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return timestamp, kind, item_id
+
+
+def page_count(total: Optional[int], per_page: int) -> Optional[int]:
+    """Number of pages for a total, or None when the total was not counted."""
+    if total is None:
+        return None
+    return (total + per_page - 1) // per_page
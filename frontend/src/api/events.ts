@@ -0,0 +1,118 @@
+import client from './client'
+
+export interface ServerEvent {
+  type: string
+  data: Record<string, any>
+  ts: string | null
+}
+
+type EventListener = (event: ServerEvent) => void
+type StatusListener = (connected: boolean) => void
+
+export const TICKET_EVENT_TYPES = [
+  'ticket.created',
+  'ticket.updated',
+  'ticket.status_changed',
+  'ticket.assigned',
+  'ticket.delegated',
+  'ticket.commented',
+  'ticket.deleted',
+  // One event per bulk status/assign/delegate, listing every ticket changed
+  'tickets.bulk_updated',
+]
+
+const EVENT_TYPES = [...TICKET_EVENT_TYPES, 'notification.created']
+const RECONNECT_DELAY = 5000
+
+// One shared EventSource per browser tab, regardless of how many components listen
+let source: EventSource | null = null
+let connected = false
+let reconnectTimer: ReturnType<typeof setTimeout> | null = null
+const listeners = new Set<EventListener>()
+const statusListeners = new Set<StatusListener>()
+
+const setConnected = (value: boolean) => {
+  if (connected === value) return
+  connected = value
+  statusListeners.forEach((listener) => listener(value))
+}
+
+let connecting = false
+
+const scheduleReconnect = () => {
+  if (listeners.size > 0 && !reconnectTimer) {
+    reconnectTimer = setTimeout(connect, RECONNECT_DELAY)
+  }
+}
+
+const connect = async () => {
+  reconnectTimer = null
+  if (connecting || !localStorage.getItem('access_token') || listeners.size === 0) return
+
+  // EventSource cannot send headers, so a short-lived stream token goes in
+  // the query string; the access token itself never appears in a URL
+  let token: string
+  connecting = true
+  try {
+    const response = await client.post<{ token: string; expires_at: string }>('/events/stream-token')
+    token = response.data.token
+  } catch (error) {
+    console.error('Could not open the event stream', error)
+    scheduleReconnect()
+    return
+  } finally {
+    connecting = false
+  }
+  if (source || listeners.size === 0) return
+
+  source = new EventSource(`${client.defaults.baseURL}/events/stream?token=${encodeURIComponent(token)}`)
+  source.addEventListener('ready', () => setConnected(true))
+  EVENT_TYPES.forEach((type) => {
+    source?.addEventListener(type, (message) => {
+      try {
+        const event = JSON.parse((message as MessageEvent).data) as ServerEvent
+        listeners.forEach((listener) => listener(event))
+      } catch (error) {
+        console.error('Malformed server event', error)
+      }
+    })
+  })
+  source.onerror = () => {
+    // Reopen with a fresh stream token: the one in the URL is only good for a minute,
+    // and the server ends the stream when the access token it was opened with expires
+    setConnected(false)
+    source?.close()
+    source = null
+    scheduleReconnect()
+  }
+}
+
+const disconnect = () => {
+  if (reconnectTimer) {
+    clearTimeout(reconnectTimer)
+    reconnectTimer = null
+  }
+  source?.close()
+  source = null
+  setConnected(false)
+}
+
+export const eventsApi = {
+  subscribe: (listener: EventListener): (() => void) => {
+    listeners.add(listener)
+    if (!source && !reconnectTimer) connect()
+    return () => {
+      listeners.delete(listener)
+      if (listeners.size === 0) disconnect()
+    }
+  },
+
+  onStatusChange: (listener: StatusListener): (() => void) => {
+    statusListeners.add(listener)
+    return () => {
+      statusListeners.delete(listener)
+    }
+  },
+
+  isConnected: (): boolean => connected,
+}
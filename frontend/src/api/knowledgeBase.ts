@@ -36,6 +36,7 @@ export interface ArticleListParams {
   language?: string
   is_published?: boolean
   tags?: string[]
+  fields?: string  // comma-separated item fields, e.g. 'id,title'
 }
 
 export interface CreateArticleData {
@@ -61,6 +61,7 @@ export interface StationListParams {
   city?: string
   station_status?: string
   language?: string
+  fields?: string  // comma-separated item fields, e.g. 'id,name'
 }
 
 export interface CreateStationPort {
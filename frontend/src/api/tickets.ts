@@ -160,14 +160,87 @@ export interface TicketListParams {
   my_tickets?: boolean
   delegated_to_me?: boolean
   incident_type?: string
+  pagination?: 'offset' | 'cursor'
+  cursor?: string
+  count?: 'exact' | 'estimate' | 'none'
+  fields?: string  // comma-separated item fields, e.g. 'id,ticket_number,title'
 }
 
 export interface PaginatedResponse<T> {
   items: T[]
   total: number
+  total_mode?: 'exact' | 'estimate' | 'none'
   page: number
   per_page: number
   pages: number
+  next_cursor?: string | null
+  prev_cursor?: string | null
+}
+
+export interface TicketChanges {
+  items: Ticket[]
+  removed: number[]
+  watermark: string
+  has_more: boolean
+}
+
+export interface TicketTimelineItem {
+  kind: 'history' | 'comment' | 'attachment' | 'log'
+  id: number
+  timestamp: string
+  history: TicketHistory | null
+  comment: TicketComment | null
+  attachment: TicketAttachment | null
+  log: TicketLog | null
+}
+
+export interface TicketTimeline {
+  items: TicketTimelineItem[]
+  next_cursor: string | null
+}
+
+export interface TicketBatch {
+  items: Partial<Ticket>[]
+  missing: number[]
+}
+
+export interface TicketBulkOperation {
+  ticket_ids: number[]
+  action: 'status' | 'assign' | 'delegate'
+  status?: string
+  assigned_user_id?: number | null
+  assigned_department_id?: number
+  comment?: string
+}
+
+export interface TicketBulkResult {
+  results: { ticket_id: number; ok: boolean; error: string | null }[]
+  updated: number
+}
+
+export interface TicketAttachmentUpload {
+  id: number
+  filename: string
+  mime_type: string | null
+  total_size: number
+  offset: number
+  expires_at: string
+}
+
+export interface ExportJob {
+  id: number
+  file_format: 'xlsx' | 'csv'
+  filters: Record<string, unknown>
+  status: 'pending' | 'running' | 'completed' | 'failed'
+  rows_total: number | null
+  rows_written: number
+  progress: number
+  file_size: number | null
+  error: string | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+  download_url: string | null
 }
 
 export interface CreateTicketData {
@@ -197,6 +270,22 @@ export const ticketsApi = {
     return response.data
   },
 
+  // Call without `since` before loading the list, then poll with the returned watermark
+  changes: async (
+    since?: string,
+    params?: Omit<TicketListParams, 'page' | 'per_page' | 'pagination' | 'cursor' | 'count'>,
+  ): Promise<TicketChanges> => {
+    const response = await client.get<TicketChanges>('/tickets/changes', { params: { ...params, since } })
+    return response.data
+  },
+
+  batch: async (ids: number[], fields?: (keyof Ticket)[]): Promise<TicketBatch> => {
+    const response = await client.get<TicketBatch>('/tickets/batch', {
+      params: { ids: ids.join(','), fields: fields?.join(',') },
+    })
+    return response.data
+  },
+
   get: async (id: number): Promise<Ticket & {
     comments: TicketComment[]
     history: TicketHistory[]
@@ -241,6 +330,16 @@ export const ticketsApi = {
     return response.data
   },
 
+  bulk: async (operation: TicketBulkOperation): Promise<TicketBulkResult> => {
+    const response = await client.post<TicketBulkResult>('/tickets/bulk', operation)
+    return response.data
+  },
+
+  claimNext: async (): Promise<Ticket> => {
+    const response = await client.post<Ticket>('/tickets/queue/claim')
+    return response.data
+  },
+
   addComment: async (id: number, content: string, isInternal: boolean = false): Promise<TicketComment> => {
     const response = await client.post<TicketComment>(`/tickets/${id}/comments`, {
       content,
@@ -263,6 +362,15 @@ export const ticketsApi = {
     return response.data
   },
 
+  // Pass the returned next_cursor back as `cursor` to load older entries
+  timeline: async (
+    id: number,
+    params?: { limit?: number; cursor?: string; order?: 'asc' | 'desc' },
+  ): Promise<TicketTimeline> => {
+    const response = await client.get<TicketTimeline>(`/tickets/${id}/timeline`, { params })
+    return response.data
+  },
+
   getHistory: async (id: number): Promise<TicketHistory[]> => {
     const response = await client.get<TicketHistory[]>(`/tickets/${id}/history`)
     return response.data
@@ -340,10 +448,93 @@ export const ticketsApi = {
     return response.data
   },
 
+  // Direct URL for <video>/<audio>, which cannot send the auth header; the
+  // browser then streams and seeks with range requests instead of one big fetch.
+  // Carries a short-lived token valid for this download only, never the access token
+  attachmentUrl: async (ticketId: number, attachmentId: number): Promise<string> => {
+    const response = await client.post<{ token: string; expires_at: string }>(
+      `/tickets/${ticketId}/attachments/${attachmentId}/download-token`
+    )
+    return `${client.defaults.baseURL}/tickets/${ticketId}/attachments/${attachmentId}/download?token=${encodeURIComponent(response.data.token)}`
+  },
+
   deleteAttachment: async (ticketId: number, attachmentId: number): Promise<void> => {
     await client.delete(`/tickets/${ticketId}/attachments/${attachmentId}`)
   },
 
+  // Resumable uploads for large attachments
+  createAttachmentUpload: async (ticketId: number, file: File): Promise<TicketAttachmentUpload> => {
+    const response = await client.post<TicketAttachmentUpload>(`/tickets/${ticketId}/attachments/uploads`, {
+      filename: file.name,
+      total_size: file.size,
+      mime_type: file.type || null,
+    })
+    return response.data
+  },
+
+  getAttachmentUpload: async (ticketId: number, uploadId: number): Promise<TicketAttachmentUpload> => {
+    const response = await client.get<TicketAttachmentUpload>(`/tickets/${ticketId}/attachments/uploads/${uploadId}`)
+    return response.data
+  },
+
+  uploadAttachmentChunk: async (
+    ticketId: number,
+    uploadId: number,
+    offset: number,
+    chunk: Blob,
+  ): Promise<TicketAttachmentUpload> => {
+    const response = await client.put<TicketAttachmentUpload>(
+      `/tickets/${ticketId}/attachments/uploads/${uploadId}`,
+      chunk,
+      {
+        params: { offset },
+        headers: { 'Content-Type': 'application/octet-stream' },
+      },
+    )
+    return response.data
+  },
+
+  completeAttachmentUpload: async (ticketId: number, uploadId: number): Promise<TicketAttachment> => {
+    const response = await client.post<TicketAttachment>(
+      `/tickets/${ticketId}/attachments/uploads/${uploadId}/complete`,
+      {},
+    )
+    return response.data
+  },
+
+  cancelAttachmentUpload: async (ticketId: number, uploadId: number): Promise<void> => {
+    await client.delete(`/tickets/${ticketId}/attachments/uploads/${uploadId}`)
+  },
+
+  // Sends the file in chunks; after a failed chunk, asks the server for the
+  // received offset and continues from there instead of starting over
+  uploadAttachmentResumable: async (
+    ticketId: number,
+    file: File,
+    onProgress?: (sent: number, total: number) => void,
+    chunkSize: number = 8 * 1024 * 1024,
+    maxRetries: number = 5,
+  ): Promise<TicketAttachment> => {
+    const upload = await ticketsApi.createAttachmentUpload(ticketId, file)
+    let offset = upload.offset
+    let retries = 0
+
+    while (offset < file.size) {
+      try {
+        const chunk = file.slice(offset, offset + chunkSize)
+        offset = (await ticketsApi.uploadAttachmentChunk(ticketId, upload.id, offset, chunk)).offset
+        retries = 0
+        onProgress?.(offset, file.size)
+      } catch (error) {
+        if (++retries > maxRetries) throw error
+        await new Promise((resolve) => setTimeout(resolve, 1000 * retries))
+        offset = (await ticketsApi.getAttachmentUpload(ticketId, upload.id)).offset
+      }
+    }
+
+    return ticketsApi.completeAttachmentUpload(ticketId, upload.id)
+  },
+
   export: async (params?: any): Promise<Blob> => {
     const response = await client.get('/tickets/export', {
       params,
@@ -351,4 +542,40 @@ export const ticketsApi = {
     })
     return response.data
   },
+
+  createExportJob: async (params?: any, fileFormat: 'xlsx' | 'csv' = 'xlsx'): Promise<ExportJob> => {
+    const response = await client.post<ExportJob>('/tickets/exports', { ...params, file_format: fileFormat })
+    return response.data
+  },
+
+  getExportJob: async (jobId: number): Promise<ExportJob> => {
+    const response = await client.get<ExportJob>(`/tickets/exports/${jobId}`)
+    return response.data
+  },
+
+  downloadExportJob: async (jobId: number): Promise<Blob> => {
+    const response = await client.get(`/tickets/exports/${jobId}/download`, {
+      responseType: 'blob',
+    })
+    return response.data
+  },
+
+  // Runs the export on the background worker and resolves with the file once it is ready
+  exportInBackground: async (
+    params?: any,
+    onProgress?: (job: ExportJob) => void,
+    fileFormat: 'xlsx' | 'csv' = 'xlsx',
+  ): Promise<Blob> => {
+    let job = await ticketsApi.createExportJob(params, fileFormat)
+    while (job.status === 'pending' || job.status === 'running') {
+      onProgress?.(job)
+      await new Promise((resolve) => setTimeout(resolve, 1000))
+      job = await ticketsApi.getExportJob(job.id)
+    }
+    if (job.status !== 'completed') {
+      throw new Error(job.error || 'Export failed')
+    }
+    onProgress?.(job)
+    return ticketsApi.downloadExportJob(job.id)
+  },
 }
@@ -30,6 +30,7 @@ export interface UserListParams {
   department_id?: number
   role_id?: number
   lang?: string
+  fields?: string  // comma-separated item fields, e.g. 'id,first_name,last_name'
 }
 
 export interface CreateUserData {
@@ -34,6 +34,7 @@ import {
 } from '@ant-design/icons'
 import { useAuthStore } from '../../store/authStore'
 import { notificationsApi, Notification as NotificationType } from '../../api/notifications'
+import { useServerEvents } from '../../hooks/useServerEvents'
 import dayjs from 'dayjs'
 import relativeTime from 'dayjs/plugin/relativeTime'
 import 'dayjs/locale/uk'
@@ -80,30 +81,34 @@ export default function MainLayout({ children }: MainLayoutProps) {
     }
   }, [i18n])
 
-  // Fetch notification count periodically
-  useEffect(() => {
-    const fetchCount = async () => {
-      try {
-        const count = await notificationsApi.getCount()
-        const newUnreadCount = count.unread
+  const fetchCount = async () => {
+    try {
+      const count = await notificationsApi.getCount()
+      const newUnreadCount = count.unread
 
-        // Sound disabled
-        // if (!isFirstLoadRef.current && newUnreadCount > prevUnreadCountRef.current) {
-        //   playNotificationSound()
-        // }
+      // Sound disabled
+      // if (!isFirstLoadRef.current && newUnreadCount > prevUnreadCountRef.current) {
+      //   playNotificationSound()
+      // }
 
-        prevUnreadCountRef.current = newUnreadCount
-        isFirstLoadRef.current = false
-        setUnreadCount(newUnreadCount)
-      } catch (error) {
-        console.error('Failed to fetch notifications count:', error)
-      }
+      prevUnreadCountRef.current = newUnreadCount
+      isFirstLoadRef.current = false
+      setUnreadCount(newUnreadCount)
+    } catch (error) {
+      console.error('Failed to fetch notifications count:', error)
     }
+  }
+
+  // Refresh the badge when the server pushes a new notification
+  const streamConnected = useServerEvents(['notification.created'], () => fetchCount())
 
+  // Fetch notification count; poll only while the event stream is down
+  useEffect(() => {
     fetchCount()
+    if (streamConnected) return
     const interval = setInterval(fetchCount, 5000) // Every 5 seconds
     return () => clearInterval(interval)
-  }, [])
+  }, [streamConnected])
 
   const fetchNotifications = async () => {
     try {
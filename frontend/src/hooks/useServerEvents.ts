@@ -0,0 +1,39 @@
+import { useEffect, useRef, useState } from 'react'
+import { eventsApi, ServerEvent } from '../api/events'
+
+/**
+ * Calls `handler` (debounced) whenever one of `types` is pushed by the server.
+ * Returns whether the event stream is connected, so callers can fall back to
+ * polling only while it is down.
+ */
+export function useServerEvents(
+  types: string[],
+  handler: (event: ServerEvent) => void,
+  debounceMs: number = 300,
+): boolean {
+  const [connected, setConnected] = useState(eventsApi.isConnected())
+  const handlerRef = useRef(handler)
+  handlerRef.current = handler
+  const typesKey = types.join(',')
+
+  useEffect(() => {
+    let timer: ReturnType<typeof setTimeout> | null = null
+    const wanted = new Set(typesKey.split(','))
+
+    const unsubscribe = eventsApi.subscribe((event) => {
+      if (!wanted.has(event.type)) return
+      if (timer) clearTimeout(timer)
+      timer = setTimeout(() => handlerRef.current(event), debounceMs)
+    })
+    const unsubscribeStatus = eventsApi.onStatusChange(setConnected)
+    setConnected(eventsApi.isConnected())
+
+    return () => {
+      if (timer) clearTimeout(timer)
+      unsubscribe()
+      unsubscribeStatus()
+    }
+  }, [typesKey, debounceMs])
+
+  return connected
+}
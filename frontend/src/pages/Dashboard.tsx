@@ -13,6 +13,8 @@ import {
 import client from '../api/client'
 import { ticketsApi, Ticket } from '../api/tickets'
 import { useAuthStore } from '../store/authStore'
+import { TICKET_EVENT_TYPES } from '../api/events'
+import { useServerEvents } from '../hooks/useServerEvents'
 import dayjs from 'dayjs'
 
 const { Title } = Typography
@@ -64,12 +66,16 @@ export default function Dashboard() {
     }
   }
 
+  // Refresh when the server pushes a ticket change
+  const streamConnected = useServerEvents(TICKET_EVENT_TYPES, () => fetchData())
+
   useEffect(() => {
     fetchData()
-    // Auto-refresh every 2 seconds for near real-time updates
+    // Fall back to polling only while the event stream is down
+    if (streamConnected) return
     const interval = setInterval(fetchData, 2000)
     return () => clearInterval(interval)
-  }, [user])
+  }, [user, streamConnected])
 
   const priorityColors: Record<string, string> = {
     low: '#52c41a',
@@ -36,6 +36,8 @@ import { departmentsApi, Department } from '../../api/departments'
 import { operatorsApi, Operator } from '../../api/operators'
 import { incidentTypesApi, IncidentType } from '../../api/incidentTypes'
 import { useAuthStore } from '../../store/authStore'
+import { TICKET_EVENT_TYPES } from '../../api/events'
+import { useServerEvents } from '../../hooks/useServerEvents'
 import CreateTicketNew from './CreateTicketNew'
 import TicketDetail from './TicketDetail'
 import dayjs from 'dayjs'
@@ -85,6 +87,7 @@ export default function IncomingQueue() {
   const [filterIncidentTypes, setFilterIncidentTypes] = useState<IncidentType[]>([])
   const [createModalOpen, setCreateModalOpen] = useState(false)
   const [viewTicketId, setViewTicketId] = useState<number | null>(null)
+  const [claiming, setClaiming] = useState(false)
 
   // Browser back button closes ticket modal
   useEffect(() => {
@@ -241,18 +244,44 @@ export default function IncomingQueue() {
     } catch {}
   }
 
+  // Refresh when the server pushes a ticket change
+  const streamConnected = useServerEvents(TICKET_EVENT_TYPES, () => {
+    fetchTickets()
+    fetchDelegatedCount()
+  })
+
   useEffect(() => {
     fetchTickets()
     fetchDelegatedCount()
+    // Fall back to polling only while the event stream is down
+    if (streamConnected) return
     const interval = setInterval(() => { fetchTickets(); fetchDelegatedCount() }, 3000)
     return () => clearInterval(interval)
-  }, [page, activeTab, selectedDepartmentFilter, filters])
+  }, [page, activeTab, selectedDepartmentFilter, filters, streamConnected])
 
   const handleResetFilters = () => {
     setFilters({})
     setPage(1)
   }
 
+  const handleClaimNext = async () => {
+    try {
+      setClaiming(true)
+      const ticket = await ticketsApi.claimNext()
+      message.success(t('messages.claimed', { number: ticket.ticket_number }))
+      setViewTicketId(ticket.id)
+      fetchTickets()
+    } catch (error: any) {
+      if (error.response?.status === 404) {
+        message.info(t('messages.queueEmpty'))
+      } else {
+        message.error(t('messages.assignError'))
+      }
+    } finally {
+      setClaiming(false)
+    }
+  }
+
   const handleExport = async () => {
     try {
       setLoading(true)
@@ -266,7 +295,7 @@ export default function IncomingQueue() {
         operator_id: filters.operator_id,
         search: filters.search,
       }
-      const blob = await ticketsApi.export(exportParams)
+      const blob = await ticketsApi.exportInBackground(exportParams)
       const url = window.URL.createObjectURL(blob)
       const link = document.createElement('a')
       link.href = url
@@ -417,6 +446,15 @@ export default function IncomingQueue() {
         </Col>
         <Col>
           <Space>
+            {hasPermission('tickets.assign') && currentUser?.department_id && (
+              <Button
+                icon={<UserAddOutlined />}
+                onClick={handleClaimNext}
+                loading={claiming}
+              >
+                {t('claimNext')}
+              </Button>
+            )}
             {hasPermission('tickets.create') && (
               <Button
                 type="primary"
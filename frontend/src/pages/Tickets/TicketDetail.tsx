@@ -179,7 +179,13 @@ export default function TicketDetail({ ticketId: propTicketId, isModal = false,
   const loadAttachmentUrls = async (attachmentsList: TicketAttachment[], ticketId: number) => {
     const urls: Record<number, string> = {}
     for (const att of attachmentsList) {
-      if (att.mime_type.startsWith('image/') || att.mime_type.startsWith('video/')) {
+      if (att.mime_type.startsWith('video/')) {
+        try {
+          urls[att.id] = await ticketsApi.attachmentUrl(ticketId, att.id)
+        } catch (e) {
+          console.error('Failed to load attachment preview:', e)
+        }
+      } else if (att.mime_type.startsWith('image/')) {
         try {
           const blob = await ticketsApi.downloadAttachment(ticketId, att.id)
           urls[att.id] = URL.createObjectURL(blob)
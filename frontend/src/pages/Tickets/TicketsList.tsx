@@ -20,6 +20,8 @@ import { usersApi, User } from '../../api/users'
 import { departmentsApi, Department } from '../../api/departments'
 import { incidentTypesApi, IncidentType } from '../../api/incidentTypes'
 import { useAuthStore } from '../../store/authStore'
+import { TICKET_EVENT_TYPES } from '../../api/events'
+import { useServerEvents } from '../../hooks/useServerEvents'
 import CreateTicketNew from './CreateTicketNew'
 import TicketDetail from './TicketDetail'
 import dayjs from 'dayjs'
@@ -122,14 +124,18 @@ export default function TicketsList() {
     }
   }
 
+  // Refresh when the server pushes a ticket change
+  const streamConnected = useServerEvents(TICKET_EVENT_TYPES, () => fetchTickets(filters))
+
   useEffect(() => {
     fetchTickets(filters)
-    // Auto-refresh every 2 seconds for near real-time updates
+    // Fall back to polling only while the event stream is down
+    if (streamConnected) return
     const interval = setInterval(() => {
       fetchTickets(filters)
     }, 2000)
     return () => clearInterval(interval)
-  }, [page, filters])
+  }, [page, filters, streamConnected])
 
   const priorityColors: Record<string, string> = {
     low: '#52c41a',
@@ -165,7 +171,7 @@ export default function TicketsList() {
         search: filters.search,
       }
       
-      const blob = await ticketsApi.export(exportParams)
+      const blob = await ticketsApi.exportInBackground(exportParams)
       
       // Create download link
       const url = window.URL.createObjectURL(blob)